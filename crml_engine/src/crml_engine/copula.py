@@ -6,20 +6,79 @@ The engine-independent *specification* lives in `crml_lang`.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional
 
 import numpy as np
 
 
-def gaussian_copula_uniforms(
+@lru_cache(maxsize=64)
+def _cholesky_factor(corr_bytes: bytes, dim: int, jitter: float, max_tries: int) -> Optional[np.ndarray]:
+    """Lower Cholesky factor of a correlation matrix, cached by its contents.
+
+    Portfolio runs factorize the same correlation matrix on every call, so the
+    factor is keyed on the raw float64 bytes. Returns None if the matrix is not
+    PSD even after jitter escalation. The returned array is read-only.
+    """
+    cov = np.frombuffer(corr_bytes, dtype=np.float64).reshape(dim, dim).copy()
+    for k in range(max_tries):
+        try:
+            L = np.linalg.cholesky(cov)
+        except np.linalg.LinAlgError:
+            cov = cov + np.eye(dim) * (jitter * (10**k))
+            continue
+        L.setflags(write=False)
+        return L
+    return None
+
+
+def _sobol_normals(n: int, dim: int, *, rng: np.random.Generator, dtype=np.float64) -> np.ndarray:
+    """Standard normal variates from a scrambled Sobol sequence.
+
+    Draws the smallest power-of-two Sobol block covering `n` points (keeping
+    the sequence's balance properties) and returns its first `n` rows.
+    """
+    from scipy.special import ndtri
+    from scipy.stats import qmc
+
+    try:
+        sampler = qmc.Sobol(d=dim, scramble=True, rng=rng)
+    except TypeError:  # SciPy < 1.15
+        sampler = qmc.Sobol(d=dim, scramble=True, seed=rng)
+
+    m = max(0, int(np.ceil(np.log2(max(n, 1)))))
+    u = sampler.random_base2(m)[:n].astype(dtype, copy=False)
+    eps = np.finfo(dtype).eps
+    return ndtri(np.clip(u, eps, 1.0 - eps))
+
+
+def _normal_quantiles(p: np.ndarray) -> np.ndarray:
+    """Standard normal quantiles of `p`, with 0 -> -inf and 1 -> +inf."""
+    try:
+        from scipy.special import ndtri
+
+        return ndtri(p)
+    except Exception:
+        from statistics import NormalDist
+
+        nd = NormalDist()
+        return np.array(
+            [-np.inf if v <= 0.0 else np.inf if v >= 1.0 else nd.inv_cdf(float(v)) for v in p],
+            dtype=np.float64,
+        )
+
+
+def gaussian_copula_normals(
     corr: np.ndarray,
     n: int,
     *,
     seed: Optional[int] = None,
     jitter: float = 1e-10,
     max_tries: int = 6,
+    quasi_mc: bool = False,
+    dtype=np.float64,
 ) -> np.ndarray:
-    """Sample correlated uniforms using a Gaussian copula.
+    """Sample correlated standard normals (the latent layer of a Gaussian copula).
 
     Args:
         corr: Correlation matrix (dim x dim).
@@ -27,9 +86,16 @@ def gaussian_copula_uniforms(
         seed: Optional RNG seed.
         jitter: Diagonal jitter added if Cholesky fails.
         max_tries: Number of jitter escalation attempts.
+        quasi_mc: If True, drive the copula with scrambled Sobol points
+            (mapped to normals via the inverse normal CDF) instead of i.i.d.
+            normals. Estimates converge close to O(1/n) rather than
+            O(1/sqrt(n)), so far fewer samples are needed for a given accuracy.
+        dtype: Floating dtype of the sampled normals (np.float64 or
+            np.float32). float32 halves memory traffic and is ample when the
+            samples are only compared against thresholds.
 
     Returns:
-        Array of shape (n, dim) with values in (0, 1).
+        Array of shape (n, dim) with marginally standard normal columns.
 
     Raises:
         ValueError: if the correlation matrix cannot be factorized.
@@ -43,35 +109,126 @@ def gaussian_copula_uniforms(
     if dim < 1:
         raise ValueError("corr dimension must be >= 1")
 
+    dtype = np.dtype(dtype)
+    if dtype not in (np.dtype(np.float64), np.dtype(np.float32)):
+        raise ValueError("dtype must be float64 or float32")
+
     rng = np.random.default_rng(seed)
 
     # Factorize correlation matrix. If numerical issues occur, add small jitter.
-    cov = corr.copy()
-    L = None
-    for k in range(max_tries):
-        try:
-            L = np.linalg.cholesky(cov)
-            break
-        except np.linalg.LinAlgError:
-            cov = cov + np.eye(dim) * (jitter * (10**k))
-
+    L = _cholesky_factor(np.ascontiguousarray(corr).tobytes(), dim, float(jitter), int(max_tries))
     if L is None:
         raise ValueError("Correlation matrix is not PSD (Cholesky failed)")
 
-    z = rng.standard_normal(size=(n, dim))
-    x = z @ L.T
+    if quasi_mc:
+        z = _sobol_normals(n, dim, rng=rng, dtype=dtype)
+    else:
+        z = rng.standard_normal(size=(n, dim), dtype=dtype)
+    return z @ L.T.astype(dtype, copy=False)
+
+
+def gaussian_copula_uniforms(
+    corr: np.ndarray,
+    n: int,
+    *,
+    seed: Optional[int] = None,
+    jitter: float = 1e-10,
+    max_tries: int = 6,
+    quasi_mc: bool = False,
+    dtype=np.float64,
+) -> np.ndarray:
+    """Sample correlated uniforms using a Gaussian copula.
+
+    Args:
+        corr: Correlation matrix (dim x dim).
+        n: Number of samples (rows).
+        seed: Optional RNG seed.
+        jitter: Diagonal jitter added if Cholesky fails.
+        max_tries: Number of jitter escalation attempts.
+        quasi_mc: Use scrambled Sobol points (see `gaussian_copula_normals`).
+        dtype: Floating dtype of the sampled normals and returned uniforms
+            (np.float64 or np.float32).
+
+    Returns:
+        Array of shape (n, dim) with values in (0, 1).
+
+    Raises:
+        ValueError: if the correlation matrix cannot be factorized.
+    """
+    x = gaussian_copula_normals(
+        corr,
+        n,
+        seed=seed,
+        jitter=jitter,
+        max_tries=max_tries,
+        quasi_mc=quasi_mc,
+        dtype=dtype,
+    )
+    dtype = x.dtype
 
     # Convert to uniforms via standard normal CDF.
-    # Prefer SciPy if available; else use erf-based approximation.
+    # Prefer SciPy's ufunc if available; else use erf-based approximation.
     try:
-        from scipy.stats import norm
+        from scipy.special import ndtr
 
-        u = norm.cdf(x)
+        u = ndtr(x)
     except Exception:
         from math import erf, sqrt
 
-        u = 0.5 * (1.0 + np.vectorize(erf)(x / sqrt(2.0)))
+        u = (0.5 * (1.0 + np.vectorize(erf)(x / sqrt(2.0)))).astype(dtype, copy=False)
 
     # Avoid exact 0/1 due to numerical extremes.
-    eps = np.finfo(np.float64).eps
+    eps = np.finfo(dtype).eps
     return np.clip(u, eps, 1.0 - eps)
+
+
+def gaussian_copula_bernoulli(
+    corr: np.ndarray,
+    n: int,
+    probabilities,
+    *,
+    seed: Optional[int] = None,
+    jitter: float = 1e-10,
+    max_tries: int = 6,
+    quasi_mc: bool = False,
+    dtype=np.float64,
+) -> np.ndarray:
+    """Sample correlated Bernoulli indicators using a Gaussian copula.
+
+    Column `i` is 1 where `U_i <= probabilities[i]`. Since the normal CDF is
+    monotone this is evaluated as `Z_i <= ndtri(probabilities[i])` on the
+    latent normals, so no uniform array is materialized.
+
+    Args:
+        corr: Correlation matrix (dim x dim).
+        n: Number of samples (rows).
+        probabilities: Per-column success probabilities (length dim).
+        seed: Optional RNG seed.
+        jitter: Diagonal jitter added if Cholesky fails.
+        max_tries: Number of jitter escalation attempts.
+        quasi_mc: Use scrambled Sobol points (see `gaussian_copula_normals`).
+        dtype: Floating dtype of the latent normals.
+
+    Returns:
+        Boolean array of shape (n, dim).
+
+    Raises:
+        ValueError: if the correlation matrix cannot be factorized or
+            `probabilities` does not match its dimension.
+    """
+    p = np.asarray(probabilities, dtype=np.float64).reshape(-1)
+    corr = np.asarray(corr, dtype=np.float64)
+    if corr.ndim != 2 or p.shape[0] != corr.shape[0]:
+        raise ValueError("probabilities must have one entry per corr dimension")
+
+    x = gaussian_copula_normals(
+        corr,
+        n,
+        seed=seed,
+        jitter=jitter,
+        max_tries=max_tries,
+        quasi_mc=quasi_mc,
+        dtype=dtype,
+    )
+    thresholds = _normal_quantiles(np.clip(p, 0.0, 1.0)).astype(x.dtype)
+    return x <= thresholds
@@ -1,6 +1,7 @@
-import yaml
 import sys
 
+from crml_lang.yamlio import load_yaml_from_str
+
 def explain_crml(file_path):
     """Parse a CRML scenario file and print a human-readable summary.
 
@@ -18,7 +19,7 @@ def explain_crml(file_path):
     """
     try:
         with open(file_path, 'r') as f:
-            data = yaml.safe_load(f)
+            data = load_yaml_from_str(f.read())
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
         return False
@@ -9,9 +9,10 @@ from __future__ import annotations
 
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Optional
 
-import yaml
+from crml_lang.yamlio import load_yaml_from_str
 from jsonschema import Draft202012Validator
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -47,6 +48,13 @@ def get_default_fx_config() -> FXConfig:
         rates=DEFAULT_FX_RATES
     )
 
+@lru_cache(maxsize=1)
+def _fx_schema_validator() -> Draft202012Validator:
+    """Build the FX config schema validator once per process."""
+    with open(FX_SCHEMA_PATH, 'r', encoding='utf-8') as f:
+        return Draft202012Validator(json.load(f))
+
+
 def load_fx_config(fx_config_path: Optional[str] = None) -> 'FXConfig':
     """Load an FX configuration document.
 
@@ -66,16 +74,13 @@ def load_fx_config(fx_config_path: Optional[str] = None) -> 'FXConfig':
         return default_config
     try:
         with open(fx_config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = load_yaml_from_str(f.read())
 
         if not isinstance(config, dict):
             raise ValueError("FX config must be a YAML mapping/object")
 
         # Validate schema/version (reject unknown/absent identifier).
-        with open(FX_SCHEMA_PATH, 'r', encoding='utf-8') as f:
-            schema = json.load(f)
-        validator = Draft202012Validator(schema)
-        errors = sorted(validator.iter_errors(config), key=lambda e: list(e.path))
+        errors = sorted(_fx_schema_validator().iter_errors(config), key=lambda e: list(e.path))
         if errors:
             first = errors[0]
             path = " -> ".join(map(str, first.path)) if first.path else "(root)"
@@ -199,8 +204,7 @@ def normalize_fx_config(fx_config: Optional[dict or FXConfig]) -> FXConfig:
             fx_config.rates = DEFAULT_FX_RATES
         return fx_config
     if isinstance(fx_config, dict):
-        fx_config = dict(fx_config)  # copy
-        if 'rates' not in fx_config or not isinstance(fx_config['rates'], dict):
-            fx_config['rates'] = DEFAULT_FX_RATES
-        return FXConfig(**fx_config)
+        if not isinstance(fx_config.get('rates'), dict):
+            fx_config = {**fx_config, 'rates': DEFAULT_FX_RATES}
+        return FXConfig.model_validate(fx_config)
     raise ValueError("fx_config must be None, dict, or FXConfig")
\ No newline at end of file
@@ -3,9 +3,12 @@ from __future__ import annotations
 from typing import Any, Literal, Optional
 import os
 
+import numpy as np
 from pydantic import BaseModel, Field
 
+from crml_lang.api import CRScenario as _CachedCRScenario
 from crml_lang.models.portfolio_bundle import CRPortfolioBundle
+from crml_lang.yamlio import load_yaml_from_str, load_yaml_mapping_from_path
 from crml_lang.models.portfolio_model import CRPortfolio, Portfolio, ScenarioRef
 from crml_lang.models.scenario_model import CRScenario, ScenarioControl as ScenarioControlModel
 from crml_lang.models.assessment_model import CRAssessment, Assessment
@@ -49,6 +52,7 @@ class PlanMessage(BaseModel):
     level: Literal["error", "warning"] = Field(..., description="Message severity level.")
     path: str = Field(..., description="Logical document path where the issue occurred.")
     message: str = Field(..., description="Human-readable message.")
+    code: Optional[str] = Field(None, description="Stable machine-readable identifier for the check, if any.")
 
 
 class ResolvedScenarioControl(BaseModel):
@@ -189,8 +193,9 @@ def _toeplitz_corr(dim: int, rho: float) -> list[list[float]]:
     Returns:
         A `dim x dim` nested list of floats.
     """
-    r = float(rho)
-    return [[(r ** abs(i - j)) for j in range(dim)] for i in range(dim)]
+    idx = np.arange(dim)
+    lags = np.abs(idx[:, None] - idx[None, :])
+    return np.power(float(rho), lags).tolist()
 
 
 def _validate_corr_matrix_shape(matrix: list[list[float]], dim: int) -> Optional[str]:
@@ -247,12 +252,38 @@ def _validate_corr_matrix_symmetry(matrix: list[list[float]], dim: int) -> Optio
     return None
 
 
+def _corr_matrix_is_valid(matrix: list[list[float]]) -> bool:
+    """Vectorized check that a square matrix passes the entry and symmetry rules.
+
+    Uses the same comparisons as the element-wise validators, so a True result
+    means they would report no error.
+    """
+    try:
+        arr = np.asarray(matrix, dtype=np.float64)
+    except (TypeError, ValueError):
+        return False
+    if np.isnan(arr).any():
+        # None converts to NaN; let the element-wise checks decide.
+        return False
+    diag = np.diagonal(arr)
+    if np.any(np.abs(diag - 1.0) > 1e-9):
+        return False
+    if np.any((arr < -1.0) | (arr > 1.0)):
+        return False
+    return not np.any(np.abs(arr - arr.T) > 1e-9)
+
+
 def _validate_corr_matrix(matrix: list[list[float]], dim: int) -> Optional[str]:
     """Validate correlation matrix shape, entries, and symmetry."""
     shape_error = _validate_corr_matrix_shape(matrix, dim)
     if shape_error:
         return shape_error
 
+    # Fast path for valid matrices; the element-wise checks below only run to
+    # locate and describe the first violation.
+    if _corr_matrix_is_valid(matrix):
+        return None
+
     entries_error = _validate_corr_matrix_entries(matrix)
     if entries_error:
         return entries_error
@@ -282,17 +313,7 @@ def _load_yaml_file(path: str) -> dict[str, Any]:
         ImportError: If PyYAML is not installed.
         ValueError: If the YAML document's top-level is not a mapping.
     """
-    try:
-        import yaml
-    except Exception as e:
-        raise ImportError("PyYAML is required: pip install pyyaml") from e
-
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-
-    if not isinstance(data, dict):
-        raise ValueError("YAML document must be a mapping/object at top-level")
-    return data
+    return load_yaml_mapping_from_path(path)
 
 
 def _resolve_path(base_dir: str | None, p: str) -> str:
@@ -358,6 +379,79 @@ def _scenario_control_from_dict(
     return (cid, eff_f)
 
 
+# (implementation_effectiveness, coverage_value, coverage_basis, reliability, affects)
+_InventoryValues = tuple[Optional[float], Optional[float], Optional[str], Optional[float], Optional[str]]
+
+_NO_INVENTORY: _InventoryValues = (None, None, None, None, None)
+
+
+def _inventory_values_from_control(inv: Any) -> _InventoryValues:
+    """Extract inventory values from a portfolio.controls entry."""
+    eff = float(inv.implementation_effectiveness) if inv.implementation_effectiveness is not None else None
+    cov_val: Optional[float] = None
+    cov_basis: Optional[str] = None
+    if inv.coverage is not None:
+        cov_val = float(inv.coverage.value)
+        cov_basis = str(inv.coverage.basis)
+    rel = getattr(inv, "reliability", None)
+    affects = getattr(inv, "affects", None)
+    return (
+        eff,
+        cov_val,
+        cov_basis,
+        float(rel) if rel is not None else None,
+        str(affects) if affects is not None else None,
+    )
+
+
+def _inventory_values_from_assessment(assess: Any) -> _InventoryValues:
+    """Extract inventory values from an assessment entry (SCF CMM level wins over effectiveness)."""
+    eff: Optional[float] = None
+    if getattr(assess, "scf_cmm_level", None) is not None:
+        eff = _scf_cmm_level_to_effectiveness(int(assess.scf_cmm_level))
+    elif getattr(assess, "implementation_effectiveness", None) is not None:
+        eff = float(assess.implementation_effectiveness)
+
+    cov_val: Optional[float] = None
+    cov_basis: Optional[str] = None
+    if getattr(assess, "coverage", None) is not None:
+        cov_val = float(assess.coverage.value)
+        cov_basis = str(assess.coverage.basis)
+    rel = getattr(assess, "reliability", None)
+    affects = getattr(assess, "affects", None)
+    return (
+        eff,
+        cov_val,
+        cov_basis,
+        float(rel) if rel is not None else None,
+        str(affects) if affects is not None else None,
+    )
+
+
+def _lookup_inventory(
+    cid: str,
+    *,
+    portfolio_controls_by_id: dict[str, Any],
+    assessment_by_id: dict[str, Assessment],
+    cache: dict[str, _InventoryValues],
+) -> _InventoryValues:
+    """Resolve inventory values for a control id, memoized in `cache`.
+
+    portfolio.controls takes precedence over assessment catalogs. Controls shared
+    by many scenarios are resolved once per plan.
+    """
+    values = cache.get(cid)
+    if values is None:
+        inv = portfolio_controls_by_id.get(cid)
+        if inv is not None:
+            values = _inventory_values_from_control(inv)
+        else:
+            assess = assessment_by_id.get(cid)
+            values = _inventory_values_from_assessment(assess) if assess is not None else _NO_INVENTORY
+        cache[cid] = values
+    return values
+
+
 def _clamp01(x: float) -> float:
     """Clamp a numeric value into the inclusive range [0, 1]."""
     return max(0.0, min(1.0, float(x)))
@@ -399,11 +493,7 @@ def plan_portfolio(  # NOSONAR
             return PlanReport(ok=False, errors=[PlanMessage(level="error", path="(io)", message=str(e))])
     elif source_kind == "yaml":
         assert isinstance(source, str)
-        try:
-            import yaml
-        except Exception as e:
-            raise ImportError("PyYAML is required: pip install pyyaml") from e
-        loaded = yaml.safe_load(source)
+        loaded = load_yaml_from_str(source)
         if not isinstance(loaded, dict):
             return PlanReport(ok=False, errors=[PlanMessage(level="error", path="(root)", message="YAML must be a mapping")])
         data = loaded
@@ -419,6 +509,7 @@ def plan_portfolio(  # NOSONAR
     portfolio: Portfolio = doc.portfolio
 
     assets_by_name: dict[str, Any] = {a.name: a for a in portfolio.assets}
+    cardinality_by_name: dict[str, int] = {a.name: int(a.cardinality) for a in portfolio.assets}
 
     # --- Load catalogs (optional) ---
     catalog_ids: set[str] = set()
@@ -467,6 +558,8 @@ def plan_portfolio(  # NOSONAR
 
     # --- Build portfolio inventory (highest precedence) ---
     portfolio_controls_by_id: dict[str, Any] = {}
+    # Resolved inventory values per control id, filled lazily while planning scenarios.
+    inventory_by_id: dict[str, _InventoryValues] = {}
     for idx, c in enumerate(portfolio.controls or []):
         portfolio_controls_by_id[c.id] = c
         if catalog_ids and c.id not in catalog_ids:
@@ -565,7 +658,8 @@ def plan_portfolio(  # NOSONAR
             continue
 
         try:
-            scenario_doc = CRScenario.model_validate(_load_yaml_file(scenario_path))
+            # Content-keyed cache shared with validate_portfolio's cross-document checks.
+            scenario_doc = _CachedCRScenario.load_from_yaml(scenario_path)
         except Exception as e:
             errors.append(
                 PlanMessage(
@@ -619,7 +713,7 @@ def plan_portfolio(  # NOSONAR
                     )
                 )
                 continue
-            cardinality = int(sum(int(assets_by_name[a].cardinality) for a in applies_to_assets_list))
+            cardinality = sum(cardinality_by_name[a] for a in applies_to_assets_list)
 
             # Heuristic: very large exposure counts often violate linear-scaling assumptions.
             if cardinality >= 100_000:
@@ -667,38 +761,12 @@ def plan_portfolio(  # NOSONAR
         resolved_controls: list[ResolvedScenarioControl] = []
 
         for (cid, scenario_eff_factor) in controls_norm:
-            inventory_eff: Optional[float] = None
-            inventory_cov_val: Optional[float] = None
-            inventory_cov_basis: Optional[str] = None
-            inventory_rel: Optional[float] = None
-            affects: Optional[str] = None
-
-            inv = portfolio_controls_by_id.get(cid)
-            if inv is not None:
-                if inv.implementation_effectiveness is not None:
-                    inventory_eff = float(inv.implementation_effectiveness)
-                if inv.coverage is not None:
-                    inventory_cov_val = float(inv.coverage.value)
-                    inventory_cov_basis = str(inv.coverage.basis)
-                if getattr(inv, "reliability", None) is not None:
-                    inventory_rel = float(inv.reliability)
-                if getattr(inv, "affects", None) is not None:
-                    affects = str(inv.affects)
-            else:
-                assess = assessment_by_id.get(cid)
-                if assess is not None:
-                    if getattr(assess, "scf_cmm_level", None) is not None:
-                        inventory_eff = _scf_cmm_level_to_effectiveness(int(assess.scf_cmm_level))
-                    elif getattr(assess, "implementation_effectiveness", None) is not None:
-                        inventory_eff = float(assess.implementation_effectiveness)
-
-                    if getattr(assess, "coverage", None) is not None:
-                        inventory_cov_val = float(assess.coverage.value)
-                        inventory_cov_basis = str(assess.coverage.basis)
-                    if getattr(assess, "reliability", None) is not None:
-                        inventory_rel = float(assess.reliability)
-                    if getattr(assess, "affects", None) is not None:
-                        affects = str(assess.affects)
+            inventory_eff, inventory_cov_val, inventory_cov_basis, inventory_rel, affects = _lookup_inventory(
+                cid,
+                portfolio_controls_by_id=portfolio_controls_by_id,
+                assessment_by_id=assessment_by_id,
+                cache=inventory_by_id,
+            )
 
             if inventory_eff is None and inventory_cov_val is None:
                 errors.append(
@@ -706,6 +774,7 @@ def plan_portfolio(  # NOSONAR
                         level="error",
                         path=f"portfolio.scenarios[{idx}].path",
                         message=f"Scenario references control id '{cid}' but no inventory/assessment data is available for it.",
+                        code="plan.control_without_inventory",
                     )
                 )
                 continue
@@ -792,6 +861,7 @@ def plan_bundle(bundle: CRPortfolioBundle) -> PlanReport:  # NOSONAR
     portfolio: Portfolio = doc.portfolio
 
     assets_by_name: dict[str, Any] = {a.name: a for a in portfolio.assets}
+    cardinality_by_name: dict[str, int] = {a.name: int(a.cardinality) for a in portfolio.assets}
 
     # --- Load cataloges from the bundle (optional) ---
     catalog_ids: set[str] = set()
@@ -821,6 +891,8 @@ def plan_bundle(bundle: CRPortfolioBundle) -> PlanReport:  # NOSONAR
 
     # --- Build portfolio inventory (highest precedence) ---
     portfolio_controls_by_id: dict[str, Any] = {}
+    # Resolved inventory values per control id, filled lazily while planning scenarios.
+    inventory_by_id: dict[str, _InventoryValues] = {}
     for idx, c in enumerate(portfolio.controls or []):
         portfolio_controls_by_id[c.id] = c
         if catalog_ids and c.id not in catalog_ids:
@@ -955,7 +1027,7 @@ def plan_bundle(bundle: CRPortfolioBundle) -> PlanReport:  # NOSONAR
                     )
                 )
                 continue
-            cardinality = int(sum(int(assets_by_name[a].cardinality) for a in applies_to_assets_list))
+            cardinality = sum(cardinality_by_name[a] for a in applies_to_assets_list)
         else:
             cardinality = 1
 
@@ -965,38 +1037,12 @@ def plan_bundle(bundle: CRPortfolioBundle) -> PlanReport:  # NOSONAR
         resolved_controls: list[ResolvedScenarioControl] = []
 
         for (cid, scenario_eff_factor) in controls_norm:
-            inventory_eff: Optional[float] = None
-            inventory_cov_val: Optional[float] = None
-            inventory_cov_basis: Optional[str] = None
-            inventory_rel: Optional[float] = None
-            affects: Optional[str] = None
-
-            inv = portfolio_controls_by_id.get(cid)
-            if inv is not None:
-                if inv.implementation_effectiveness is not None:
-                    inventory_eff = float(inv.implementation_effectiveness)
-                if inv.coverage is not None:
-                    inventory_cov_val = float(inv.coverage.value)
-                    inventory_cov_basis = str(inv.coverage.basis)
-                if getattr(inv, "reliability", None) is not None:
-                    inventory_rel = float(inv.reliability)
-                if getattr(inv, "affects", None) is not None:
-                    affects = str(inv.affects)
-            else:
-                assess = assessment_by_id.get(cid)
-                if assess is not None:
-                    if getattr(assess, "scf_cmm_level", None) is not None:
-                        inventory_eff = _scf_cmm_level_to_effectiveness(int(assess.scf_cmm_level))
-                    elif getattr(assess, "implementation_effectiveness", None) is not None:
-                        inventory_eff = float(assess.implementation_effectiveness)
-
-                    if getattr(assess, "coverage", None) is not None:
-                        inventory_cov_val = float(assess.coverage.value)
-                        inventory_cov_basis = str(assess.coverage.basis)
-                    if getattr(assess, "reliability", None) is not None:
-                        inventory_rel = float(assess.reliability)
-                    if getattr(assess, "affects", None) is not None:
-                        affects = str(assess.affects)
+            inventory_eff, inventory_cov_val, inventory_cov_basis, inventory_rel, affects = _lookup_inventory(
+                cid,
+                portfolio_controls_by_id=portfolio_controls_by_id,
+                assessment_by_id=assessment_by_id,
+                cache=inventory_by_id,
+            )
 
             if inventory_eff is None and inventory_cov_val is None:
                 errors.append(
@@ -1004,6 +1050,7 @@ def plan_bundle(bundle: CRPortfolioBundle) -> PlanReport:  # NOSONAR
                         level="error",
                         path=f"portfolio.scenarios[{idx}].id",
                         message=f"Scenario references control id '{cid}' but no inventory/assessment data is available for it.",
+                        code="plan.control_without_inventory",
                     )
                 )
                 continue
@@ -12,6 +12,7 @@ Portfolio planning/binding resolution lives in `crml_engine.pipeline`.
 """
 
 import json
+from functools import lru_cache
 from typing import Union, Optional
 
 import hashlib
@@ -59,9 +60,9 @@ from .models.fx_model import (
 )
 
 from .models.constants import DEFAULT_FX_RATES
-from .simulation.engine import run_monte_carlo
+from .simulation.engine import compute_loss_metrics, run_monte_carlo
 from .simulation.severity import SeverityEngine
-from .copula import gaussian_copula_uniforms
+from .copula import gaussian_copula_bernoulli
 
 
 LOSS_VAR_ID = "loss.var"
@@ -371,31 +372,51 @@ def _build_traceability(
     return trace
 
 
+@lru_cache(maxsize=64)
+def _parse_yaml_mapping_cached(text: str) -> dict | None:
+    """Parse YAML text into a root mapping, memoized on the text.
+
+    Repeated simulations of the same document (tests, batch runs, portfolios
+    re-running a scenario) skip re-parsing. The returned dict is shared
+    between callers and must be treated as read-only.
+    """
+    from crml_lang.yamlio import load_yaml_mapping_from_str
+
+    try:
+        return load_yaml_mapping_from_str(text)
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _parse_yaml_file_cached(path: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse a YAML file into a root mapping, memoized on path and stat info."""
+    try:
+        text = _load_text_file(path)
+    except Exception:
+        return None
+    return _parse_yaml_mapping_cached(text)
+
+
 def _load_yaml_root_for_routing(source: Union[str, dict]) -> dict | None:
     """Best-effort YAML load for routing.
 
-    Returns the parsed root mapping when possible, otherwise None.
+    Returns the parsed root mapping when possible, otherwise None. Parsed
+    documents are cached and must not be mutated.
     """
     if isinstance(source, dict):
         return source
     if not isinstance(source, str):
         return None
 
-    try:
-        import yaml as _yaml  # type: ignore
-    except Exception:
-        return None
-
     try:
         if os.path.isfile(source):
-            with open(source, "r", encoding="utf-8") as f:
-                loaded = _yaml.safe_load(f)
-        else:
-            loaded = _yaml.safe_load(source)
-    except Exception:
+            st = os.stat(source)
+            return _parse_yaml_file_cached(os.path.abspath(source), st.st_mtime_ns, st.st_size)
+    except OSError:
         return None
 
-    return loaded if isinstance(loaded, dict) else None
+    return _parse_yaml_mapping_cached(source)
 
 
 def _infer_source_kind(source: Union[str, dict]) -> str:
@@ -523,6 +544,8 @@ def _sample_control_state(
     corr: np.ndarray | None,
     n_runs: int,
     seed: int | None,
+    quasi_mc: bool = False,
+    copula_dtype=np.float64,
 ) -> dict[str, np.ndarray]:
     """Sample per-run binary control states.
 
@@ -537,6 +560,8 @@ def _sample_control_state(
         corr: Correlation matrix for the Gaussian copula (dim x dim).
         n_runs: Number of Monte Carlo runs.
         seed: Optional seed for reproducibility.
+        quasi_mc: Use scrambled Sobol points for the copula draw.
+        copula_dtype: Floating dtype used for the copula draw.
 
     Returns:
         Mapping control_id -> array of shape (n_runs,) with values {0.0, 1.0}.
@@ -546,10 +571,17 @@ def _sample_control_state(
     control_state: dict[str, np.ndarray] = {}
 
     if target_controls and corr is not None:
-        u = gaussian_copula_uniforms(corr=corr, n=n_runs, seed=seed)
+        reliabilities = [float(control_info.get(cid, {}).get("reliability", 1.0)) for cid in target_controls]
+        up = gaussian_copula_bernoulli(
+            corr=corr,
+            n=n_runs,
+            probabilities=reliabilities,
+            seed=seed,
+            quasi_mc=quasi_mc,
+            dtype=copula_dtype,
+        )
         for i, cid in enumerate(target_controls):
-            rel = float(control_info.get(cid, {}).get("reliability", 1.0))
-            control_state[cid] = (u[:, i] <= rel).astype(np.float64)
+            control_state[cid] = up[:, i].astype(np.float64)
         return control_state
 
     for cid, info in control_info.items():
@@ -685,9 +717,8 @@ def _run_single_portfolio_scenario(
     # Prefer inlined scenario docs (bundle mode) to avoid filesystem dependency.
     scenario_doc = getattr(sc, "scenario", None)
     if scenario_doc is not None:
-        # `run_monte_carlo` expects CRML-shaped keys (e.g. "lambda"), but Pydantic
-        # models dump field names by default (e.g. "lambda_"). Use aliases here.
-        scenario_input: object = scenario_doc.model_dump(exclude_none=True, by_alias=True)
+        # Already validated while bundling; share it instead of dumping and re-validating.
+        scenario_input: object = scenario_doc
     else:
         scenario_path = sc.resolved_path or sc.path
         if not scenario_path:
@@ -696,6 +727,7 @@ def _run_single_portfolio_scenario(
             scenario_input = _load_text_file(scenario_path)
         except Exception as e:
             raise ValueError(f"Failed to read scenario '{sc.id}': {e}") from e
+        scenario_input = _parse_yaml_mapping_cached(scenario_input) or scenario_input
 
     freq_mult, sev_mult = _control_multipliers_for_scenario(sc, control_state, n_runs)
 
@@ -757,22 +789,13 @@ def _compute_metrics_and_distribution(total: np.ndarray, *, bin_count: int = 50)
         elements for `Distribution.raw_data`.
     """
     total = np.asarray(total, dtype=np.float64)
-    metrics = Metrics(
-        eal=float(np.mean(total)),
-        var_95=float(np.percentile(total, 95)),
-        var_99=float(np.percentile(total, 99)),
-        var_999=float(np.percentile(total, 99.9)),
-        min=float(np.min(total)),
-        max=float(np.max(total)),
-        median=float(np.median(total)),
-        std_dev=float(np.std(total)),
-    )
+    metrics = compute_loss_metrics(total)
 
     hist, bin_edges = np.histogram(total, bins=bin_count)
     distribution = Distribution(
         bins=bin_edges.tolist(),
         frequencies=hist.tolist(),
-        raw_data=total.tolist()[:1000],
+        raw_data=total[:1000].tolist(),
     )
     return metrics, distribution
 
@@ -784,6 +807,8 @@ def run_portfolio_simulation(
     n_runs: int = 10000,
     seed: int | None = None,
     fx_config: Optional[FXConfig] = None,
+    quasi_mc: bool = False,
+    copula_dtype=np.float64,
 ) -> EngineSimulationResult:
     """Run a CRML portfolio simulation.
 
@@ -812,6 +837,12 @@ def run_portfolio_simulation(
         seed: Optional base seed. Used both for copula/control sampling and to
             derive scenario-specific seeds.
         fx_config: Optional FXConfig. If omitted, defaults are used.
+        quasi_mc: If True, the control-state Gaussian copula is driven by
+            scrambled Sobol points instead of i.i.d. normals (variance
+            reduction; useful for small `n_runs`).
+        copula_dtype: Floating dtype for the control-state copula draw
+            (np.float64 or np.float32). Control states only compare the
+            uniforms against reliabilities, so float32 is sufficient.
 
     Returns:
         A `SimulationResult` with metrics/distribution in the configured output
@@ -845,6 +876,8 @@ def run_portfolio_simulation(
         corr=corr,
         n_runs=n_runs,
         seed=seed,
+        quasi_mc=quasi_mc,
+        copula_dtype=copula_dtype,
     )
 
     try:
@@ -895,6 +928,8 @@ def run_portfolio_bundle_simulation(
     n_runs: int = 10000,
     seed: int | None = None,
     fx_config: Optional[FXConfig] = None,
+    quasi_mc: bool = False,
+    copula_dtype=np.float64,
 ) -> EngineSimulationResult:
     """Run a CRML portfolio bundle simulation.
 
@@ -911,6 +946,8 @@ def run_portfolio_bundle_simulation(
         n_runs: Number of Monte Carlo iterations.
         seed: Optional base seed.
         fx_config: Optional FXConfig.
+        quasi_mc: Use scrambled Sobol points for the control-state copula.
+        copula_dtype: Floating dtype for the control-state copula draw.
 
     Returns:
         A `SimulationResult` for the bundled portfolio.
@@ -952,6 +989,8 @@ def run_portfolio_bundle_simulation(
         corr=corr,
         n_runs=n_runs,
         seed=seed,
+        quasi_mc=quasi_mc,
+        copula_dtype=copula_dtype,
     )
 
     try:
@@ -1030,6 +1069,9 @@ def run_simulation(
         if routed is not None:
             return routed
 
+        # Reuse the parsed document instead of parsing the YAML a second time.
+        return run_monte_carlo(root, n_runs, seed, fx_config)
+
     return run_monte_carlo(yaml_content, n_runs, seed, fx_config)
 
 
@@ -1229,9 +1271,10 @@ def run_simulation_cli(file_path: str, n_runs: int = 10000, output_format: str =
     fx_config = load_fx_config(fx_config_path)
     # Detect portfolio vs scenario
     try:
-        import yaml
+        from crml_lang.yamlio import load_yaml_from_str
+
         with open(file_path, "r", encoding="utf-8") as f:
-            root = yaml.safe_load(f)
+            root = load_yaml_from_str(f.read())
     except Exception:
         root = None
 
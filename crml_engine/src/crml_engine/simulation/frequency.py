@@ -2,8 +2,9 @@
 Frequency generation logic for CRML simulation.
 """
 import numpy as np
-from typing import Optional, Dict, List, Any
+from typing import Callable, Optional, Dict, List, Any
 from .utils import parse_numberish_value
+from . import kernels
 
 class FrequencyEngine:
     """Handles generating the number of loss events per simulation run."""
@@ -77,7 +78,15 @@ class FrequencyEngine:
         else:
             rates = rng.gamma(shape_val, scale_val, n_runs)
 
-        return np.maximum(0, np.round(rates * int(cardinality))).astype(int)
+        if kernels.HAVE_NUMBA:
+            return kernels.round_scaled_counts(rates, int(cardinality))
+
+        # `rates` is a fresh array, so scale/round/clip in place.
+        rates = np.asarray(rates, dtype=np.float64)
+        rates *= int(cardinality)
+        np.rint(rates, out=rates)
+        np.maximum(rates, 0, out=rates)
+        return rates.astype(np.int64, copy=False)
 
     @staticmethod
     def _generate_hierarchical_gamma_poisson(
@@ -108,6 +117,16 @@ class FrequencyEngine:
         # Poisson sampling supports array-valued lambda.
         return rng.poisson(total_lambdas)
     
+    @staticmethod
+    def sampler(freq_model: str) -> Optional[Callable[..., np.ndarray]]:
+        """Return the registered sampler for a frequency model name.
+
+        The sampler takes keyword arguments `params`, `n_runs`, `cardinality`,
+        `uniforms`, `rate_multiplier` and `rng` and returns per-run event
+        counts. Returns None for unsupported models.
+        """
+        return _FREQUENCY_SAMPLERS.get(freq_model)
+
     @staticmethod
     def generate_frequency(
         freq_model: str, 
@@ -117,6 +136,7 @@ class FrequencyEngine:
         seed: Optional[int] = None,
         uniforms: Optional[np.ndarray] = None,
         rate_multiplier: Optional[object] = None,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """Generate per-run event counts for the configured frequency model.
 
@@ -133,12 +153,14 @@ class FrequencyEngine:
                 provide attributes consistent with the chosen model.
             n_runs: Number of Monte Carlo iterations.
             cardinality: Exposure multiplier (e.g., number of assets).
-            seed: Optional seed (currently the engine uses NumPy global RNG;
-                this argument is reserved for future local RNG handling).
+            seed: Optional seed used to construct a local generator when
+                `rng` is not provided.
             uniforms: Optional uniform variates in (0, 1) used for inverse-CDF
                 sampling in some branches to support copula correlation.
             rate_multiplier: Optional scalar or per-run multiplier applied to
                 the computed rate in the poisson branch.
+            rng: Optional NumPy Generator. When provided it takes precedence
+                over `seed`, allowing callers to share one random stream.
 
         Returns:
             Integer numpy array of shape (n_runs,) with event counts.
@@ -146,38 +168,32 @@ class FrequencyEngine:
         Raises:
             ValueError: If `rate_multiplier` is an array with wrong shape.
         """
-        # Note: seed is handled globally by numpy in the main engine, 
-        # but passed here if we ever want local random states.
-
-        rng = np.random.default_rng(seed)
-
-        if freq_model == 'poisson':
-            return FrequencyEngine._generate_poisson(
-                params=params,
-                n_runs=n_runs,
-                cardinality=cardinality,
-                uniforms=uniforms,
-                rate_multiplier=rate_multiplier,
-                rng=rng,
-            )
-
-        if freq_model == 'gamma':
-            return FrequencyEngine._generate_gamma(
-                params=params,
-                n_runs=n_runs,
-                cardinality=cardinality,
-                uniforms=uniforms,
-                rng=rng,
-            )
-
-        if freq_model == 'hierarchical_gamma_poisson':
-            return FrequencyEngine._generate_hierarchical_gamma_poisson(
-                params=params,
-                n_runs=n_runs,
-                cardinality=cardinality,
-                uniforms=uniforms,
-                rng=rng,
-            )
-
-        # Fallback or unknown model
-        return np.zeros(n_runs, dtype=int)
+        if rng is None:
+            rng = np.random.default_rng(seed)
+
+        sampler = FrequencyEngine.sampler(freq_model)
+        if sampler is None:
+            # Fallback or unknown model
+            return np.zeros(n_runs, dtype=int)
+
+        return sampler(
+            params=params,
+            n_runs=n_runs,
+            cardinality=cardinality,
+            uniforms=uniforms,
+            rate_multiplier=rate_multiplier,
+            rng=rng,
+        )
+
+
+# Model name -> sampler, resolved once at import instead of per call. Every
+# entry is called with params, n_runs, cardinality, uniforms, rate_multiplier
+# and rng; rate multipliers are only applied by the poisson model, so the other
+# entries drop that argument.
+_FREQUENCY_SAMPLERS = {
+    "poisson": FrequencyEngine._generate_poisson,
+    "gamma": lambda *, rate_multiplier, **kwargs: FrequencyEngine._generate_gamma(**kwargs),
+    "hierarchical_gamma_poisson": lambda *, rate_multiplier, **kwargs: (
+        FrequencyEngine._generate_hierarchical_gamma_poisson(**kwargs)
+    ),
+}
@@ -0,0 +1,93 @@
+"""
+Optional compiled kernels for CRML simulation.
+
+When `numba` is installed (``pip install 'crml-engine[jit]'``), the per-run
+aggregation of event severities and the rate-to-count rounding of the gamma
+frequency model are compiled and parallelized across runs.
+Without numba, `HAVE_NUMBA` is False and the engine keeps its NumPy path.
+
+Random variates are always drawn from the caller's NumPy Generator, so seeded
+runs produce the same numbers with or without numba.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    njit = None
+    prange = range
+
+HAVE_NUMBA = njit is not None
+
+
+if HAVE_NUMBA:  # pragma: no cover - exercised only when numba is installed
+
+    @njit(parallel=True, cache=True)
+    def _sum_segments(offsets: np.ndarray, severities: np.ndarray, out: np.ndarray) -> None:
+        for i in prange(out.shape[0]):
+            total = 0.0
+            for j in range(offsets[i], offsets[i + 1]):
+                total += severities[j]
+            out[i] = total
+
+    @njit(parallel=True, cache=True)
+    def _round_scaled(rates: np.ndarray, scale: float, out: np.ndarray) -> None:
+        for i in prange(out.shape[0]):
+            v = np.rint(rates[i] * scale)
+            out[i] = np.int64(v) if v > 0.0 else 0
+
+
+def sum_severities_by_count(counts: np.ndarray, severities: np.ndarray) -> np.ndarray:
+    """Sum per-event severities into per-run losses using the compiled kernel.
+
+    Args:
+        counts: Integer event counts per run (shape: (n_runs,)).
+        severities: Per-event loss samples concatenated across runs
+            (shape: (sum(counts),)). float32 input is accumulated in float64
+            without a full-size copy.
+
+    Returns:
+        Per-run total loss array of shape (n_runs,), always float64.
+
+    Raises:
+        RuntimeError: If numba is not installed.
+    """
+    if not HAVE_NUMBA:
+        raise RuntimeError("numba is required for compiled kernels: pip install 'crml-engine[jit]'")
+
+    counts = np.asarray(counts, dtype=np.int64)
+    offsets = np.zeros(counts.shape[0] + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    # float32 severities are summed in place into float64 totals; only other
+    # dtypes are converted.
+    severities = np.ascontiguousarray(severities)
+    if severities.dtype not in (np.float32, np.float64):
+        severities = severities.astype(np.float64)
+    out = np.empty(counts.shape[0], dtype=np.float64)
+    _sum_segments(offsets, severities, out)
+    return out
+
+
+def round_scaled_counts(rates: np.ndarray, scale: float) -> np.ndarray:
+    """Scale per-run rates, round to nearest and clip at zero in one pass.
+
+    Equivalent to ``np.maximum(np.rint(rates * scale), 0).astype(np.int64)``
+    without the intermediate arrays.
+
+    Args:
+        rates: Per-run rates (shape: (n_runs,)).
+        scale: Multiplier applied before rounding (e.g. cardinality).
+
+    Returns:
+        Integer array of shape (n_runs,).
+
+    Raises:
+        RuntimeError: If numba is not installed.
+    """
+    if not HAVE_NUMBA:
+        raise RuntimeError("numba is required for compiled kernels: pip install 'crml-engine[jit]'")
+
+    rates = np.ascontiguousarray(rates, dtype=np.float64)
+    out = np.empty(rates.shape[0], dtype=np.int64)
+    _round_scaled(rates, float(scale), out)
+    return out
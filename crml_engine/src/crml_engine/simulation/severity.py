@@ -4,7 +4,7 @@ Severity generation logic for CRML simulation.
 import numpy as np
 import math
 import logging
-from typing import Optional, Dict, List, Any, Tuple
+from typing import Callable, Optional, Dict, List, Any, Tuple
 from ..models.fx_model import FXConfig, convert_currency
 
 class SeverityEngine:
@@ -71,19 +71,17 @@ class SeverityEngine:
         return mu_val, sigma_val
 
     @classmethod
-    def _generate_lognormal(
+    def _resolve_lognormal_params(
         cls,
         *,
         params: Any,
-        total_events: int,
         base_currency: str,
         fx_config: FXConfig,
-        rng: np.random.Generator,
-    ) -> np.ndarray:
+    ) -> Optional[tuple[float, float]]:
         # 1) Auto-calibration from empirical single-event losses.
         if params and hasattr(params, 'single_losses') and params.single_losses is not None:
             try:
-                mu_val, sigma_val = cls.calibrate_lognormal_from_single_losses(
+                return cls.calibrate_lognormal_from_single_losses(
                     params.single_losses,
                     getattr(params, "currency", None),
                     base_currency,
@@ -92,18 +90,17 @@ class SeverityEngine:
             except Exception as e:
                 # Keep behavior: don't crash whole sim on bad config.
                 logging.error(e)
-                return np.zeros(total_events)
-        else:
-            mu_val, sigma_val = cls._lognormal_params_from_explicit_params(
-                params=params,
-                base_currency=base_currency,
-                fx_config=fx_config,
-            )
+                return None
 
-        return rng.lognormal(mu_val, sigma_val, total_events)
+        return cls._lognormal_params_from_explicit_params(
+            params=params,
+            base_currency=base_currency,
+            fx_config=fx_config,
+        )
 
-    @staticmethod
-    def _generate_gamma(
+    @classmethod
+    def _generate_lognormal(
+        cls,
         *,
         params: Any,
         total_events: int,
@@ -111,14 +108,53 @@ class SeverityEngine:
         fx_config: FXConfig,
         rng: np.random.Generator,
     ) -> np.ndarray:
+        resolved = cls._resolve_lognormal_params(
+            params=params,
+            base_currency=base_currency,
+            fx_config=fx_config,
+        )
+        if resolved is None:
+            return np.zeros(total_events)
+
+        mu_val, sigma_val = resolved
+        return rng.lognormal(mu_val, sigma_val, total_events)
+
+    @staticmethod
+    def _resolve_gamma_params(
+        *,
+        params: Any,
+        base_currency: str,
+        fx_config: FXConfig,
+    ) -> Optional[tuple[float, float]]:
         shape = float(params.shape) if params and getattr(params, "shape", None) else 0.0
         scale = float(params.scale) if params and getattr(params, "scale", None) else 0.0
 
         if shape <= 0 or scale <= 0:
-            return np.zeros(total_events)
+            return None
 
         sev_currency = params.currency if params and getattr(params, "currency", None) else base_currency
         scale = convert_currency(scale, sev_currency, base_currency, fx_config)
+        return shape, scale
+
+    @classmethod
+    def _generate_gamma(
+        cls,
+        *,
+        params: Any,
+        total_events: int,
+        base_currency: str,
+        fx_config: FXConfig,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        resolved = cls._resolve_gamma_params(
+            params=params,
+            base_currency=base_currency,
+            fx_config=fx_config,
+        )
+        if resolved is None:
+            return np.zeros(total_events)
+
+        shape, scale = resolved
         return rng.gamma(shape, scale, total_events)
 
     @classmethod
@@ -128,6 +164,7 @@ class SeverityEngine:
         components: Optional[List[Dict[str, Any]]],
         total_events: int,
         fx_config: FXConfig,
+        rng: np.random.Generator,
     ) -> np.ndarray:
         if not components:
             return np.zeros(total_events)
@@ -155,7 +192,7 @@ class SeverityEngine:
             p.mu = _safe_parse(ln_data.get('mu'))
             p.sigma = _safe_parse(ln_data.get('sigma'))
             p.currency = ln_data.get('currency')
-            return cls.generate_severity('lognormal', p, None, total_events, fx_config)
+            return cls.generate_severity('lognormal', p, None, total_events, fx_config, rng=rng)
 
         if 'gamma' in first:
             g_data = first['gamma']
@@ -167,7 +204,7 @@ class SeverityEngine:
             p.shape = _safe_parse(g_data.get('shape'))
             p.scale = _safe_parse(g_data.get('scale'))
             p.currency = g_data.get('currency')
-            return cls.generate_severity('gamma', p, None, total_events, fx_config)
+            return cls.generate_severity('gamma', p, None, total_events, fx_config, rng=rng)
 
         return np.zeros(total_events)
 
@@ -206,24 +243,61 @@ class SeverityEngine:
         sev_currency = currency or fx_config.base_currency
         
         from .utils import parse_numberish_value
-        # Convert all losses to base currency first
-        # Use parse_numberish_value to ensure we handle strings like "1 000" correctly
-        losses_base = [
-            convert_currency(parse_numberish_value(v), sev_currency, base_currency, fx_config) 
-            for v in single_losses
-        ]
-
-        if any(v <= 0 for v in losses_base):
+        # Use parse_numberish_value to ensure we handle strings like "1 000" correctly,
+        # then convert to base currency with a single FX factor (conversion is linear).
+        fx_factor = convert_currency(1.0, sev_currency, base_currency, fx_config)
+        losses_base = np.array([parse_numberish_value(v) for v in single_losses], dtype=np.float64)
+        losses_base *= fx_factor
+
+        if np.any(losses_base <= 0):
             raise ValueError("single_losses values must be positive")
 
         median_val = float(np.median(losses_base))
         mu_val = math.log(median_val)
-        
-        log_losses = [math.log(v) for v in losses_base]
-        sigma_val = float(np.std(log_losses))
-        
+
+        sigma_val = float(np.std(np.log(losses_base)))
+
         return mu_val, sigma_val
 
+    @staticmethod
+    def sampler(sev_model: str) -> Optional[Callable[..., np.ndarray]]:
+        """Return the registered sampler for a severity model name.
+
+        The sampler takes keyword arguments `params`, `components`,
+        `total_events`, `base_currency`, `fx_config` and `rng` and returns
+        per-event severities in the base currency. Returns None for
+        unsupported models.
+        """
+        return _SEVERITY_SAMPLERS.get(sev_model)
+
+    @staticmethod
+    def resolved_sampler(
+        sev_model: str,
+        *,
+        params: Any,
+        base_currency: str,
+        fx_config: FXConfig,
+        rng: np.random.Generator,
+    ) -> Optional[Callable[..., np.ndarray]]:
+        """Resolve severity parameters once and return a ``total_events=`` sampler.
+
+        Draws the same numbers as `sampler(sev_model)`, but calibration and
+        currency conversion run here instead of on every call, so callers
+        drawing in chunks neither repeat them nor log their errors once per
+        chunk. Returns None for models without a resolver (mixture).
+        """
+        entry = _SEVERITY_PARAM_RESOLVERS.get(sev_model)
+        if entry is None:
+            return None
+
+        resolve, draw = entry
+        resolved = resolve(params=params, base_currency=base_currency, fx_config=fx_config)
+        if resolved is None:
+            return lambda *, total_events: np.zeros(total_events)
+
+        a, b = resolved
+        return lambda *, total_events: draw(rng, a, b, total_events)
+
     @classmethod
     def generate_severity(
         cls,
@@ -233,6 +307,7 @@ class SeverityEngine:
         total_events: int,
         fx_config: FXConfig,
         seed: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """Generate per-event severity samples in the FX base currency.
 
@@ -253,6 +328,10 @@ class SeverityEngine:
             components: Mixture components for the "mixture" model.
             total_events: Number of per-event samples to generate.
             fx_config: FX configuration used to normalize values.
+            seed: Optional seed used to construct a local generator when
+                `rng` is not provided.
+            rng: Optional NumPy Generator. When provided it takes precedence
+                over `seed`.
 
         Returns:
             Float numpy array of shape (total_events,) representing per-event
@@ -267,31 +346,108 @@ class SeverityEngine:
             return np.array([])
             
         base_currency = fx_config.base_currency
-        rng = np.random.default_rng(seed)
+        if rng is None:
+            rng = np.random.default_rng(seed)
 
-        if sev_model == 'lognormal':
-            return cls._generate_lognormal(
-                params=params,
-                total_events=total_events,
-                base_currency=base_currency,
-                fx_config=fx_config,
-                rng=rng,
-            )
+        sampler = cls.sampler(sev_model)
+        if sampler is None:
+            return np.zeros(total_events)
+
+        return sampler(
+            params=params,
+            components=components,
+            total_events=total_events,
+            base_currency=base_currency,
+            fx_config=fx_config,
+            rng=rng,
+        )
+
+    @classmethod
+    def generate_aggregate_severity(
+        cls,
+        sev_model: str,
+        params: Any,
+        counts: np.ndarray,
+        fx_config: FXConfig,
+        rng: np.random.Generator,
+    ) -> Optional[np.ndarray]:
+        """Sample per-run aggregate losses directly from per-run event counts.
+
+        Instead of drawing one severity per event and summing, this draws a
+        single value per run from the distribution of the sum of `counts[i]`
+        i.i.d. severities:
+
+            - "gamma": the sum of N Gamma(k, theta) draws is exactly
+              Gamma(N * k, theta).
+            - "lognormal": the sum is approximated by a lognormal with matched
+              mean N * exp(mu + sigma^2 / 2) and variance
+              N * (exp(sigma^2) - 1) * exp(2 * mu + sigma^2).
+
+        Args:
+            sev_model: Model name ("lognormal" or "gamma").
+            params: Severity parameter object.
+            counts: Integer event counts per run (shape: (n_runs,)).
+            fx_config: FX configuration used to normalize values.
+            rng: NumPy Generator.
+
+        Returns:
+            Float numpy array of shape (n_runs,) with per-run losses in the FX
+            base currency, or None when the model is not supported by this
+            shortcut.
+        """
+        counts = np.asarray(counts)
+        out = np.zeros(counts.shape[0], dtype=np.float64)
+        hit = counts > 0
+        if not np.any(hit):
+            return out
+
+        base_currency = fx_config.base_currency
+        n = counts[hit].astype(np.float64)
 
         if sev_model == 'gamma':
-            return cls._generate_gamma(
+            resolved = cls._resolve_gamma_params(
                 params=params,
-                total_events=total_events,
                 base_currency=base_currency,
                 fx_config=fx_config,
-                rng=rng,
             )
+            if resolved is not None:
+                shape, scale = resolved
+                out[hit] = rng.gamma(n * shape, scale)
+            return out
 
-        if sev_model == 'mixture':
-            return cls._generate_mixture_first_component(
-                components=components,
-                total_events=total_events,
+        if sev_model == 'lognormal':
+            resolved = cls._resolve_lognormal_params(
+                params=params,
+                base_currency=base_currency,
                 fx_config=fx_config,
             )
-
-        return np.zeros(total_events)
+            if resolved is not None:
+                mu_val, sigma_val = resolved
+                # Matched moments: log-variance of the sum shrinks as 1/N.
+                sum_sigma2 = np.log1p(math.expm1(sigma_val * sigma_val) / n)
+                sum_mu = np.log(n) + mu_val + 0.5 * sigma_val * sigma_val - 0.5 * sum_sigma2
+                out[hit] = rng.lognormal(sum_mu, np.sqrt(sum_sigma2))
+            return out
+
+        return None
+
+
+# Model name -> sampler, resolved once at import instead of per call. Every
+# entry is called with params, components, total_events, base_currency,
+# fx_config and rng; each adapter drops the arguments its model does not use
+# (mixture components carry their own parameters and currency).
+_SEVERITY_SAMPLERS = {
+    "lognormal": lambda *, components, **kwargs: SeverityEngine._generate_lognormal(**kwargs),
+    "gamma": lambda *, components, **kwargs: SeverityEngine._generate_gamma(**kwargs),
+    "mixture": lambda *, params, base_currency, **kwargs: (
+        SeverityEngine._generate_mixture_first_component(**kwargs)
+    ),
+}
+
+
+# Models whose parameters resolve to the two arguments of a single Generator
+# method: model name -> (resolver, Generator method).
+_SEVERITY_PARAM_RESOLVERS = {
+    "lognormal": (SeverityEngine._resolve_lognormal_params, np.random.Generator.lognormal),
+    "gamma": (SeverityEngine._resolve_gamma_params, np.random.Generator.gamma),
+}
@@ -0,0 +1,59 @@
+"""Thread-safe LRU of validated model snapshots.
+
+Shared by the YAML loaders in `crml_lang.api` and the XLSX importer in
+`crml_lang.mapping.xlsx`. Entries are keyed by (model class, content digest)
+and stored pickled, so every hit returns an independent model that callers
+may mutate.
+"""
+
+from __future__ import annotations
+
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Callable, TypeVar
+
+_M = TypeVar("_M")
+
+
+class ModelSnapshotCache:
+    """Bounded, locked LRU mapping (model class, digest) to pickled models."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[tuple[type, bytes], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, cls: type[_M], digest: bytes, build: Callable[[], _M]) -> _M:
+        """Return a copy of the cached model for `(cls, digest)`, calling `build` on a miss.
+
+        `build` runs outside the lock, so concurrent misses for the same key
+        may both build; the last one stored wins.
+        """
+        key = (cls, digest)
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+        if blob is not None:
+            return pickle.loads(blob)
+
+        model = build()
+        blob = pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = blob
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return model
+
+    def clear_class(self, cls: type) -> None:
+        """Drop every entry cached for `cls`."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] is cls]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
@@ -18,6 +18,7 @@ Dump a scenario back to YAML::
 
     yaml_text = scenario.dump_to_yaml_str()
     scenario.dump_to_yaml("out.yaml")
+    scenario.dump_to_yaml_stream(sys.stdout)
 
 Validate a scenario document (schema + semantic warnings)::
 
@@ -30,13 +31,18 @@ Validate a scenario document (schema + semantic warnings)::
 
 from __future__ import annotations
 
-from typing import Any, Mapping
+import hashlib
+from typing import IO, Any, Mapping, TypeVar
 
+from ._model_cache import ModelSnapshotCache
 from .yamlio import (
     dump_yaml_to_path,
+    dump_yaml_to_stream,
     dump_yaml_to_str,
+    load_yaml_mapping_from_bytes,
     load_yaml_mapping_from_path,
     load_yaml_mapping_from_str,
+    load_yaml_mapping_from_stream,
 )
 
 from .models.scenario_model import CRScenario as _CRScenario
@@ -55,33 +61,112 @@ from .validators import validate_attack_catalog
 from .validators import validate_attack_control_relationships
 
 
-class CRScenario(_CRScenario):
-    """Root CRML Scenario document model.
+_M = TypeVar("_M")
 
-    This is a small subclass of the internal Pydantic model that adds
-    convenience constructors for YAML.
+# Validated documents keyed by (model class, BLAKE2b digest of the YAML text).
+_yaml_model_cache = ModelSnapshotCache(maxsize=2048)
+
+
+def _load_cached_from_yaml_str(cls: type[_M], yaml_text: str) -> _M:
+    """Parse and validate `yaml_text` as `cls`, reusing earlier results for identical text."""
+    digest = hashlib.blake2b(yaml_text.encode("utf-8"), digest_size=16).digest()
+    return _yaml_model_cache.get_or_build(
+        cls,
+        digest,
+        lambda: cls.model_validate(load_yaml_mapping_from_str(yaml_text)),  # type: ignore[attr-defined]
+    )
+
+
+def _load_cached_from_yaml_path(cls: type[_M], path: str) -> _M:
+    """Validate the YAML file at `path` as `cls`, reusing earlier results for identical bytes.
+
+    The model cache is keyed on the file bytes (for UTF-8 files, the same key
+    as `_load_cached_from_yaml_str` on their text). On a miss the bytes are
+    parsed via `load_yaml_mapping_from_bytes`, so `CRML_YAML_JSON_CACHE_DIR`
+    applies here just as it does to `load_yaml_mapping_from_path`.
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    return _yaml_model_cache.get_or_build(
+        cls,
+        digest,
+        lambda: cls.model_validate(load_yaml_mapping_from_bytes(raw)),  # type: ignore[attr-defined]
+    )
+
+
+def _clear_yaml_model_cache(cls: type) -> None:
+    _yaml_model_cache.clear_class(cls)
+
+
+class _CachedYamlDocument:
+    """YAML constructors and serializers shared by the root document models.
+
+    Mixed in ahead of the Pydantic model, e.g.
+    ``class CRPortfolio(_CachedYamlDocument, _CRPortfolio)``.
     """
 
     @classmethod
-    def load_from_yaml(cls, path: str) -> "CRScenario":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
+    def load_from_yaml(cls: type[_M], path: str) -> _M:
+        """Load from a YAML file path.
+
+        Identical file content is parsed and validated once; later loads
+        return an independent copy of the cached result. Misses honour
+        `CRML_YAML_JSON_CACHE_DIR` (see `crml_lang.yamlio`).
+
+        The whole file is read into memory first, since the cache key is a
+        digest of its bytes; use `crml_lang.yamlio.load_yaml_mapping_from_path`
+        to parse a file from the open stream instead.
+        """
+        return _load_cached_from_yaml_path(cls, path)
 
     @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRScenario":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
+    def load_from_yaml_str(cls: type[_M], yaml_text: str) -> _M:
+        """Load from YAML text.
+
+        Identical text is parsed and validated once; later loads return an
+        independent copy of the cached result.
+        """
+        return _load_cached_from_yaml_str(cls, yaml_text)
+
+    @classmethod
+    def load_from_yaml_stream(cls: type[_M], stream: IO[str]) -> _M:
+        """Load from a text stream of YAML (e.g. `io.StringIO` or an open file).
+
+        The stream is parsed incrementally and never read into one string, so
+        unlike `load_from_yaml`/`load_from_yaml_str` results are not cached.
+        """
+        return cls.model_validate(load_yaml_mapping_from_stream(stream))  # type: ignore[attr-defined]
+
+    @classmethod
+    def cache_clear(cls) -> None:
+        """Drop cached `load_from_yaml`/`load_from_yaml_str` results for this class."""
+        _clear_yaml_model_cache(cls)
 
     def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
         """Serialize this model to a YAML file at `path`."""
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
+        data = self.model_dump(by_alias=True, exclude_none=exclude_none)  # type: ignore[attr-defined]
         dump_yaml_to_path(data, path, sort_keys=sort_keys)
 
     def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
         """Serialize this model to a YAML string."""
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
+        data = self.model_dump(by_alias=True, exclude_none=exclude_none)  # type: ignore[attr-defined]
         return dump_yaml_to_str(data, sort_keys=sort_keys)
 
+    def dump_to_yaml_stream(self, stream: IO[str], *, sort_keys: bool = False, exclude_none: bool = True) -> None:
+        """Serialize this model as YAML onto a text stream."""
+        data = self.model_dump(by_alias=True, exclude_none=exclude_none)  # type: ignore[attr-defined]
+        dump_yaml_to_stream(data, stream, sort_keys=sort_keys)
+
+
+class CRScenario(_CachedYamlDocument, _CRScenario):
+    """Root CRML Scenario document model.
+
+    This is a small subclass of the internal Pydantic model that adds
+    convenience constructors for YAML.
+    """
+
+
 class CRPortfolioBundle(_CRPortfolioBundle):
     """Engine-agnostic portfolio bundle.
 
@@ -138,136 +223,29 @@ def dump_to_yaml_str(model: CRScenario | Mapping[str, Any], *, sort_keys: bool =
     return dump_yaml_to_str(dict(model), sort_keys=sort_keys)
 
 
-class CRPortfolio(_CRPortfolio):
+class CRPortfolio(_CachedYamlDocument, _CRPortfolio):
     """Root CRML Portfolio document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRPortfolio":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRPortfolio":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
-
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
-
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
-
-
-class CRControlCatalog(_CRControlCatalog):
+class CRControlCatalog(_CachedYamlDocument, _CRControlCatalog):
     """Root CRML Control Catalog document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRControlCatalog":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
-
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRControlCatalog":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
-
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
-
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
-
 
-class CRAttackCatalog(_CRAttackCatalog):
+class CRAttackCatalog(_CachedYamlDocument, _CRAttackCatalog):
     """Root CRML Attack Catalog document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRAttackCatalog":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
 
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRAttackCatalog":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
-
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
-
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
-
-
-class CRAssessment(_CRAssessment):
+class CRAssessment(_CachedYamlDocument, _CRAssessment):
     """Root CRML Assessment document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRAssessment":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
-
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRAssessment":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
-
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
-
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
-
 
-class CRControlRelationships(_CRControlRelationships):
+class CRControlRelationships(_CachedYamlDocument, _CRControlRelationships):
     """Root CRML Control Relationships document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRControlRelationships":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
-
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRControlRelationships":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
-
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
-
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
 
-
-class CRAttackControlRelationships(_CRAttackControlRelationships):
+class CRAttackControlRelationships(_CachedYamlDocument, _CRAttackControlRelationships):
     """Root CRML Attack-to-Control Relationships document model."""
 
-    @classmethod
-    def load_from_yaml(cls, path: str) -> "CRAttackControlRelationships":
-        data = load_yaml_mapping_from_path(path)
-        return cls.model_validate(data)
-
-    @classmethod
-    def load_from_yaml_str(cls, yaml_text: str) -> "CRAttackControlRelationships":
-        data = load_yaml_mapping_from_str(yaml_text)
-        return cls.model_validate(data)
-
-    def dump_to_yaml(self, path: str, *, sort_keys: bool = False, exclude_none: bool = True) -> None:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        dump_yaml_to_path(data, path, sort_keys=sort_keys)
-
-    def dump_to_yaml_str(self, *, sort_keys: bool = False, exclude_none: bool = True) -> str:
-        data = self.model_dump(by_alias=True, exclude_none=exclude_none)
-        return dump_yaml_to_str(data, sort_keys=sort_keys)
 
 __all__ = [
     "CRScenario",
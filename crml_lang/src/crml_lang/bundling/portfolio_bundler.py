@@ -4,6 +4,8 @@ import os
 from dataclasses import dataclass
 from typing import Any, Literal, Mapping, Optional
 
+from pydantic import TypeAdapter
+
 from crml_lang.models.assessment_model import CRAssessment
 from crml_lang.models.attack_catalog_model import CRAttackCatalog
 from crml_lang.models.attack_control_relationships_model import CRAttackControlRelationships
@@ -20,6 +22,10 @@ from crml_lang.models.portfolio_model import CRPortfolio
 from crml_lang.yamlio import load_yaml_mapping_from_path, load_yaml_mapping_from_str
 
 
+# Validates all scenario documents of a portfolio in one pydantic-core call.
+_SCENARIO_LIST_ADAPTER = TypeAdapter(list[CRScenario])
+
+
 @dataclass(frozen=True)
 class BundleReport:
     """Structured bundle output (errors/warnings + bundle when successful)."""
@@ -329,6 +335,50 @@ def _inline_attack_control_relationships(
     return out
 
 
+def _scenario_inline_error(idx: int, sref: Any, e: Exception) -> BundleMessage:
+    return BundleMessage(
+        level="error",
+        path=f"portfolio.scenarios[{idx}].path",
+        message=f"Failed to inline scenario '{sref.id}' from '{sref.path}': {e}",
+    )
+
+
+def _load_scenarios_from_paths(
+    *,
+    scenario_refs: list[Any],
+    base_dir: str | None,
+) -> tuple[list[CRScenario], list[BundleMessage]]:
+    """Load and validate referenced scenario files.
+
+    Files are read up to the first unreadable one, and everything read so far is
+    validated with a single list validation. Only when that fails are the
+    documents re-validated one by one, to report the first failing scenario with
+    its own message (which is also the first error in reference order).
+    """
+    raw: list[dict[str, Any]] = []
+    read_error: Optional[BundleMessage] = None
+    for idx, sref in enumerate(scenario_refs):
+        try:
+            raw.append(_load_yaml_file(_resolve_path(base_dir, sref.path)))
+        except Exception as e:
+            read_error = _scenario_inline_error(idx, sref, e)
+            break
+
+    try:
+        docs = _SCENARIO_LIST_ADAPTER.validate_python(raw)
+    except Exception:
+        for idx, data in enumerate(raw):
+            try:
+                CRScenario.model_validate(data)
+            except Exception as e:
+                return [], [_scenario_inline_error(idx, scenario_refs[idx], e)]
+        raise
+
+    if read_error is not None:
+        return [], [read_error]
+    return docs, []
+
+
 def _inline_scenarios(
     *,
     portfolio_doc: CRPortfolio,
@@ -343,11 +393,11 @@ def _inline_scenarios(
         a referenced scenario, the errors list is returned non-empty.
     """
     errors: list[BundleMessage] = []
-    bundled: list[BundledScenario] = []
+    scenario_refs = list(portfolio_doc.portfolio.scenarios)
 
-    for idx, sref in enumerate(portfolio_doc.portfolio.scenarios):
-        if source_kind == "model":
-            if not scenarios:
+    if source_kind == "model":
+        if not scenarios:
+            if scenario_refs:
                 errors.append(
                     BundleMessage(
                         level="error",
@@ -355,8 +405,10 @@ def _inline_scenarios(
                         message="source_kind='model' requires `scenarios` to be provided",
                     )
                 )
-                return [], errors
+            return [], errors
 
+        docs: list[CRScenario] = []
+        for idx, sref in enumerate(scenario_refs):
             scenario_doc = scenarios.get(sref.id) or scenarios.get(sref.path)
             if scenario_doc is None:
                 errors.append(
@@ -370,29 +422,21 @@ def _inline_scenarios(
                     )
                 )
                 return [], errors
-        else:
-            scenario_path = _resolve_path(base_dir, sref.path)
-            try:
-                scenario_doc = CRScenario.model_validate(_load_yaml_file(scenario_path))
-            except Exception as e:
-                errors.append(
-                    BundleMessage(
-                        level="error",
-                        path=f"portfolio.scenarios[{idx}].path",
-                        message=f"Failed to inline scenario '{sref.id}' from '{sref.path}': {e}",
-                    )
-                )
-                return [], errors
-
-        bundled.append(
-            BundledScenario(
-                id=sref.id,
-                weight=sref.weight,
-                source_path=sref.path,
-                scenario=scenario_doc,
-            )
+            docs.append(scenario_doc)
+    else:
+        docs, errors = _load_scenarios_from_paths(scenario_refs=scenario_refs, base_dir=base_dir)
+        if errors:
+            return [], errors
+
+    bundled = [
+        BundledScenario(
+            id=sref.id,
+            weight=sref.weight,
+            source_path=sref.path,
+            scenario=scenario_doc,
         )
-
+        for sref, scenario_doc in zip(scenario_refs, docs)
+    ]
     return bundled, errors
 
 
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Iterable, Iterator, Optional
 
+from .._model_cache import ModelSnapshotCache
 from ..models.control_catalog_model import CRControlCatalog
 from ..models.attack_catalog_model import CRAttackCatalog
 from ..models.control_relationships_model import CRControlRelationships
@@ -46,78 +50,221 @@ def _doc_meta_columns(*, tags_desc: str) -> list[tuple[str, str, str]]:
     ]
 
 
-def _xlsx_header_row(ws) -> int:
-    # Mapping sheets created by this exporter hide row 1 (machine keys) and
-    # show row 2 as the human header.
-    return 2 if ws.row_dimensions[1].hidden else 1
+# Presentational formatting per sheet, keyed by machine column name. This
+# never changes the workbook schema.
+_SHEET_FORMATS: dict[str, dict[str, Any]] = {
+    _SHEET_META: {
+        "column_widths": {"format": 22, "version": 12, "created_at": 22, "header_rows": 12},
+    },
+    _SHEET_CONTROL_CATALOGS: {
+        "column_widths": {
+            "doc_name": 22,
+            "framework": 20,
+            "control_id": 18,
+            "title": 32,
+            "url": 34,
+            "tags_json": 22,
+            "defense_in_depth_layers_json": 22,
+        },
+    },
+    _SHEET_ATTACK_CATALOGS: {
+        "column_widths": {
+            "doc_name": 22,
+            "framework": 26,
+            "attack_id": 18,
+            "title": 40,
+            "url": 34,
+            "tags_json": 22,
+        },
+    },
+    _SHEET_CONTROL_RELATIONSHIPS: {
+        "column_widths": {
+            "doc_name": 22,
+            "source_id": 18,
+            "target_id": 18,
+            "relationship_type": 16,
+            "overlap_weight": 14,
+            "overlap_dimensions_json": 26,
+            "overlap_rationale": 34,
+            "confidence": 12,
+            "groupings_json": 26,
+            "references_json": 26,
+            "description": 34,
+        },
+        "list_validations": [
+            (
+                "relationship_type",
+                [
+                    "overlaps_with",
+                    "mitigates",
+                    "supports",
+                    "equivalent_to",
+                    "parent_of",
+                    "child_of",
+                    "backstops",
+                ],
+            )
+        ],
+        "number_formats": [("overlap_weight", "0.00"), ("confidence", "0.00")],
+    },
+    _SHEET_ATTACK_CONTROL_RELATIONSHIPS: {
+        "column_widths": {
+            "doc_name": 22,
+            "attack_id": 18,
+            "control_id": 18,
+            "relationship_type": 16,
+            "strength": 12,
+            "confidence": 12,
+            "tags_json": 22,
+            "references_json": 26,
+            "description": 34,
+            "metadata_json": 26,
+        },
+        "list_validations": [("relationship_type", ["mitigated_by", "detectable_by", "respondable_by"])],
+        "number_formats": [("strength", "0.00"), ("confidence", "0.00")],
+    },
+}
 
 
-def _xlsx_header_index(ws, name: str) -> int:
-    # Machine header row is always row 1.
-    header = [c.value for c in ws[1]]
-    try:
-        return header.index(name) + 1
-    except ValueError as e:
-        raise KeyError(name) from e
+@dataclass(frozen=True)
+class _XlsxStyles:
+    header_fill: Any
+    header_font: Any
+    header_align: Any
+    wrap_align: Any
 
 
-def _xlsx_set_freeze_and_filter(ws, *, header_row: int, first_body_row: int, get_column_letter) -> None:
-    ws.freeze_panes = f"A{first_body_row}"
-    if ws.max_row >= header_row and ws.max_column >= 1:
-        ws.auto_filter.ref = f"A{header_row}:{get_column_letter(ws.max_column)}{ws.max_row}"
+@lru_cache(maxsize=1)
+def _xlsx_styles() -> _XlsxStyles:
+    """Return the shared header/body styles.
 
+    openpyxl style objects are immutable and each workbook registers them by
+    value, so one set is built per process and shared by every export.
+    """
+    from openpyxl.styles import Alignment, Font, PatternFill
 
-def _xlsx_style_header_row(ws, *, header_row: int, header_fill, header_font, header_align) -> None:
-    for cell in ws[header_row]:
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_align
+    return _XlsxStyles(
+        header_fill=PatternFill("solid", fgColor="F2F2F2"),
+        header_font=Font(bold=True),
+        header_align=Alignment(vertical="top", wrap_text=True),
+        wrap_align=Alignment(vertical="top", wrap_text=True),
+    )
 
 
-def _xlsx_wrap_body_cells(ws, *, first_body_row: int, wrap_align) -> None:
-    for row in ws.iter_rows(min_row=first_body_row, max_row=ws.max_row, values_only=False):
-        for cell in row:
-            v = cell.value
-            if v is None:
-                continue
-            if isinstance(v, str) and ("{" in v or "[" in v or "\n" in v):
-                cell.alignment = wrap_align
+def _needs_wrap(v: Any) -> bool:
+    return isinstance(v, str) and ("{" in v or "[" in v or "\n" in v)
 
 
-def _xlsx_apply_column_widths(ws, *, widths: dict[str, float], get_column_letter) -> None:
-    for col_name, width in widths.items():
-        try:
-            idx = _xlsx_header_index(ws, col_name)
-        except KeyError:
-            continue
-        ws.column_dimensions[get_column_letter(idx)].width = width
+class _XlsxSheetWriter:
+    """Stream rows into a write-only worksheet, formatting them on the way.
 
+    Cells of a write-only worksheet cannot be revisited, so the sheet's
+    presentational formatting is applied as rows are appended: column widths,
+    freeze panes and the hidden machine-key row up front, header and body
+    cell styles per row, and the auto-filter and list validations in `close`
+    once the row count is known.
+    """
 
-def _xlsx_style_sheet(
-    ws,
-    *,
-    header_fill,
-    header_font,
-    header_align,
-    wrap_align,
-    get_column_letter,
-    column_widths: dict[str, float] | None = None,
-) -> None:
-    hr = _xlsx_header_row(ws)
-    first_body_row = hr + 1
-    _xlsx_set_freeze_and_filter(
-        ws, header_row=hr, first_body_row=first_body_row, get_column_letter=get_column_letter
-    )
-    _xlsx_style_header_row(
-        ws,
-        header_row=hr,
-        header_fill=header_fill,
-        header_font=header_font,
-        header_align=header_align,
-    )
-    _xlsx_wrap_body_cells(ws, first_body_row=first_body_row, wrap_align=wrap_align)
-    if column_widths:
-        _xlsx_apply_column_widths(ws, widths=column_widths, get_column_letter=get_column_letter)
+    def __init__(
+        self,
+        wb,
+        sheet_name: str,
+        columns: list[str],
+        *,
+        header_row: int,
+        styles: _XlsxStyles,
+    ) -> None:
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.comments import Comment
+        from openpyxl.utils import get_column_letter
+
+        # Resolved once per sheet rather than on every styled cell.
+        self._cell_cls = WriteOnlyCell
+        self._comment_cls = Comment
+        self._get_column_letter = get_column_letter
+        self._ws = ws = wb.create_sheet(sheet_name)
+        self._header_row = header_row
+        self._styles = styles
+        self._rows = 0
+        self._last_column = get_column_letter(len(columns))
+
+        fmt = _SHEET_FORMATS.get(sheet_name, {})
+        col_index = {name: idx for idx, name in enumerate(columns)}
+        for col_name, width in fmt.get("column_widths", {}).items():
+            if col_name in col_index:
+                ws.column_dimensions[get_column_letter(col_index[col_name] + 1)].width = width
+        self._number_formats = {
+            col_index[col_name]: number_format
+            for col_name, number_format in fmt.get("number_formats", [])
+            if col_name in col_index
+        }
+        self._list_validations = [
+            (get_column_letter(col_index[col_name] + 1), allowed)
+            for col_name, allowed in fmt.get("list_validations", [])
+            if col_name in col_index
+        ]
+
+        if header_row > 1:
+            ws.row_dimensions[1].hidden = True
+        ws.freeze_panes = f"A{header_row + 1}"
+
+    def append(self, values: list[Any], *, comments: Optional[list[str]] = None) -> None:
+        """Append one row; `comments` (header row only) become cell comments."""
+        self._rows += 1
+        if self._rows == self._header_row:
+            self._ws.append(self._header_cells(values, comments))
+        elif self._rows > self._header_row:
+            self._ws.append([self._body_cell(idx, v) for idx, v in enumerate(values)])
+        else:
+            self._ws.append(values)
+
+    def _header_cells(self, values: list[Any], comments: Optional[list[str]]) -> list[Any]:
+        styles = self._styles
+        cells = []
+        for idx, v in enumerate(values):
+            cell = self._cell_cls(self._ws, value=v)
+            cell.fill = styles.header_fill
+            cell.font = styles.header_font
+            cell.alignment = styles.header_align
+            if comments and comments[idx]:
+                cell.comment = self._comment_cls(comments[idx], "crml")
+            cells.append(cell)
+        return cells
+
+    def _body_cell(self, idx: int, v: Any) -> Any:
+        if v is None:
+            return None
+        number_format = self._number_formats.get(idx)
+        wrap = _needs_wrap(v)
+        if number_format is None and not wrap:
+            return v
+
+        cell = self._cell_cls(self._ws, value=v)
+        if wrap:
+            cell.alignment = self._styles.wrap_align
+        if number_format is not None:
+            cell.number_format = number_format
+        return cell
+
+    def close(self) -> None:
+        """Set the auto-filter and list validations over the rows written."""
+        from openpyxl.worksheet.datavalidation import DataValidation
+
+        ws = self._ws
+        last_row = self._rows
+        if last_row >= self._header_row:
+            ws.auto_filter.ref = f"A{self._header_row}:{self._last_column}{last_row}"
+
+        start_row = self._header_row + 1
+        if last_row < start_row:
+            return
+        for col, allowed in self._list_validations:
+            # Escape double-quotes for Excel list literals by doubling them.
+            safe_items = [s.replace('"', '""') for s in allowed]
+            formula = '"' + ",".join(safe_items) + '"'
+            dv = DataValidation(type="list", formula1=formula, allow_blank=True)
+            ws.data_validations.append(dv)
+            dv.add(f"{col}{start_row}:{col}{last_row}")
 
 
 def _control_catalog_get_or_create_doc(
@@ -158,7 +305,7 @@ def _control_catalog_get_or_create_doc(
     return container
 
 
-def _control_catalog_parse_ref_obj(*, control_id: str | None, data: dict[str, Any]) -> Optional[dict[str, Any]]:
+def _control_catalog_parse_ref_obj(*, control_id: str | None, data: _RowView) -> Optional[dict[str, Any]]:
     ref_standard = _cell_str(data.get("ref_standard"))
     ref_control = _cell_str(data.get("ref_control"))
     ref_requirement = _cell_str(data.get("ref_requirement"))
@@ -174,43 +321,6 @@ def _control_catalog_parse_ref_obj(*, control_id: str | None, data: dict[str, An
     }
 
 
-def _xlsx_add_list_validation(ws, *, column_name: str, allowed: list[str]) -> None:
-    from openpyxl.utils import get_column_letter
-    from openpyxl.worksheet.datavalidation import DataValidation
-
-    try:
-        col_idx = _xlsx_header_index(ws, column_name)
-    except KeyError:
-        return
-
-    start_row = _xlsx_header_row(ws) + 1
-    if ws.max_row < start_row:
-        return
-
-    # Escape double-quotes for Excel list literals by doubling them.
-    safe_items = [s.replace('"', '""') for s in allowed]
-    formula = '"' + ",".join(safe_items) + '"'
-    dv = DataValidation(type="list", formula1=formula, allow_blank=True)
-    ws.add_data_validation(dv)
-    dv.add(
-        f"{get_column_letter(col_idx)}{start_row}:{get_column_letter(col_idx)}{ws.max_row}"
-    )
-
-
-def _xlsx_number_format(ws, *, column_name: str, fmt: str) -> None:
-    try:
-        col_idx = _xlsx_header_index(ws, column_name)
-    except KeyError:
-        return
-
-    start_row = _xlsx_header_row(ws) + 1
-    for r in range(start_row, ws.max_row + 1):
-        cell = ws.cell(row=r, column=col_idx)
-        if cell.value is None:
-            continue
-        cell.number_format = fmt
-
-
 def _xlsx_module():
     try:
         import openpyxl  # type: ignore
@@ -298,21 +408,73 @@ def _doc_key(
     )
 
 
-def _read_sheet_rows(wb, sheet_name: str, *, header_rows: int) -> tuple[list[str], list[tuple[Any, ...]]]:
+# Validated documents keyed by (model class, BLAKE2b digest of the canonical
+# JSON of the dict rebuilt from the sheet rows).
+_validated_doc_cache = ModelSnapshotCache(maxsize=256)
+
+
+def _validate_doc(model_cls, data: dict[str, Any]) -> Any:
+    """Validate a document rebuilt from sheet rows, reusing earlier results for identical data.
+
+    Re-importing unchanged rows (the same workbook, or one exported from the
+    same documents) skips Pydantic validation. Data that cannot be
+    canonicalized as JSON is validated without caching.
+    """
+    try:
+        canonical = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return model_cls.model_validate(data)
+
+    digest = hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+    return _validated_doc_cache.get_or_build(model_cls, digest, lambda: model_cls.model_validate(data))
+
+
+def _read_sheet_rows(
+    wb, sheet_name: str, *, header_rows: int
+) -> tuple[list[str], Iterator[tuple[Any, ...]]]:
+    """Return the machine header and an iterator over the body rows of a sheet.
+
+    Body rows are streamed, so they must be consumed before the workbook is
+    closed.
+    """
     if sheet_name not in wb.sheetnames:
-        return ([], [])
+        return ([], iter(()))
+
+    rows = wb[sheet_name].iter_rows(values_only=True)
+    head = list(islice(rows, header_rows))
+    if not head or len(head) < header_rows:
+        return ([], iter(()))
+
+    header = [str(c) for c in head[0]]
+    return (header, rows)
 
-    ws = wb[sheet_name]
-    rows = list(ws.iter_rows(values_only=True))
-    if len(rows) <= header_rows:
-        return ([], [])
 
-    header = [str(c) for c in rows[0]]
-    body = list(rows[header_rows:])
-    return (header, body)
+class _RowView:
+    """Positional, read-only view of one sheet row keyed by the machine header.
+
+    Column positions are resolved once per sheet; `bind` then points the view
+    at each body row in turn, so rows are read in place instead of being
+    copied into a dict each. Missing columns and short rows read as None.
+    """
 
+    __slots__ = ("_positions", "_row")
 
-def _read_doc_meta(data: dict[str, Any]) -> tuple[str | None, str | None, str | None, Any]:
+    def __init__(self, header: list[str]) -> None:
+        self._positions = {name: i for i, name in enumerate(header)}
+        self._row: tuple[Any, ...] = ()
+
+    def bind(self, row: tuple[Any, ...]) -> "_RowView":
+        self._row = row
+        return self
+
+    def get(self, name: str) -> Any:
+        i = self._positions.get(name)
+        if i is None or i >= len(self._row):
+            return None
+        return self._row[i]
+
+
+def _read_doc_meta(data: _RowView) -> tuple[str | None, str | None, str | None, Any]:
     doc_name = _cell_str(data.get("doc_name"))
     doc_version = _cell_str(data.get("doc_version"))
     doc_description = _cell_str(data.get("doc_description"))
@@ -423,149 +585,21 @@ def export_xlsx(
         attack_control_relationship_paths, CRAttackControlRelationships
     )
 
-    wb = openpyxl.Workbook()
-
-    # Remove the default sheet.
-    if wb.worksheets:
-        wb.remove(wb.worksheets[0])
+    # Write-only workbooks stream rows to disk instead of keeping every cell
+    # in memory; formatting is applied as rows are written.
+    wb = openpyxl.Workbook(write_only=True)
+    styles = _xlsx_styles()
 
-    _write_meta_sheet(wb)
-    _write_control_catalogs_sheet(wb, catalogs)
-    _write_attack_catalogs_sheet(wb, attack_catalogs_list)
-    _write_control_relationships_sheet(wb, rels)
-    _write_attack_control_relationships_sheet(wb, attck_rels)
-
-    _apply_workbook_formatting(wb)
+    _write_meta_sheet(wb, styles=styles)
+    _write_control_catalogs_sheet(wb, catalogs, styles=styles)
+    _write_attack_catalogs_sheet(wb, attack_catalogs_list, styles=styles)
+    _write_control_relationships_sheet(wb, rels, styles=styles)
+    _write_attack_control_relationships_sheet(wb, attck_rels, styles=styles)
 
     Path(out_path).parent.mkdir(parents=True, exist_ok=True)
     wb.save(out_path)
 
 
-def _apply_workbook_formatting(wb) -> None:
-    """Apply purely-presentational formatting to make sheets nicer to use.
-
-    This intentionally does not change the workbook schema.
-    """
-
-    from openpyxl.styles import Alignment, Font, PatternFill
-    from openpyxl.utils import get_column_letter
-
-    header_fill = PatternFill("solid", fgColor="F2F2F2")
-    header_font = Font(bold=True)
-    header_align = Alignment(vertical="top", wrap_text=True)
-    wrap_align = Alignment(vertical="top", wrap_text=True)
-
-    sheet_configs: list[tuple[str, dict[str, Any]]] = [
-        (
-            _SHEET_META,
-            {
-                "column_widths": {"format": 22, "version": 12, "created_at": 22, "header_rows": 12},
-            },
-        ),
-        (
-            _SHEET_CONTROL_CATALOGS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "framework": 20,
-                    "control_id": 18,
-                    "title": 32,
-                    "url": 34,
-                    "tags_json": 22,
-                    "defense_in_depth_layers_json": 22,
-                },
-            },
-        ),
-        (
-            _SHEET_ATTACK_CATALOGS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "framework": 26,
-                    "attack_id": 18,
-                    "title": 40,
-                    "url": 34,
-                    "tags_json": 22,
-                },
-            },
-        ),
-        (
-            _SHEET_CONTROL_RELATIONSHIPS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "source_id": 18,
-                    "target_id": 18,
-                    "relationship_type": 16,
-                    "overlap_weight": 14,
-                    "overlap_dimensions_json": 26,
-                    "overlap_rationale": 34,
-                    "confidence": 12,
-                    "groupings_json": 26,
-                    "references_json": 26,
-                    "description": 34,
-                },
-                "list_validations": [
-                    (
-                        "relationship_type",
-                        [
-                            "overlaps_with",
-                            "mitigates",
-                            "supports",
-                            "equivalent_to",
-                            "parent_of",
-                            "child_of",
-                            "backstops",
-                        ],
-                    )
-                ],
-                "number_formats": [("overlap_weight", "0.00"), ("confidence", "0.00")],
-            },
-        ),
-        (
-            _SHEET_ATTACK_CONTROL_RELATIONSHIPS,
-            {
-                "column_widths": {
-                    "doc_name": 22,
-                    "attack_id": 18,
-                    "control_id": 18,
-                    "relationship_type": 16,
-                    "strength": 12,
-                    "confidence": 12,
-                    "tags_json": 22,
-                    "references_json": 26,
-                    "description": 34,
-                    "metadata_json": 26,
-                },
-                "list_validations": [
-                    ("relationship_type", ["mitigated_by", "detectable_by", "respondable_by"])
-                ],
-                "number_formats": [("strength", "0.00"), ("confidence", "0.00")],
-            },
-        ),
-    ]
-
-    for sheet_name, cfg in sheet_configs:
-        if sheet_name not in wb.sheetnames:
-            continue
-        ws = wb[sheet_name]
-        _xlsx_style_sheet(
-            ws,
-            header_fill=header_fill,
-            header_font=header_font,
-            header_align=header_align,
-            wrap_align=wrap_align,
-            get_column_letter=get_column_letter,
-            column_widths=cfg.get("column_widths"),
-        )
-
-        for col_name, allowed in (cfg.get("list_validations") or []):
-            _xlsx_add_list_validation(ws, column_name=str(col_name), allowed=list(allowed))
-
-        for col_name, fmt in (cfg.get("number_formats") or []):
-            _xlsx_number_format(ws, column_name=str(col_name), fmt=str(fmt))
-
-
 def import_xlsx(source: str | Path | Any) -> ImportedXlsx:
     """Import CRML documents from an XLSX workbook created by `export_xlsx`.
 
@@ -577,9 +611,18 @@ def import_xlsx(source: str | Path | Any) -> ImportedXlsx:
     openpyxl = _xlsx_module()
 
     if isinstance(source, (str, Path)):
-        wb = openpyxl.load_workbook(str(source))
-    else:
-        wb = source
+        # Read-only workbooks stream rows from the sheet XML instead of
+        # building a cell object for every value. Formula cells still import
+        # as their formula text, as with a fully loaded workbook.
+        wb = openpyxl.load_workbook(str(source), read_only=True)
+        try:
+            return _import_workbook(wb)
+        finally:
+            wb.close()
+    return _import_workbook(source)
+
+
+def _import_workbook(wb) -> ImportedXlsx:
     _validate_meta_sheet(wb)
 
     header_rows = _get_header_rows(wb)
@@ -605,10 +648,12 @@ def _load_docs_from_paths(paths: Iterable[str | Path], model_cls) -> list[Any]:
     return out
 
 
-def _write_meta_sheet(wb) -> None:
-    ws = wb.create_sheet(_SHEET_META)
-    ws.append(["format", "version", "created_at", "header_rows"])
+def _write_meta_sheet(wb, *, styles: _XlsxStyles) -> None:
+    columns = ["format", "version", "created_at", "header_rows"]
+    ws = _XlsxSheetWriter(wb, _SHEET_META, columns, header_row=1, styles=styles)
+    ws.append(columns)
     ws.append([_WORKBOOK_FORMAT, _WORKBOOK_VERSION, _now_iso(), 2])
+    ws.close()
 
 
 def _validate_meta_sheet(wb) -> None:
@@ -668,30 +713,26 @@ def _get_header_rows(wb) -> int:
     return 2
 
 
-def _write_human_header(ws, columns: list[tuple[str, str, str]]) -> None:
-    """Write a two-row header.
+def _write_human_header(
+    wb, sheet_name: str, columns: list[tuple[str, str, str]], *, styles: _XlsxStyles
+) -> _XlsxSheetWriter:
+    """Create a mapping sheet and write its two-row header.
 
     Row 1: machine keys (hidden)
     Row 2: human labels (visible) + comments with descriptions
     """
 
-    from openpyxl.comments import Comment
-
-    ws.append([c[0] for c in columns])
-    ws.append([c[1] for c in columns])
-
-    ws.row_dimensions[1].hidden = True
-
-    for idx, (_, _, desc) in enumerate(columns, start=1):
-        if not desc:
-            continue
-        ws.cell(row=2, column=idx).comment = Comment(desc, "crml")
+    keys = [c[0] for c in columns]
+    ws = _XlsxSheetWriter(wb, sheet_name, keys, header_row=2, styles=styles)
+    ws.append(keys)
+    ws.append([c[1] for c in columns], comments=[c[2] for c in columns])
+    return ws
 
 
-def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog]) -> None:
-    ws = wb.create_sheet(_SHEET_CONTROL_CATALOGS)
-    _write_human_header(
-        ws,
+def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog], *, styles: _XlsxStyles) -> None:
+    ws = _write_human_header(
+        wb,
+        _SHEET_CONTROL_CATALOGS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC_EXAMPLE)
         + [
             ("catalog_id", "Catalog id", "Optional catalog identifier (catalog.id)."),
@@ -709,6 +750,7 @@ def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog]) -> None:
                 "Optional array as JSON (e.g. [\"prevent\",\"detect\"]).",
             ),
         ],
+        styles=styles,
     )
 
     for doc in docs:
@@ -739,12 +781,13 @@ def _write_control_catalogs_sheet(wb, docs: list[CRControlCatalog]) -> None:
                     _to_json_cell(entry.defense_in_depth_layers),
                 ]
             )
+    ws.close()
 
 
-def _write_attack_catalogs_sheet(wb, docs: list[CRAttackCatalog]) -> None:
-    ws = wb.create_sheet(_SHEET_ATTACK_CATALOGS)
-    _write_human_header(
-        ws,
+def _write_attack_catalogs_sheet(wb, docs: list[CRAttackCatalog], *, styles: _XlsxStyles) -> None:
+    ws = _write_human_header(
+        wb,
+        _SHEET_ATTACK_CATALOGS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC)
         + [
             ("catalog_id", "Catalog id", "Optional catalog identifier (catalog.id)."),
@@ -759,6 +802,7 @@ def _write_attack_catalogs_sheet(wb, docs: list[CRAttackCatalog]) -> None:
                 "Optional kill_chain_phases array as JSON (recommended '<kill_chain_name>:<phase_name>').",
             ),
         ],
+        styles=styles,
     )
 
     for doc in docs:
@@ -780,6 +824,7 @@ def _write_attack_catalogs_sheet(wb, docs: list[CRAttackCatalog]) -> None:
                     _to_json_cell(entry.kill_chain_phases),
                 ]
             )
+    ws.close()
 
 
 def _read_control_catalogs_sheet(wb, *, header_rows: int) -> list[CRControlCatalog]:
@@ -788,8 +833,9 @@ def _read_control_catalogs_sheet(wb, *, header_rows: int) -> list[CRControlCatal
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
 
+    row_view = _RowView(header)
     for row in body_rows:
-        data = dict(zip(header, row))
+        data = row_view.bind(row)
 
         doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
         if not doc_name:
@@ -826,7 +872,7 @@ def _read_control_catalogs_sheet(wb, *, header_rows: int) -> list[CRControlCatal
             }
         )
 
-    return [CRControlCatalog.model_validate(d) for d in out_by_doc.values()]
+    return [_validate_doc(CRControlCatalog, d) for d in out_by_doc.values()]
 
 
 def _read_attack_catalogs_sheet(wb, *, header_rows: int) -> list[CRAttackCatalog]:
@@ -835,8 +881,9 @@ def _read_attack_catalogs_sheet(wb, *, header_rows: int) -> list[CRAttackCatalog
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
 
+    row_view = _RowView(header)
     for row in body_rows:
-        data = dict(zip(header, row))
+        data = row_view.bind(row)
 
         doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
         if not doc_name:
@@ -882,13 +929,13 @@ def _read_attack_catalogs_sheet(wb, *, header_rows: int) -> list[CRAttackCatalog
             }
         )
 
-    return [CRAttackCatalog.model_validate(d) for d in out_by_doc.values()]
+    return [_validate_doc(CRAttackCatalog, d) for d in out_by_doc.values()]
 
 
-def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships]) -> None:
-    ws = wb.create_sheet(_SHEET_CONTROL_RELATIONSHIPS)
-    _write_human_header(
-        ws,
+def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships], *, styles: _XlsxStyles) -> None:
+    ws = _write_human_header(
+        wb,
+        _SHEET_CONTROL_RELATIONSHIPS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC)
         + [
             ("pack_id", "Pack id", "Optional relationship pack identifier (relationships.id)."),
@@ -911,6 +958,7 @@ def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships]) -
             ("description", "Description", "Optional free-form description."),
             ("references_json", "References (JSON)", "Optional references array as JSON."),
         ],
+        styles=styles,
     )
 
     def _row(meta, pack, rel, target) -> list[Any]:
@@ -945,6 +993,7 @@ def _write_control_relationships_sheet(wb, docs: list[CRControlRelationships]) -
         for rel in pack.relationships:
             for target in rel.targets:
                 ws.append(_row(meta, pack, rel, target))
+    ws.close()
 
 
 def _read_control_relationships_sheet(
@@ -955,8 +1004,9 @@ def _read_control_relationships_sheet(
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
 
+    row_view = _RowView(header)
     for row in body_rows:
-        data = dict(zip(header, row))
+        data = row_view.bind(row)
 
         doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
         if not doc_name:
@@ -1019,15 +1069,15 @@ def _read_control_relationships_sheet(
             }
         )
 
-    return [CRControlRelationships.model_validate(d) for d in out_by_doc.values()]
+    return [_validate_doc(CRControlRelationships, d) for d in out_by_doc.values()]
 
 
 def _write_attack_control_relationships_sheet(
-    wb, docs: list[CRAttackControlRelationships]
+    wb, docs: list[CRAttackControlRelationships], *, styles: _XlsxStyles
 ) -> None:
-    ws = wb.create_sheet(_SHEET_ATTACK_CONTROL_RELATIONSHIPS)
-    _write_human_header(
-        ws,
+    ws = _write_human_header(
+        wb,
+        _SHEET_ATTACK_CONTROL_RELATIONSHIPS,
         _doc_meta_columns(tags_desc=_DOC_TAGS_DESC)
         + [
             ("pack_id", "Pack id", "Optional relationship pack identifier (relationships.id)."),
@@ -1045,6 +1095,7 @@ def _write_attack_control_relationships_sheet(
             ("references_json", "References (JSON)", "Optional references array as JSON."),
             ("metadata_json", "Pack metadata (JSON)", "Optional pack-level metadata map as JSON."),
         ],
+        styles=styles,
     )
 
     for doc in docs:
@@ -1074,6 +1125,7 @@ def _write_attack_control_relationships_sheet(
                         _to_json_cell(pack.metadata),
                     ]
                 )
+    ws.close()
 
 
 def _read_attack_control_relationships_sheet(
@@ -1084,8 +1136,9 @@ def _read_attack_control_relationships_sheet(
         return []
     out_by_doc: dict[tuple[str, str | None, str | None, str | None, str | None], dict[str, Any]] = {}
 
+    row_view = _RowView(header)
     for row in body_rows:
-        data = dict(zip(header, row))
+        data = row_view.bind(row)
 
         doc_name, doc_version, doc_description, doc_tags = _read_doc_meta(data)
         if not doc_name:
@@ -1147,7 +1200,7 @@ def _read_attack_control_relationships_sheet(
             }
         )
 
-    return [CRAttackControlRelationships.model_validate(d) for d in out_by_doc.values()]
+    return [_validate_doc(CRAttackControlRelationships, d) for d in out_by_doc.values()]
 
 
 def write_imported_as_yaml(
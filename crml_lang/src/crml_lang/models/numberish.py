@@ -1,26 +1,24 @@
 from __future__ import annotations
 
+import re
 from typing import Iterable
 
 
+# Readability separators commonly used in YAML/JSON:
+# - regular space
+# - thin space (U+202F)
+# - underscore
+# - comma
+_NUMERIC_SEPARATORS = re.compile("[ \u202f_,]")
+
+
 def _clean_numeric_string(raw: str) -> str:
     """Normalize a numeric string by removing readability separators.
 
     Accepts common separators that users may include in YAML/JSON:
     spaces, thin spaces (U+202F), underscores, and commas.
     """
-    # Allow readability separators commonly used in YAML/JSON.
-    # - regular space
-    # - thin space (U+202F)
-    # - underscore
-    # - comma
-    return (
-        raw.strip()
-        .replace(" ", "")
-        .replace("\u202f", "")
-        .replace("_", "")
-        .replace(",", "")
-    )
+    return _NUMERIC_SEPARATORS.sub("", raw.strip())
 
 
 def parse_floatish(value, *, allow_percent: bool) -> float:
@@ -44,16 +42,25 @@ def parse_floatish(value, *, allow_percent: bool) -> float:
         return float(value)
 
     if isinstance(value, str):
-        s = _clean_numeric_string(value)
-        if not s:
-            raise ValueError("empty numeric string")
+        s = value.rstrip()
 
+        # Decide percent handling from the last character before any parsing,
+        # so percent strings never pay for a failed float() attempt.
         if s.endswith("%"):
             if not allow_percent:
                 raise ValueError("percent values are not allowed here")
-            number_part = s[:-1]
-            return float(number_part) / 100.0
+            return float(_clean_numeric_string(s[:-1])) / 100.0
 
+        # Fast path: plain numbers ("0.5", "1e6", " 12") need no separator
+        # stripping. Anything float() accepts cleans to the same value.
+        try:
+            return float(s)
+        except ValueError:
+            pass
+
+        s = _clean_numeric_string(s)
+        if not s:
+            raise ValueError("empty numeric string")
         return float(s)
 
     raise TypeError(f"unsupported numeric type: {type(value).__name__}")
@@ -81,6 +88,10 @@ def parse_intish(value) -> int:
         raise ValueError("expected an integer")
 
     if isinstance(value, str):
+        # Fast path: plain ASCII/Unicode decimal digits.
+        if value.isdecimal():
+            return int(value)
+
         s = _clean_numeric_string(value)
         if not s:
             raise ValueError("empty integer string")
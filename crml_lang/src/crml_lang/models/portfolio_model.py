@@ -24,7 +24,10 @@ class CriticalityIndex(BaseModel):
 class Asset(BaseModel):
     name: str = Field(..., description="Unique asset name within the portfolio.")
     cardinality: int = Field(
-        ..., ge=1, description="Number of identical asset units represented by this asset entry (>= 1)."
+        ...,
+        ge=1,
+        strict=True,
+        description="Number of identical asset units represented by this asset entry (>= 1).",
     )
     criticality_index: Optional[CriticalityIndex] = Field(
         None, description="Optional criticality index configuration for this asset."
@@ -34,7 +37,11 @@ class Asset(BaseModel):
     @field_validator("cardinality", mode="before")
     @classmethod
     def _parse_cardinality(cls, v):
-        return parse_intish(v)
+        # Only numberish strings (e.g. "10 000") need parsing. Everything else
+        # goes straight to the strict int check, which rejects floats and bools.
+        if isinstance(v, str):
+            return parse_intish(v)
+        return v
 
 
 PortfolioMethod = Literal["sum", "mixture", "choose_one", "max"]
@@ -14,9 +14,10 @@ Consequences:
     defined in a separate portfolio schema/model.
 """
 
+import sys
 from typing import Annotated, Any, Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.json_schema import WithJsonSchema
 
 from .numberish import parse_floatish, parse_float_list
@@ -190,6 +191,11 @@ class Evidence(BaseModel):
 # --- Model: Frequency ---
 FrequencyBasis = Literal["per_organization_per_year", "per_asset_unit_per_year"]
 
+# Engine-defined model identifiers form an open set, so they stay plain strings
+# rather than Literals. They repeat across every scenario, so equal values are
+# interned to share one object.
+ModelId = Annotated[str, AfterValidator(sys.intern)]
+
 # Constant for repeated frequency parameter description
 FREQUENCY_PARAM_DESC = "Frequency model parameter (model-specific)."
 
@@ -229,7 +235,7 @@ class Frequency(BaseModel):
         "per_organization_per_year",
         description="Frequency basis/denominator (e.g. per-organization-year, per-asset-unit-year).",
     )
-    model: str = Field(
+    model: ModelId = Field(
         "poisson",
         description=(
             "Frequency distribution/model identifier (engine-defined). "
@@ -308,7 +314,7 @@ class SeverityParameters(BaseModel):
 
 
 class Severity(BaseModel):
-    model: str = Field(..., description="Severity distribution/model identifier (engine-defined).")
+    model: ModelId = Field(..., description="Severity distribution/model identifier (engine-defined).")
     parameters: SeverityParameters = Field(..., description="Model parameters for the selected severity model.")
     components: Optional[List[Dict[str, Any]]] = Field(
         None,
@@ -2,15 +2,13 @@ from __future__ import annotations
 
 from typing import Any, Literal, Optional
 
-from jsonschema import Draft202012Validator
-
 from .common import (
     ValidationMessage,
     ValidationReport,
     ASSESSMENT_SCHEMA_PATH,
     ROOT_PATH,
     _load_input,
-    _load_assessment_schema,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
 )
@@ -36,7 +34,7 @@ def _wrap_messages(messages: list[ValidationMessage], *, prefix: str) -> list[Va
 def _validate_against_schema(data: dict[str, Any]) -> list[ValidationMessage]:
     """Validate assessment data against the JSON schema."""
     try:
-        schema = _load_assessment_schema()
+        validator = _schema_validator(ASSESSMENT_SCHEMA_PATH)
     except FileNotFoundError:
         return [
             ValidationMessage(
@@ -47,7 +45,6 @@ def _validate_against_schema(data: dict[str, Any]) -> list[ValidationMessage]:
             )
         ]
 
-    validator = Draft202012Validator(schema)
     out: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
         out.append(
@@ -108,12 +105,18 @@ def _collect_assessment_ids(data: dict[str, Any]) -> tuple[list[str], list[Valid
 
 def _check_duplicate_ids(ids: list[str]) -> Optional[ValidationMessage]:
     """Return an error if the id list contains duplicates."""
-    if len(ids) == len(set(ids)):
+    seen: set[str] = set()
+    for cid in ids:
+        if cid in seen:
+            break
+        seen.add(cid)
+    else:
         return None
     return ValidationMessage(
         level="error",
         source="semantic",
         path="assessment -> assessments",
+        code="assessment.duplicate_ids",
         message="Assessment contains duplicate control ids.",
     )
 
@@ -164,6 +167,7 @@ def _check_ids_in_catalogs(ids: list[str], catalog_ids: set[str]) -> list[Valida
                 level="error",
                 source="semantic",
                 path="assessment -> assessments -> id",
+                code="assessment.unknown_control_id",
                 message=(
                     f"Assessment references unknown control id '{cid}' (not found in provided control catalog(s))."
                 ),
@@ -2,23 +2,22 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from jsonschema import Draft202012Validator
-
 from .common import (
     ValidationMessage,
     ValidationReport,
     ATTACK_CATALOG_SCHEMA_PATH,
     _load_input,
-    _load_attack_catalog_schema,
+    _SchemaValidator,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
 )
 
 
-def _load_schema_or_error() -> tuple[dict[str, Any] | None, list[ValidationMessage]]:
-    """Load the attack catalog schema, returning a structured error on failure."""
+def _load_schema_or_error() -> tuple[_SchemaValidator | None, list[ValidationMessage]]:
+    """Load the attack catalog schema validator, returning a structured error on failure."""
     try:
-        return _load_attack_catalog_schema(), []
+        return _schema_validator(ATTACK_CATALOG_SCHEMA_PATH), []
     except FileNotFoundError:
         return (
             None,
@@ -33,9 +32,8 @@ def _load_schema_or_error() -> tuple[dict[str, Any] | None, list[ValidationMessa
         )
 
 
-def _schema_validation_errors(schema: dict[str, Any], data: dict[str, Any]) -> list[ValidationMessage]:
-    """Validate data against the provided JSON schema and return errors."""
-    validator = Draft202012Validator(schema)
+def _schema_validation_errors(validator: _SchemaValidator, data: dict[str, Any]) -> list[ValidationMessage]:
+    """Validate data with the provided JSON schema validator and return errors."""
     errors: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
         errors.append(
@@ -58,13 +56,17 @@ def _semantic_attack_id_errors(data: dict[str, Any]) -> list[ValidationMessage]:
         return []
 
     errors: list[ValidationMessage] = []
-    ids: list[str] = []
+    seen: set[str] = set()
+    has_duplicates = False
     for idx, attack in enumerate(attacks):
         if not isinstance(attack, dict):
             continue
         aid = attack.get("id")
         if isinstance(aid, str):
-            ids.append(aid)
+            if aid in seen:
+                has_duplicates = True
+            else:
+                seen.add(aid)
             continue
         errors.append(
             ValidationMessage(
@@ -75,12 +77,13 @@ def _semantic_attack_id_errors(data: dict[str, Any]) -> list[ValidationMessage]:
             )
         )
 
-    if len(ids) != len(set(ids)):
+    if has_duplicates:
         errors.append(
             ValidationMessage(
                 level="error",
                 source="semantic",
                 path="catalog -> attacks",
+                code="attack_catalog.duplicate_ids",
                 message="Attack catalog contains duplicate attack ids.",
             )
         )
@@ -120,12 +123,12 @@ def validate_attack_catalog(
         return ValidationReport(ok=False, errors=io_errors, warnings=[])
     assert data is not None
 
-    schema, schema_errors = _load_schema_or_error()
+    validator, schema_errors = _load_schema_or_error()
     if schema_errors:
         return ValidationReport(ok=False, errors=schema_errors, warnings=[])
-    assert schema is not None
+    assert validator is not None
 
-    errors = _schema_validation_errors(schema, data)
+    errors = _schema_validation_errors(validator, data)
 
     warnings: list[ValidationMessage] = []
 
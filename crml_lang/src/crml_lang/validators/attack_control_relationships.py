@@ -2,14 +2,12 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from jsonschema import Draft202012Validator
-
 from .common import (
     ValidationMessage,
     ValidationReport,
     ATTACK_CONTROL_RELATIONSHIPS_SCHEMA_PATH,
     _load_input,
-    _load_attack_control_relationships_schema,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
 )
@@ -17,7 +15,7 @@ from .common import (
 
 def _schema_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessage]:
     """Validate attack-control relationships data against the JSON schema and return errors."""
-    validator = Draft202012Validator(_load_attack_control_relationships_schema())
+    validator = _schema_validator(ATTACK_CONTROL_RELATIONSHIPS_SCHEMA_PATH)
     errors: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
         errors.append(
@@ -147,6 +145,7 @@ def _semantic_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessa
                 level="error",
                 source="semantic",
                 path="relationships -> relationships",
+                code="attack_control_relationships.duplicate_attacks",
                 message="Attack-control relationships document contains duplicate attacks; group all targets under one attack.",
             )
         )
@@ -158,6 +157,7 @@ def _semantic_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessa
                 level="error",
                 source="semantic",
                 path="relationships -> relationships",
+                code="attack_control_relationships.duplicate_mappings",
                 message="Attack-control relationships document contains duplicate (attack,control,relationship_type) mappings.",
             )
         )
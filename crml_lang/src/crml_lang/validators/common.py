@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import json
 import os
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Iterator, Literal, Optional
+
+from jsonschema import Draft202012Validator, ValidationError
+
+try:
+    import fastjsonschema  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    fastjsonschema = None
 
 from ..yamlio import load_yaml_mapping_from_str
 
@@ -29,13 +37,19 @@ CONTROL_RELATIONSHIPS_SCHEMA_PATH = str(_SCHEMA_DIR / "crml-control-relationship
 
 @dataclass(frozen=True)
 class ValidationMessage:
-    """A single validation message (error or warning)."""
+    """A single validation message (error or warning).
+
+    `code` is a stable identifier for semantic checks (e.g.
+    ``"portfolio.weights_sum"``). Prefer matching on it over the message text,
+    which is meant for humans and may change.
+    """
 
     level: Literal["error", "warning"]
     message: str
     path: str = ROOT_PATH
     source: Literal["schema", "semantic", "pydantic", "io"] = "schema"
     validator: Optional[str] = None
+    code: Optional[str] = None
 
 
 @dataclass(frozen=True)
@@ -72,45 +86,99 @@ def _load_schema(path: str) -> dict[str, Any]:
         return json.load(f)
 
 
-def _load_scenario_schema() -> dict[str, Any]:
-    """Load the CRML Scenario JSON schema as a dict."""
-    return _load_schema(SCENARIO_SCHEMA_PATH)
-
-
-def _load_portfolio_schema() -> dict[str, Any]:
-    """Load the CRML Portfolio JSON schema as a dict."""
-    return _load_schema(PORTFOLIO_SCHEMA_PATH)
-
+# fastjsonschema implements drafts 04-07 only, so the pre-check compiles the
+# schemas as draft-07. The two drafts agree on every keyword below; a schema
+# using any other keyword, an array-form `items`, or a `$ref` with validating
+# siblings (ignored by draft-07) gets no pre-check.
+_FAST_CHECK_DRAFT = "http://json-schema.org/draft-07/schema#"
+_FAST_CHECK_KEYWORDS = frozenset(
+    {
+        "$defs", "$ref", "additionalProperties", "allOf", "anyOf", "const", "default",
+        "description", "enum", "examples", "exclusiveMaximum", "exclusiveMinimum",
+        "format", "items", "maxItems", "maxLength", "maximum", "minItems", "minLength",
+        "minimum", "multipleOf", "not", "oneOf", "pattern", "properties", "required",
+        "title", "type", "uniqueItems",
+    }
+)
+_FAST_CHECK_ANNOTATIONS = frozenset({"description", "title", "default", "examples"})
+
+
+def _fast_check_compatible(node: Any) -> bool:
+    """Return whether `node` means the same under draft-07 and Draft 2020-12."""
+    if isinstance(node, list):
+        return all(_fast_check_compatible(x) for x in node)
+    if not isinstance(node, dict):
+        return True
+    if not _FAST_CHECK_KEYWORDS.issuperset(node):
+        return False
+    if "$ref" in node and not _FAST_CHECK_ANNOTATIONS.issuperset(set(node) - {"$ref"}):
+        return False
+    if isinstance(node.get("items"), list):
+        return False
+    for key, value in node.items():
+        if key in ("properties", "$defs"):
+            if not all(_fast_check_compatible(v) for v in value.values()):
+                return False
+        elif key in ("default", "examples", "enum", "const"):
+            continue
+        elif not _fast_check_compatible(value):
+            return False
+    return True
 
-def _load_portfolio_bundle_schema() -> dict[str, Any]:
-    """Load the CRML Portfolio Bundle JSON schema as a dict."""
-    return _load_schema(PORTFOLIO_BUNDLE_SCHEMA_PATH)
 
+class _SchemaValidator:
+    """Draft 2020-12 validator with an optional compiled pre-check.
 
-def _load_assessment_schema() -> dict[str, Any]:
-    """Load the CRML Assessment JSON schema as a dict.
+    When `fastjsonschema` is installed (``pip install 'crml-lang[fast]'``), the
+    schema is also compiled to a Python function, pinned to draft-07 (see
+    `_fast_check_compatible`). Documents it accepts yield no errors without
+    walking the `jsonschema` evaluation tree; anything it rejects (or cannot
+    handle) is re-validated by `jsonschema`, so reported errors and their
+    messages are unchanged. The pre-check neither fills in defaults nor
+    checks `format`, matching `Draft202012Validator`.
     """
-    return _load_schema(ASSESSMENT_SCHEMA_PATH)
 
-
-def _load_control_catalog_schema() -> dict[str, Any]:
-    """Load the CRML Control Catalog JSON schema as a dict."""
-    return _load_schema(CONTROL_CATALOG_SCHEMA_PATH)
-
-
-def _load_attack_catalog_schema() -> dict[str, Any]:
-    """Load the CRML Attack Catalog JSON schema as a dict."""
-    return _load_schema(ATTACK_CATALOG_SCHEMA_PATH)
-
-
-def _load_attack_control_relationships_schema() -> dict[str, Any]:
-    """Load the CRML Attack-to-Control Relationships JSON schema as a dict."""
-    return _load_schema(ATTACK_CONTROL_RELATIONSHIPS_SCHEMA_PATH)
-
-
-def _load_control_relationships_schema() -> dict[str, Any]:
-    """Load the CRML Control Relationships JSON schema as a dict."""
-    return _load_schema(CONTROL_RELATIONSHIPS_SCHEMA_PATH)
+    __slots__ = ("_validator", "_fast_check")
+
+    def __init__(self, schema: dict[str, Any]) -> None:
+        self._validator = Draft202012Validator(schema)
+        self._fast_check: Optional[Callable[[Any], Any]] = None
+        if fastjsonschema is not None and _fast_check_compatible(schema):
+            try:
+                self._fast_check = fastjsonschema.compile(
+                    {**schema, "$schema": _FAST_CHECK_DRAFT},
+                    use_default=False,
+                    use_formats=False,
+                )
+            except Exception:  # pragma: no cover - unsupported schema construct
+                self._fast_check = None
+
+    def _fast_accepts(self, data: Any) -> bool:
+        if self._fast_check is None:
+            return False
+        try:
+            self._fast_check(data)
+        except Exception:
+            return False
+        return True
+
+    def iter_errors(self, data: Any) -> Iterator[ValidationError]:
+        if self._fast_accepts(data):
+            return iter(())
+        return self._validator.iter_errors(data)
+
+
+@lru_cache(maxsize=None)
+def _schema_validator(path: str) -> _SchemaValidator:
+    """Return the validator for the schema file at `path`.
+
+    The schema is read and the validator built once per process; validators
+    are stateless across `iter_errors` calls, so one instance is shared.
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist (not cached).
+    """
+    return _SchemaValidator(_load_schema(path))
 
 
 def _looks_like_yaml_text(s: str) -> bool:
@@ -119,15 +187,15 @@ def _looks_like_yaml_text(s: str) -> bool:
     return "\n" in s or ":" in s
 
 
-def _error(message: str, *, path: str = ROOT_PATH) -> list[ValidationMessage]:
+def _error(message: str, *, path: str = ROOT_PATH, code: Optional[str] = None) -> list[ValidationMessage]:
     """Create a single IO-scoped validation error."""
-    return [ValidationMessage(level="error", source="io", path=path, message=message)]
+    return [ValidationMessage(level="error", source="io", path=path, message=message, code=code)]
 
 
 def _read_text_file(path: str) -> tuple[Optional[str], list[ValidationMessage]]:
     """Read a UTF-8 text file and return (text, errors)."""
     if not os.path.exists(path):
-        return None, _error(f"File not found: {path}")
+        return None, _error(f"File not found: {path}", code="io.file_not_found")
     try:
         with open(path, "r", encoding="utf-8") as f:
             return f.read(), []
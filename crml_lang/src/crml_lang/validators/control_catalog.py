@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from jsonschema import Draft202012Validator
 from pydantic import ValidationError
 
 from .common import (
@@ -10,7 +9,7 @@ from .common import (
     ValidationReport,
     CONTROL_CATALOG_SCHEMA_PATH,
     _load_input,
-    _load_control_catalog_schema,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
 )
@@ -20,7 +19,7 @@ ROOT_PATH = "(root)"
 
 
 def _validate_control_catalog_schema(data: dict[str, Any]) -> list[ValidationMessage]:
-    validator = Draft202012Validator(_load_control_catalog_schema())
+    validator = _schema_validator(CONTROL_CATALOG_SCHEMA_PATH)
     errors: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
         errors.append(
@@ -41,7 +40,8 @@ def _semantic_validate_control_catalog(data: dict[str, Any]) -> list[ValidationM
     if not isinstance(controls, list):
         return []
 
-    ids: list[str] = []
+    seen: set[str] = set()
+    has_duplicates = False
     errors: list[ValidationMessage] = []
 
     for idx, control in enumerate(controls):
@@ -49,7 +49,10 @@ def _semantic_validate_control_catalog(data: dict[str, Any]) -> list[ValidationM
             continue
         cid = control.get("id")
         if isinstance(cid, str):
-            ids.append(cid)
+            if cid in seen:
+                has_duplicates = True
+            else:
+                seen.add(cid)
             continue
 
         errors.append(
@@ -61,12 +64,13 @@ def _semantic_validate_control_catalog(data: dict[str, Any]) -> list[ValidationM
             )
         )
 
-    if len(ids) != len(set(ids)):
+    if has_duplicates:
         errors.append(
             ValidationMessage(
                 level="error",
                 source="semantic",
                 path="catalog -> controls",
+                code="control_catalog.duplicate_ids",
                 message="Control catalog contains duplicate control ids.",
             )
         )
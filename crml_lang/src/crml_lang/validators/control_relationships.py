@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Literal
-
-from jsonschema import Draft202012Validator
+from typing import Any, Literal, Optional
 
 from .common import (
     ValidationMessage,
     ValidationReport,
     CONTROL_RELATIONSHIPS_SCHEMA_PATH,
     _load_input,
-    _load_control_relationships_schema,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
 )
@@ -17,7 +15,7 @@ from .common import (
 
 def _schema_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessage]:
     """Validate relationships data against the JSON schema and return errors."""
-    validator = Draft202012Validator(_load_control_relationships_schema())
+    validator = _schema_validator(CONTROL_RELATIONSHIPS_SCHEMA_PATH)
     errors: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
         errors.append(
@@ -32,13 +30,14 @@ def _schema_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessage
     return errors
 
 
-def _semantic_error(*, path: str, message: str) -> ValidationMessage:
+def _semantic_error(*, path: str, message: str, code: Optional[str] = None) -> ValidationMessage:
     """Helper to build a semantic validation error at a given path."""
     return ValidationMessage(
         level="error",
         source="semantic",
         path=path,
         message=message,
+        code=code,
     )
 
 
@@ -87,6 +86,7 @@ def _validate_relationship_target_entry(
         errors.append(
             _semantic_error(
                 path=f"relationships -> relationships -> {rel_index} -> targets -> {target_index}",
+                code="control_relationships.self_relationship",
                 message="Relationship source and target must not be the same control id.",
             )
         )
@@ -171,6 +171,7 @@ def _semantic_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessa
                 level="error",
                 source="semantic",
                 path="relationships -> relationships",
+                code="control_relationships.duplicate_sources",
                 message="Control relationships document contains duplicate sources; group all targets under one source.",
             )
         )
@@ -182,6 +183,7 @@ def _semantic_validation_errors(*, data: dict[str, Any]) -> list[ValidationMessa
                 level="error",
                 source="semantic",
                 path="relationships -> relationships",
+                code="control_relationships.duplicate_mappings",
                 message="Control relationships document contains duplicate (source,target,relationship_type) mappings.",
             )
         )
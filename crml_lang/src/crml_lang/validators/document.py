@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import re
 from typing import Any, Literal
 
 from .common import ValidationMessage, ValidationReport, _load_input
@@ -39,6 +41,33 @@ def _detect_kind(data: dict[str, Any]) -> str | None:
     return None
 
 
+# Top-level keys of a block-style YAML mapping start in column 0; nested keys,
+# block scalars and continuation lines are always indented.
+_TOP_LEVEL_VERSION_KEY_RE = re.compile(r"^(crml_[a-z_]+)[ \t]*:", re.MULTILINE)
+
+
+def _detect_kind_from_yaml_text(text: str) -> str | None:
+    """Detect the document kind from top-level version keys without parsing YAML.
+
+    Returns None when no key is found in column 0 (e.g. flow-style or quoted
+    keys), so callers fall back to a full parse.
+    """
+    keys = _TOP_LEVEL_VERSION_KEY_RE.findall(text)
+    if not keys:
+        return None
+    return _detect_kind(dict.fromkeys(keys))
+
+
+def _sniff_kind_from_path(source: str, source_kind: str | None) -> str | None:
+    if source_kind not in ("path", None) or not os.path.isfile(source):
+        return None
+    try:
+        with open(source, "r", encoding="utf-8") as f:
+            return _detect_kind_from_yaml_text(f.read())
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def validate_document(
     source: str | dict[str, Any],
     *,
@@ -51,12 +80,16 @@ def validate_document(
     top-level version keys (e.g. `crml_scenario`, `crml_portfolio`, `crml_control_catalog`, ...).
     """
 
-    data, io_errors = _load_input(source, source_kind=source_kind)
-    if io_errors:
-        return ValidationReport(ok=False, errors=io_errors, warnings=[])
-    assert data is not None
+    # Files are dispatched on their version key without a YAML parse; the
+    # type-specific validator parses the document anyway.
+    kind = _sniff_kind_from_path(source, source_kind) if isinstance(source, str) else None
+    if kind is None:
+        data, io_errors = _load_input(source, source_kind=source_kind)
+        if io_errors:
+            return ValidationReport(ok=False, errors=io_errors, warnings=[])
+        assert data is not None
+        kind = _detect_kind(data)
 
-    kind = _detect_kind(data)
     if kind is None:
         return ValidationReport(
             ok=False,
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Literal
 import os
 
-from jsonschema import Draft202012Validator
-
 from .common import (
     ValidationMessage,
     ValidationReport,
     PORTFOLIO_SCHEMA_PATH,
     _load_input,
-    _load_portfolio_schema,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
     _control_ids_from_controls,
@@ -51,16 +50,30 @@ def _norm_list(v: Any) -> set[str]:
     return {x for x in out if x}
 
 
+@lru_cache(maxsize=256)
+def _norm_namespace(ns: str) -> str:
+    """Normalize a control id namespace; namespaces repeat across ids, so memoize."""
+    return _norm_token(ns)
+
+
+def _control_id_namespace(cid: str) -> tuple[str, str]:
+    """Return ``(namespace, normalized namespace)`` of a canonical control id.
+
+    Ids without a ``:`` have no namespace and yield ``("", "")``.
+    """
+    ns, sep, _ = cid.partition(":")
+    if not sep:
+        return "", ""
+    return ns, _norm_namespace(ns)
+
+
 def _namespaces_from_control_ids(control_ids: set[str]) -> set[str]:
     """Extract normalized namespaces from canonical control ids (namespace:key)."""
     out: set[str] = set()
     for cid in control_ids:
         if not isinstance(cid, str):
             continue
-        if ":" not in cid:
-            continue
-        ns = cid.split(":", 1)[0]
-        ns_norm = _norm_token(ns)
+        ns_norm = _control_id_namespace(cid)[1]
         if ns_norm:
             out.add(ns_norm)
     return out
@@ -581,18 +594,28 @@ def _weight_semantic_checks(method: Any, scenarios: list[Any]) -> list[Validatio
     if method not in ("mixture", "choose_one"):
         return messages
 
+    # One pass collects missing weights and the running sum of present ones.
+    # The sum check is skipped (as before) if any weight is not numeric.
     missing_weight_idx: list[int] = []
+    weight_sum: float | None = 0.0
     for idx, sc in enumerate(scenarios):
         if not isinstance(sc, dict):
             continue
-        if sc.get("weight") is None:
+        weight = sc.get("weight")
+        if weight is None:
             missing_weight_idx.append(idx)
+        elif weight_sum is not None:
+            try:
+                weight_sum += float(weight)
+            except Exception:
+                weight_sum = None
     if missing_weight_idx:
         messages.append(
             ValidationMessage(
                 level="error",
                 source="semantic",
                 path="portfolio -> scenarios",
+                code="portfolio.weight_missing",
                 message=(
                     f"All scenarios must define 'weight' when portfolio.semantics.method is '{method}'. "
                     f"Missing at indices: {missing_weight_idx}"
@@ -600,22 +623,16 @@ def _weight_semantic_checks(method: Any, scenarios: list[Any]) -> list[Validatio
             )
         )
 
-    try:
-        weight_sum = 0.0
-        for sc in scenarios:
-            if isinstance(sc, dict) and sc.get("weight") is not None:
-                weight_sum += float(sc["weight"])
-        if abs(weight_sum - 1.0) > 1e-9:
-            messages.append(
-                ValidationMessage(
-                    level="error",
-                    source="semantic",
-                    path="portfolio -> scenarios -> weight",
-                    message=f"Scenario weights must sum to 1.0 for method '{method}' (got {weight_sum}).",
-                )
+    if weight_sum is not None and abs(weight_sum - 1.0) > 1e-9:
+        messages.append(
+            ValidationMessage(
+                level="error",
+                source="semantic",
+                path="portfolio -> scenarios -> weight",
+                code="portfolio.weights_sum",
+                message=f"Scenario weights must sum to 1.0 for method '{method}' (got {weight_sum}).",
             )
-    except Exception:
-        pass
+        )
 
     return messages
 
@@ -654,6 +671,7 @@ def _relationship_check_correlation(
                     level="error",
                     source="semantic",
                     path=f"portfolio -> relationships -> {idx} -> between -> {j}",
+                    code="portfolio.relationship_unknown_scenario",
                     message=f"Unknown scenario id referenced in relationship: {sid}",
                 )
             )
@@ -678,6 +696,7 @@ def _relationship_check_conditional(
                     level="error",
                     source="semantic",
                     path=f"portfolio -> relationships -> {idx} -> {key}",
+                    code="portfolio.relationship_unknown_scenario",
                     message=f"Unknown scenario id referenced in relationship: {sid}",
                 )
             )
@@ -747,6 +766,7 @@ def _relevance_overlap_errors(
             level="error",
             source="semantic",
             path=f"portfolio -> scenarios -> {idx} -> path",
+            code="portfolio.scenario_not_relevant",
             message=(
                 f"Scenario '{scenario_id}' is not relevant for this portfolio based on {label}. "
                 f"Portfolio has {sorted(pset)}, scenario declares {sorted(sset)}."
@@ -780,14 +800,14 @@ def _relevance_control_namespace_warnings(
     messages: list[ValidationMessage] = []
     scenario_control_ids = _control_ids_from_controls(scenario_doc.scenario.controls or [])
     for cid in sorted(scenario_control_ids):
-        ns = cid.split(":", 1)[0] if ":" in cid else ""
-        ns_norm = _norm_token(ns)
+        ns, ns_norm = _control_id_namespace(cid)
         if ns_norm and ns_norm not in scenario_frameworks:
             messages.append(
                 ValidationMessage(
                     level="warning",
                     source="semantic",
                     path=f"portfolio -> scenarios -> {idx} -> path",
+                    code="portfolio.scenario_control_namespace_undeclared",
                     message=(
                         f"Scenario '{scenario_id}' references control id '{cid}' with namespace '{ns}', "
                         "but scenario meta.regulatory_frameworks does not declare that namespace."
@@ -800,19 +820,18 @@ def _relevance_control_namespace_warnings(
 def _load_scenario_doc(resolved_path: str) -> tuple[Any | None, str | None]:
     """Load a scenario YAML file and validate it as a CRScenario.
 
+    Goes through `CRScenario.load_from_yaml`, which caches validated models by
+    a digest of the file content. A scenario shared by several portfolios (or
+    re-checked by the planner) is therefore parsed and validated once; clear it
+    with `CRScenario.cache_clear()`.
+
     Returns:
         (scenario_doc, error_message). If loading/validation fails, scenario_doc is None.
     """
     try:
-        import yaml
-
-        with open(resolved_path, "r", encoding="utf-8") as f:
-            scenario_data = yaml.safe_load(f)
-
-        from ..models.scenario_model import CRScenario
+        from ..api import CRScenario
 
-        scenario_doc = CRScenario.model_validate(scenario_data)
-        return scenario_doc, None
+        return CRScenario.load_from_yaml(resolved_path), None
     except Exception as e:
         return None, str(e)
 
@@ -893,6 +912,7 @@ def _frequency_binding_warnings(
                 level="warning",
                 source="semantic",
                 path=f"portfolio -> scenarios -> {idx} -> binding -> applies_to_assets",
+                code="portfolio.binding_ignored_for_organization_basis",
                 message=(
                     "Scenario frequency basis is 'per_organization_per_year'; asset binding does not affect frequency scaling "
                     "(expected annual event count is not multiplied by exposure). "
@@ -915,6 +935,7 @@ def _frequency_binding_warnings(
                     level="warning",
                     source="semantic",
                     path=f"portfolio -> scenarios -> {idx} -> binding -> applies_to_assets",
+                    code="portfolio.binding_zero_exposure",
                     message=(
                         "Scenario frequency basis is 'per_asset_unit_per_year' but total bound exposure E=0 (no assets bound). "
                         "Add portfolio.assets and/or bind this scenario to one or more assets."
@@ -935,14 +956,14 @@ def _portfolio_control_namespace_alignment(
     if not portfolio_frameworks or not portfolio_control_ids:
         return messages
     for cid in sorted(portfolio_control_ids):
-        ns = cid.split(":", 1)[0] if ":" in cid else ""
-        ns_norm = _norm_token(ns)
+        ns, ns_norm = _control_id_namespace(cid)
         if ns_norm and ns_norm not in portfolio_frameworks:
             messages.append(
                 ValidationMessage(
                     level="error",
                     source="semantic",
                     path=_PATH_PORTFOLIO_CONTROLS_ID,
+                    code="portfolio.control_namespace_undeclared",
                     message=(
                         f"Portfolio control id '{cid}' uses namespace '{ns}', but meta.regulatory_frameworks does not declare it. "
                         "Either add the framework namespace to meta.regulatory_frameworks or adjust the control ids."
@@ -968,6 +989,7 @@ def _scenario_control_mapping_checks(
                 level="error",
                 source="semantic",
                 path=_PATH_PORTFOLIO_CONTROLS,
+                code="portfolio.no_control_inventory",
                 message=(
                     "Scenario(s) reference controls but no control inventory is available. "
                     "Provide portfolio.controls or reference assessments."
@@ -983,6 +1005,7 @@ def _scenario_control_mapping_checks(
                     level="error",
                     source="semantic",
                     path=f"portfolio -> scenarios -> {scenario_idx} -> path",
+                    code="portfolio.control_not_in_inventory",
                     message=(
                         f"Scenario references control id '{cid}' but it is not present in portfolio.controls. "
                         "Add it (e.g. implementation_effectiveness: 0.0) to make the mapping explicit."
@@ -1090,6 +1113,7 @@ def _validate_controls_exist_in_catalog(
             level="error",
             source="semantic",
             path=_PATH_PORTFOLIO_CONTROLS_ID,
+            code="portfolio.unknown_control_id",
             message=f"Portfolio references unknown control id '{cid}' (not found in referenced control catalog(s)).",
         )
         for cid in missing
@@ -1339,7 +1363,7 @@ def validate_portfolio(
     assert data is not None
 
     try:
-        schema = _load_portfolio_schema()
+        validator = _schema_validator(PORTFOLIO_SCHEMA_PATH)
     except FileNotFoundError:
         return ValidationReport(
             ok=False,
@@ -1354,7 +1378,6 @@ def validate_portfolio(
             warnings=[],
         )
 
-    validator = Draft202012Validator(schema)
     errors: list[ValidationMessage] = []
     warnings: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from jsonschema import Draft202012Validator
-
 from .common import (
     PORTFOLIO_BUNDLE_SCHEMA_PATH,
     ValidationMessage,
@@ -11,7 +9,7 @@ from .common import (
     _format_jsonschema_error,
     _jsonschema_path,
     _load_input,
-    _load_portfolio_bundle_schema,
+    _schema_validator,
 )
 
 
@@ -37,8 +35,7 @@ def _warn_non_current_version(*, data: dict[str, Any], warnings: list[Validation
 
 def _schema_errors(data: dict[str, Any]) -> list[ValidationMessage]:
     """Validate portfolio bundle data against the JSON schema and return errors."""
-    schema = _load_portfolio_bundle_schema()
-    validator = Draft202012Validator(schema)
+    validator = _schema_validator(PORTFOLIO_BUNDLE_SCHEMA_PATH)
 
     errors: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
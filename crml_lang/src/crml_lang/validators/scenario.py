@@ -2,14 +2,12 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from jsonschema import Draft202012Validator
-
 from .common import (
     ValidationMessage,
     ValidationReport,
     SCENARIO_SCHEMA_PATH,
     _load_input,
-    _load_scenario_schema,
+    _schema_validator,
     _jsonschema_path,
     _format_jsonschema_error,
     _control_ids_from_controls,
@@ -131,6 +129,7 @@ def _warn_duplicate_scenario_control_ids(*, scenario: dict[str, Any], warnings:
                 level="warning",
                 source="semantic",
                 path="scenario -> controls",
+                code="scenario.duplicate_control_ids",
                 message="Scenario 'controls' contains duplicate control ids.",
             )
         )
@@ -138,8 +137,7 @@ def _warn_duplicate_scenario_control_ids(*, scenario: dict[str, Any], warnings:
 
 def _schema_errors(data: dict[str, Any]) -> list[ValidationMessage]:
     """Validate scenario data against the JSON schema and return errors."""
-    schema = _load_scenario_schema()
-    validator = Draft202012Validator(schema)
+    validator = _schema_validator(SCENARIO_SCHEMA_PATH)
 
     errors: list[ValidationMessage] = []
     for err in validator.iter_errors(data):
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
-from typing import Any
+import hashlib
+import json
+import logging
+import os
+from typing import IO, Any, Optional
 
 
 _ERR_PYYAML_REQUIRED = "PyYAML is required: pip install pyyaml"
 
+# Set to "python" to force PyYAML's pure-Python loader/dumper. Any other value
+# (including the default "libyaml") uses the libyaml C bindings when PyYAML
+# was built with them.
+YAML_BACKEND_ENV = "CRML_YAML_BACKEND"
+
+# Opt-in: directory where parsed YAML files are cached as JSON, keyed by a
+# BLAKE2b digest of the file bytes (see `load_yaml_mapping_from_path`,
+# `load_yaml_mapping_from_bytes` and the `CR*.load_from_yaml` file loaders).
+YAML_JSON_CACHE_ENV = "CRML_YAML_JSON_CACHE_DIR"
+
+_logger = logging.getLogger(__name__)
+_libyaml_missing_logged = False
+
 
 def _yaml_module():
     """Import and return the PyYAML module.
@@ -22,35 +39,170 @@ def _yaml_module():
         raise ImportError(_ERR_PYYAML_REQUIRED) from e
 
 
-def load_yaml_mapping_from_str(text: str) -> dict[str, Any]:
-    """Parse YAML text and require a mapping/object at the root."""
+def _use_libyaml(yaml) -> bool:
+    """Whether to use the libyaml-backed safe loader/dumper.
+
+    Falls back to the pure-Python classes when PyYAML was built without
+    libyaml, logging a one-time warning since parsing is then several times
+    slower.
+    """
+    global _libyaml_missing_logged
+
+    if os.environ.get(YAML_BACKEND_ENV, "libyaml").strip().lower() == "python":
+        return False
+    if getattr(yaml, "__with_libyaml__", False):
+        return True
+    if not _libyaml_missing_logged:
+        _libyaml_missing_logged = True
+        _logger.warning(
+            "PyYAML was built without libyaml; using the slower pure-Python YAML loader. "
+            "Set %s=python to select it explicitly.",
+            YAML_BACKEND_ENV,
+        )
+    return False
+
+
+def _safe_loader(yaml):
+    return yaml.CSafeLoader if _use_libyaml(yaml) else yaml.SafeLoader
+
+
+def _safe_dumper(yaml):
+    return yaml.CSafeDumper if _use_libyaml(yaml) else yaml.SafeDumper
+
+
+def _safe_load(text: str | IO[str]) -> Any:
+    """Parse YAML text (or a text stream) with the safe loader.
+
+    All YAML parsing in this module goes through this helper.
+    """
 
     yaml = _yaml_module()
-    data = yaml.safe_load(text)
+    return yaml.load(text, Loader=_safe_loader(yaml))
+
+
+def load_yaml_from_str(text: str) -> Any:
+    """Parse YAML text with the safe loader (any top-level type)."""
+
+    return _safe_load(text)
+
 
+def _require_mapping(data: Any) -> dict[str, Any]:
     if not isinstance(data, dict):
         raise ValueError("YAML document must be a mapping/object at top-level")
+    return data
+
+
+def load_yaml_mapping_from_str(text: str) -> dict[str, Any]:
+    """Parse YAML text and require a mapping/object at the root."""
+
+    return _require_mapping(_safe_load(text))
 
+
+def load_yaml_mapping_from_stream(stream: IO[str]) -> dict[str, Any]:
+    """Parse YAML from a text stream and require a mapping/object at the root.
+
+    The stream is handed to the loader directly, so it is parsed in chunks
+    without first reading the whole document into a string.
+    """
+
+    return _require_mapping(_safe_load(stream))
+
+
+def _json_cache_dir() -> Optional[str]:
+    return os.environ.get(YAML_JSON_CACHE_ENV, "").strip() or None
+
+
+def _write_json_cache(cache_path: str, data: Any) -> None:
+    """Store `data` as JSON if it survives a JSON round trip unchanged.
+
+    Documents with values JSON cannot represent faithfully (timestamps,
+    non-string keys, NaN) are simply not cached. Write failures are ignored.
+    """
+    try:
+        text = json.dumps(data, ensure_ascii=False)
+        if json.loads(text) != data:
+            return
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, cache_path)
+    except (TypeError, ValueError, OSError):
+        return
+
+
+def _load_yaml_bytes_via_json_cache(raw: bytes, cache_dir: str) -> Any:
+    """Parse YAML file bytes, reusing a JSON copy of an earlier parse of the same bytes.
+
+    Entries are keyed by content, so an edited file never hits a stale entry,
+    and an unreadable or corrupt entry falls back to parsing the YAML.
+    """
+    cache_path = os.path.join(cache_dir, hashlib.blake2b(raw, digest_size=16).hexdigest() + ".json")
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    data = _safe_load(raw.decode("utf-8"))
+    if isinstance(data, dict):
+        _write_json_cache(cache_path, data)
     return data
 
 
+def load_yaml_mapping_from_bytes(raw: bytes) -> dict[str, Any]:
+    """Parse UTF-8 YAML file content and require a mapping/object at the root.
+
+    For callers that already hold a file's bytes (e.g. to digest them). Honours
+    `CRML_YAML_JSON_CACHE_DIR` exactly like `load_yaml_mapping_from_path`.
+    """
+
+    cache_dir = _json_cache_dir()
+    if cache_dir is not None and os.path.isdir(cache_dir):
+        return _require_mapping(_load_yaml_bytes_via_json_cache(raw, cache_dir))
+    return _require_mapping(_safe_load(raw.decode("utf-8")))
+
+
 def load_yaml_mapping_from_path(path: str) -> dict[str, Any]:
-    """Read YAML file and require a mapping/object at the root."""
+    """Read YAML file and require a mapping/object at the root.
+
+    Without a JSON cache directory the file is handed to the loader as a
+    stream, so it is parsed in chunks without first reading the whole
+    document into a string. With one, the bytes are read once to compute the
+    cache key. The `CR*.load_from_yaml` model loaders always read the bytes
+    (see `load_yaml_mapping_from_bytes`).
+
+    If the `CRML_YAML_JSON_CACHE_DIR` environment variable names a directory,
+    parsed documents are cached there as JSON and later loads of identical
+    file content skip the YAML parser. Only point it at a directory that
+    untrusted users cannot write to, since cache entries are trusted as-is.
+    """
+
+    cache_dir = _json_cache_dir()
+    if cache_dir is not None and os.path.isdir(cache_dir):
+        with open(path, "rb") as f:
+            raw = f.read()
+        return _require_mapping(_load_yaml_bytes_via_json_cache(raw, cache_dir))
 
     with open(path, "r", encoding="utf-8") as f:
-        return load_yaml_mapping_from_str(f.read())
+        return _require_mapping(_safe_load(f))
 
 
 def dump_yaml_to_str(data: Any, *, sort_keys: bool = False) -> str:
     """Serialize data to YAML."""
 
     yaml = _yaml_module()
-    return yaml.safe_dump(data, sort_keys=sort_keys, allow_unicode=True)
+    return yaml.dump(data, Dumper=_safe_dumper(yaml), sort_keys=sort_keys, allow_unicode=True)
+
+
+def dump_yaml_to_stream(data: Any, stream: IO[str], *, sort_keys: bool = False) -> None:
+    """Serialize data to YAML on a text stream."""
+
+    yaml = _yaml_module()
+    yaml.dump(data, stream, Dumper=_safe_dumper(yaml), sort_keys=sort_keys, allow_unicode=True)
 
 
 def dump_yaml_to_path(data: Any, path: str, *, sort_keys: bool = False) -> None:
     """Serialize data to YAML at the given file path."""
 
-    yaml = _yaml_module()
     with open(path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=sort_keys, allow_unicode=True)
+        dump_yaml_to_stream(data, f, sort_keys=sort_keys)
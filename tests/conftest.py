@@ -1,4 +1,5 @@
 from __future__ import annotations
+import hashlib
 import sys
 from pathlib import Path
 import pytest
@@ -8,7 +9,151 @@ _REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_REPO_ROOT / "crml_lang" / "src"))
 sys.path.insert(0, str(_REPO_ROOT / "crml_engine" / "src"))
 
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--skip-unchanged-examples",
+        action="store_true",
+        default=False,
+        help=(
+            "Skip example-file validation tests whose example, test module, "
+            "crml_lang sources and validation dependencies are unchanged since "
+            "their last pass. Local iteration only; leave off in CI."
+        ),
+    )
+
+
+def pytest_configure(config):
+    # Registered here so the marker is known even without pytest-xdist; it only
+    # takes effect under `pytest -n auto --dist=loadgroup`.
+    config.addinivalue_line(
+        "markers",
+        "xdist_group(name): run the marked tests on a single pytest-xdist worker",
+    )
+
+
+def pytest_report_header(config):
+    """Report whether openpyxl found lxml, which speeds up the XLSX tests."""
+    try:
+        import openpyxl
+    except ImportError:
+        return None
+    if getattr(openpyxl, "LXML", False):
+        return "openpyxl: lxml backend"
+    return "openpyxl: lxml not installed; XLSX tests use the slower stdlib XML backend"
+
+
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Repository root, resolved once per session."""
+    return _REPO_ROOT
+
+
+_VALIDATION_DISTRIBUTIONS = ("pydantic", "pydantic-core", "jsonschema", "PyYAML")
+
+
+@pytest.fixture(scope="session")
+def _crml_lang_digest() -> str:
+    """Digest of the crml_lang sources, schemas and validation dependencies."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    h = hashlib.blake2b(digest_size=16)
+    for dist in _VALIDATION_DISTRIBUTIONS:
+        try:
+            h.update(f"{dist}=={version(dist)}".encode("utf-8"))
+        except PackageNotFoundError:
+            h.update(f"{dist}:missing".encode("utf-8"))
+    src = _REPO_ROOT / "crml_lang" / "src" / "crml_lang"
+    for path in sorted(p for p in src.rglob("*") if p.suffix in (".py", ".json")):
+        h.update(str(path.relative_to(src)).encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+class _ExampleValidationGate:
+    """Opt-in skipping of example validations that already passed unchanged.
+
+    Only active with ``--skip-unchanged-examples``; otherwise every example is
+    validated on every run. The cache key covers the example's bytes, the
+    requesting test module's bytes, the crml_lang sources/schemas and the
+    installed pydantic, jsonschema and PyYAML versions, so changing any of
+    them re-runs the validation. `--cache-clear` forces every example to be
+    validated again.
+    """
+
+    def __init__(self, cache, lang_digest: str, test_path: Path) -> None:
+        self._cache = cache
+        self._lang_digest = lang_digest
+        self._test_path = test_path
+
+    def _key(self, path: Path) -> str:
+        test = self._test_path.relative_to(_REPO_ROOT).as_posix()
+        return f"crml_examples/{test}/{path.relative_to(_REPO_ROOT).as_posix()}"
+
+    def _digest(self, path: Path) -> str:
+        h = hashlib.blake2b(key=self._lang_digest.encode("ascii"))
+        h.update(self._test_path.read_bytes())
+        h.update(b"\0")
+        h.update(path.read_bytes())
+        return h.hexdigest()
+
+    def skip_if_unchanged(self, path: Path) -> None:
+        if self._cache is not None and self._cache.get(self._key(path), None) == self._digest(path):
+            pytest.skip("unchanged since last successful validation")
+
+    def record_pass(self, path: Path) -> None:
+        if self._cache is not None:
+            self._cache.set(self._key(path), self._digest(path))
+
+
 @pytest.fixture
+def example_gate(request, _crml_lang_digest) -> _ExampleValidationGate:
+    cache = None
+    if request.config.getoption("--skip-unchanged-examples"):
+        cache = getattr(request.config, "cache", None)
+    return _ExampleValidationGate(cache, _crml_lang_digest, Path(request.path))
+
+
+@pytest.fixture(scope="session")
+def validated_model():
+    """Build CRML document models once per distinct input per session.
+
+    Returns a callable ``(cls, source)`` where `source` is YAML text (loaded via
+    ``cls.load_from_yaml_str``) or a dict (validated via ``cls.model_validate``).
+    Instances are shared between callers, so tests must treat them as
+    read-only.
+    """
+    import json
+
+    cache: dict[tuple[type, str], object] = {}
+
+    def _get(cls, source):
+        if isinstance(source, str):
+            key = (cls, source)
+        else:
+            key = (cls, json.dumps(source, sort_keys=True, default=repr))
+        model = cache.get(key)
+        if model is None:
+            model = cls.load_from_yaml_str(source) if isinstance(source, str) else cls.model_validate(source)
+            cache[key] = model
+        return model
+
+    return _get
+
+
+@pytest.fixture(scope="session")
+def rng():
+    """Session-wide seeded Generator for engine sampling tests.
+
+    Tests that only assert distributional properties draw from this shared
+    stream instead of constructing a fresh Generator each time.
+    """
+    import numpy as np
+
+    return np.random.default_rng(42)
+
+
+@pytest.fixture(scope="session")
 def valid_crml_content():
     return """
 crml_scenario: "1.0"
@@ -25,8 +170,25 @@ scenario:
     parameters: {mu: 10.0, sigma: 1.0}
 """
 
-@pytest.fixture
-def valid_crml_file(tmp_path, valid_crml_content):
-    p = tmp_path / "model.yaml"
+@pytest.fixture(scope="session")
+def valid_crml_parsed(valid_crml_content):
+    """`valid_crml_content` parsed once per session; treat as read-only."""
+    from crml_lang.yamlio import load_yaml_mapping_from_str
+
+    return load_yaml_mapping_from_str(valid_crml_content)
+
+
+@pytest.fixture(scope="session")
+def valid_crml_scenario(valid_crml_parsed):
+    """`valid_crml_content` validated once per session as a read-only `CRScenario`."""
+    from crml_lang import CRScenario
+
+    return CRScenario.model_validate(valid_crml_parsed)
+
+
+@pytest.fixture(scope="session")
+def valid_crml_file(tmp_path_factory, valid_crml_content):
+    """`valid_crml_content` written once per session (per xdist worker); read-only."""
+    p = tmp_path_factory.mktemp("valid_crml") / "model.yaml"
     p.write_text(valid_crml_content)
     return str(p)
@@ -1,7 +1,7 @@
 import numpy as np
 import pytest
 
-from crml_engine.copula import gaussian_copula_uniforms
+from crml_engine.copula import gaussian_copula_bernoulli, gaussian_copula_uniforms
 
 
 def test_gaussian_copula_uniforms_has_expected_correlation():
@@ -18,3 +18,61 @@ def test_gaussian_copula_uniforms_has_expected_correlation():
     emp = np.corrcoef(z.T)
 
     assert emp[0, 1] == pytest.approx(rho, abs=0.05)
+
+
+def test_gaussian_copula_uniforms_quasi_mc_has_expected_correlation():
+    rho = 0.7
+    corr = np.array([[1.0, rho], [rho, 1.0]], dtype=np.float64)
+
+    u = gaussian_copula_uniforms(corr=corr, n=1000, seed=123, quasi_mc=True)
+
+    from scipy.stats import norm
+
+    z = norm.ppf(u)
+    emp = np.corrcoef(z.T)
+
+    assert u.shape == (1000, 2)
+    assert emp[0, 1] == pytest.approx(rho, abs=0.05)
+
+
+def test_gaussian_copula_uniforms_reuses_cached_cholesky():
+    from crml_engine.copula import _cholesky_factor
+
+    corr = np.array([[1.0, 0.3], [0.3, 1.0]], dtype=np.float64)
+    _cholesky_factor.cache_clear()
+
+    a = gaussian_copula_uniforms(corr=corr, n=100, seed=1)
+    b = gaussian_copula_uniforms(corr=corr.copy(), n=100, seed=1)
+
+    info = _cholesky_factor.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    np.testing.assert_array_equal(a, b)
+
+
+def test_gaussian_copula_uniforms_float32():
+    rho = 0.7
+    corr = np.array([[1.0, rho], [rho, 1.0]], dtype=np.float64)
+
+    u = gaussian_copula_uniforms(corr=corr, n=20000, seed=123, dtype=np.float32)
+
+    assert u.dtype == np.float32
+    assert np.all((u > 0.0) & (u < 1.0))
+
+    from scipy.stats import norm
+
+    emp = np.corrcoef(norm.ppf(u.astype(np.float64)).T)
+    assert emp[0, 1] == pytest.approx(rho, abs=0.03)
+
+
+def test_gaussian_copula_bernoulli_matches_thresholded_uniforms():
+    corr = np.array([[1.0, 0.65, 0.4], [0.65, 1.0, 0.65], [0.4, 0.65, 1.0]], dtype=np.float64)
+    probabilities = [0.8, 0.9, 1.0]
+
+    states = gaussian_copula_bernoulli(corr=corr, n=5000, probabilities=probabilities, seed=7)
+    u = gaussian_copula_uniforms(corr=corr, n=5000, seed=7)
+
+    assert states.shape == (5000, 3)
+    assert states.dtype == np.bool_
+    np.testing.assert_array_equal(states, u <= np.asarray(probabilities))
+    assert states[:, 2].all()
@@ -250,3 +250,15 @@ scenario:
         
         result = run_simulation(model, n_runs=1000, seed=42)
         assert result.success is True, f"Failed for currency {currency}"
+
+
+def test_normalize_fx_config_fills_default_rates_without_mutating_input():
+    """A dict without rates gets the default table; the caller's dict is left untouched."""
+    from crml_engine.models.fx_model import normalize_fx_config
+
+    raw = {"base_currency": "USD", "output_currency": "EUR"}
+    fx = normalize_fx_config(raw)
+
+    assert fx.output_currency == "EUR"
+    assert fx.rates == DEFAULT_FX_RATES
+    assert "rates" not in raw
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from crml_engine.runtime import run_portfolio_simulation
+import textwrap
 
+import numpy as np
 
-def test_portfolio_runtime_runs_with_control_state_copula(tmp_path):
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
+from crml_engine.runtime import run_portfolio_bundle_simulation, run_portfolio_simulation
+
+
+SCENARIO_YAML = """
 crml_scenario: "1.0"
 meta:
   name: "Scenario"
@@ -21,47 +22,89 @@ scenario:
   severity:
     model: lognormal
     parameters: {median: 1000, sigma: 0.5}
-""".lstrip(),
-        encoding="utf-8",
+""".lstrip()
+
+
+PORTFOLIO_BODY_YAML = """
+semantics:
+  method: sum
+controls:
+  - id: "cap:edr"
+    implementation_effectiveness: 0.6
+    coverage: {value: 1.0, basis: applications}
+    reliability: 0.8
+    affects: frequency
+  - id: "cap:mfa"
+    implementation_effectiveness: 0.7
+    coverage: {value: 0.9, basis: applications}
+    reliability: 0.9
+    affects: frequency
+dependency:
+  copula:
+    type: gaussian
+    structure: toeplitz
+    rho: 0.65
+    targets:
+      - control:cap:edr:state
+      - control:cap:mfa:state
+scenarios:
+  - id: s1
+    path: scenario.yaml
+""".lstrip()
+
+
+def _portfolio_yaml() -> str:
+    return 'crml_portfolio: "1.0"\nmeta:\n  name: "Portfolio"\nportfolio:\n' + textwrap.indent(
+        PORTFOLIO_BODY_YAML, "  "
     )
 
-    portfolio_path = tmp_path / "portfolio.yaml"
-    portfolio_path.write_text(
-        f"""
-crml_portfolio: "1.0"
-meta:
-  name: "Portfolio"
-portfolio:
-  semantics:
-    method: sum
-  controls:
-    - id: "cap:edr"
-      implementation_effectiveness: 0.6
-      coverage: {{value: 1.0, basis: applications}}
-      reliability: 0.8
-      affects: frequency
-    - id: "cap:mfa"
-      implementation_effectiveness: 0.7
-      coverage: {{value: 0.9, basis: applications}}
-      reliability: 0.9
-      affects: frequency
-  dependency:
-    copula:
-      type: gaussian
-      structure: toeplitz
-      rho: 0.65
-      targets:
-        - control:cap:edr:state
-        - control:cap:mfa:state
-  scenarios:
-    - id: s1
-      path: {scenario_path.name}
-""".lstrip(),
-        encoding="utf-8",
+
+def _bundle_yaml() -> str:
+    return (
+        'crml_portfolio_bundle: "1.0"\n'
+        "portfolio_bundle:\n"
+        "  portfolio:\n"
+        + textwrap.indent(_portfolio_yaml(), "    ")
+        + "  scenarios:\n"
+        "    - id: s1\n"
+        "      weight: 1.0\n"
+        "      source_path: scenario.yaml\n"
+        "      scenario:\n"
+        + textwrap.indent(SCENARIO_YAML, "        ")
+        + "  assessments: []\n"
     )
 
-    res = run_portfolio_simulation(str(portfolio_path), source_kind="path", n_runs=5000, seed=42)
+
+def _assert_positive_eal(res) -> None:
     assert res.success is True
     assert res.metrics is not None
     assert res.metrics.eal is not None
     assert res.metrics.eal > 0
+
+
+def test_portfolio_runtime_runs_with_control_state_copula():
+    res = run_portfolio_bundle_simulation(
+        _bundle_yaml(),
+        source_kind="yaml",
+        n_runs=512,
+        seed=42,
+        quasi_mc=True,
+        copula_dtype=np.float32,
+    )
+    _assert_positive_eal(res)
+
+
+def test_portfolio_runtime_runs_with_control_state_copula_from_path(tmp_path):
+    (tmp_path / "scenario.yaml").write_text(SCENARIO_YAML, encoding="utf-8")
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(_portfolio_yaml(), encoding="utf-8")
+
+    res = run_portfolio_simulation(
+        str(portfolio_path),
+        source_kind="path",
+        n_runs=512,
+        seed=42,
+        quasi_mc=True,
+        copula_dtype=np.float32,
+    )
+    _assert_positive_eal(res)
@@ -34,16 +34,16 @@ scenario:
     assert result.success is False
 
 
-  def test_run_simulation_envelope_valid(valid_crml_content):
+def test_run_simulation_envelope_valid(valid_crml_content):
     env = run_simulation_envelope(
-      valid_crml_content,
-      n_runs=200,
-      seed=123,
-      fx_config={
-        "base_currency": "USD",
-        "output_currency": "EUR",
-        "rates": None,
-      },
+        valid_crml_content,
+        n_runs=200,
+        seed=123,
+        fx_config={
+            "base_currency": "USD",
+            "output_currency": "EUR",
+            "rates": None,
+        },
     )
     assert isinstance(env, CRSimulationResult)
     assert env.result.engine.name == "crml_engine"
@@ -122,3 +122,13 @@ scenario:
     eal_single = res_single.metrics.eal
     eal_mu = res_mu.metrics.eal
     assert abs(eal_single - eal_mu) / max(1.0, eal_single) < 0.02
+
+
+def test_run_simulation_repeated_yaml_text_is_reproducible(valid_crml_content):
+    first = run_simulation(valid_crml_content, n_runs=500, seed=7)
+    second = run_simulation(valid_crml_content, n_runs=500, seed=7)
+
+    assert first.success is True
+    assert second.success is True
+    assert first.metrics.eal == second.metrics.eal
+    assert first.metadata.model_name == second.metadata.model_name
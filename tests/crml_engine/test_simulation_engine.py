@@ -1,63 +1,60 @@
+from types import SimpleNamespace
+
 import pytest
 import numpy as np
 from crml_engine.simulation.frequency import FrequencyEngine
 from crml_engine.simulation.severity import SeverityEngine
-from crml_engine.simulation.engine import run_monte_carlo
+from crml_engine.simulation.engine import compute_loss_metrics, run_monte_carlo
 from crml_engine.models.fx_model import FXConfig, DEFAULT_FX_RATES
 
 # --- Frequency Tests ---
 
-def test_frequency_poisson():
-    class MockParams:
-        lambda_ = 10.0
-    
-    n_runs = 1000
-    cardinality = 1
-    counts = FrequencyEngine.generate_frequency('poisson', MockParams(), n_runs, cardinality)
-    
+def _count_moments(counts):
+    """Mean and (population) variance of event counts from one pass of sums."""
+    counts = np.asarray(counts, dtype=np.float64)
+    n = counts.shape[0]
+    mean = counts.sum() / n
+    return mean, float(np.dot(counts, counts) / n - mean * mean)
+
+
+@pytest.mark.parametrize(
+    "model, params, n_runs, cardinality, expected_var",
+    [
+        ('poisson', SimpleNamespace(lambda_=10.0), 1000, 1, 10.0),
+        # Total lambda should be 2 * 5 = 10
+        ('poisson', SimpleNamespace(lambda_=2.0), 1000, 5, 10.0),
+        # Mean of Gamma(shape, scale) = shape * scale = 10; Var = shape * scale^2
+        ('gamma', SimpleNamespace(shape=10.0, scale=1.0, lambda_=None), 1000, 1, 10.0),
+        # Var(N) = E[Var(N|L)] + Var(E[N|L]) = E[L] + Var(L) = 10 + (shape*scale^2) = 10 + 10 = 20
+        ('hierarchical_gamma_poisson', SimpleNamespace(alpha_base=10.0, beta_base=1.0, lambda_=None), 5000, 1, 20.0),
+    ],
+    ids=["poisson", "poisson_scaled", "gamma", "hierarchical"],
+)
+def test_frequency_moments(rng, model, params, n_runs, cardinality, expected_var):
+    counts = FrequencyEngine.generate_frequency(model, params, n_runs, cardinality, rng=rng)
+
     assert len(counts) == n_runs
-    assert np.mean(counts) == pytest.approx(10.0, rel=0.1)
+    mean, var = _count_moments(counts)
+    assert mean == pytest.approx(10.0, rel=0.1)
+    assert var == pytest.approx(expected_var, rel=0.2)
 
-def test_frequency_poisson_scaled():
-    class MockParams:
-        lambda_ = 2.0
-    
-    n_runs = 1000
-    cardinality = 5
-    # Total lambda should be 2 * 5 = 10
-    counts = FrequencyEngine.generate_frequency('poisson', MockParams(), n_runs, cardinality)
-    
-    assert np.mean(counts) == pytest.approx(10.0, rel=0.1)
 
-def test_frequency_gamma():
+def test_frequency_hierarchical_draws_batched_gamma_then_poisson():
     class MockParams:
-        shape = 10.0
-        scale = 1.0
+        alpha_base = 2.0
+        beta_base = 3.0
         lambda_ = None
-        
-    n_runs = 1000
-    cardinality = 1
-    # Mean of Gamma(shape, scale) = shape * scale = 10
-    counts = FrequencyEngine.generate_frequency('gamma', MockParams(), n_runs, cardinality)
-    
-    assert np.mean(counts) == pytest.approx(10.0, rel=0.1)
 
-def test_frequency_hierarchical():
-    class MockParams:
-        # High variance scenario
-        alpha_base = 10.0
-        beta_base = 1.0 # scale
-        lambda_ = None
-        
     n_runs = 5000
-    cardinality = 1
-    counts = FrequencyEngine.generate_frequency('hierarchical_gamma_poisson', MockParams(), n_runs, cardinality)
-    
-    # Mean should still conform to Gamma mean (alpha * beta) = 10
-    assert np.mean(counts) == pytest.approx(10.0, rel=0.1)
-    # Variance should be higher than Poisson(10) which is 10. 
-    # Var(N) = E[Var(N|L)] + Var(E[N|L]) = E[L] + Var(L) = 10 + (shape*scale^2) = 10 + 10 = 20
-    assert np.var(counts) == pytest.approx(20.0, rel=0.2)
+    cardinality = 2
+    counts = FrequencyEngine.generate_frequency(
+        'hierarchical_gamma_poisson', MockParams(), n_runs, cardinality, rng=np.random.default_rng(17)
+    )
+
+    # One gamma batch for the rates followed by one poisson batch for the counts.
+    ref = np.random.default_rng(17)
+    expected = ref.poisson(ref.gamma(2.0, 3.0, n_runs) * cardinality)
+    np.testing.assert_array_equal(counts, expected)
 
 
 # --- Severity Tests ---
@@ -74,7 +71,19 @@ def test_severity_lognormal_calibration():
     assert mu == pytest.approx(4.605, rel=0.01)
     assert sigma == pytest.approx(0.0, abs=0.001)
 
-def test_severity_generation_lognormal():
+def test_severity_lognormal_calibration_converts_currency():
+    fx_config = FXConfig(base_currency="USD", output_currency="USD", rates=DEFAULT_FX_RATES)
+    single_losses = ["1 000", "2,000", 4000]
+
+    mu, sigma = SeverityEngine.calibrate_lognormal_from_single_losses(
+        single_losses, "EUR", "USD", fx_config
+    )
+
+    losses_usd = np.array([1000.0, 2000.0, 4000.0]) * DEFAULT_FX_RATES["EUR"]
+    assert mu == pytest.approx(np.log(np.median(losses_usd)))
+    assert sigma == pytest.approx(np.std(np.log(losses_usd)))
+
+def test_severity_generation_lognormal(rng):
     class MockParams:
         mu = 4.605
         sigma = 0.5
@@ -84,14 +93,14 @@ def test_severity_generation_lognormal():
         
     fx_config = FXConfig(base_currency="USD", output_currency="USD", rates=DEFAULT_FX_RATES)
     
-    losses = SeverityEngine.generate_severity('lognormal', MockParams(), None, 1000, fx_config)
+    losses = SeverityEngine.generate_severity('lognormal', MockParams(), None, 1000, fx_config, rng=rng)
     assert len(losses) == 1000
     assert np.median(losses) == pytest.approx(100.0, rel=0.1)
 
 
 # --- Engine Tests ---
 
-def test_full_engine_execution(tmp_path):
+def test_full_engine_execution():
     # Minimal valid CRML
     content = """
 crml_scenario: "1.0"
@@ -109,11 +118,280 @@ scenario:
       median: 1000
       sigma: 1.0
 """
-    f = tmp_path / "model.yaml"
-    f.write_text(content)
-    
-    result = run_monte_carlo(str(f), n_runs=100, seed=42)
+    result = run_monte_carlo(content, n_runs=100, seed=42)
     
     assert result.success is True
     assert result.metrics.eal > 0
     assert result.metadata.model_name == "test-model"
+
+
+def test_severity_aggregate_matches_per_event_sums():
+    class MockParams:
+        mu = 4.605
+        sigma = 0.8
+        currency = "USD"
+        median = None
+        single_losses = None
+
+    fx_config = FXConfig(base_currency="USD", output_currency="USD", rates=DEFAULT_FX_RATES)
+    rng = np.random.default_rng(7)
+    counts = rng.poisson(50.0, 5000)
+
+    agg = SeverityEngine.generate_aggregate_severity('lognormal', MockParams(), counts, fx_config, rng)
+    expected_mean = 50.0 * np.exp(4.605 + 0.5 * 0.8**2)
+
+    assert agg.shape == counts.shape
+    assert np.all(agg[counts == 0] == 0.0)
+    assert np.mean(agg) == pytest.approx(expected_mean, rel=0.05)
+
+
+def test_run_monte_carlo_approximate_matches_exact():
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "high-frequency"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters:
+      lambda: 200.0
+  severity:
+    model: gamma
+    parameters:
+      shape: 2.0
+      scale: 500
+"""
+    exact = run_monte_carlo(content, n_runs=10000, seed=1)
+    approx = run_monte_carlo(content, n_runs=10000, seed=1, approximate=True)
+
+    assert exact.success is True
+    assert approx.success is True
+    assert approx.metrics.eal == pytest.approx(exact.metrics.eal, rel=0.05)
+    assert approx.metrics.var_99 == pytest.approx(exact.metrics.var_99, rel=0.05)
+
+
+def test_compute_loss_metrics_matches_numpy_percentiles():
+    losses = np.random.default_rng(3).lognormal(8.0, 1.5, 2501)
+
+    metrics = compute_loss_metrics(losses)
+
+    assert metrics.var_95 == pytest.approx(np.percentile(losses, 95))
+    assert metrics.var_99 == pytest.approx(np.percentile(losses, 99))
+    assert metrics.var_999 == pytest.approx(np.percentile(losses, 99.9))
+    assert metrics.median == pytest.approx(np.median(losses))
+    assert metrics.min == np.min(losses)
+    assert metrics.max == np.max(losses)
+
+
+def test_run_monte_carlo_metrics_only():
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "metrics-only"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters:
+      lambda: 2.0
+  severity:
+    model: lognormal
+    parameters:
+      median: 1000
+      sigma: 1.0
+"""
+    full = run_monte_carlo(content, n_runs=1000, seed=5)
+    lean = run_monte_carlo(content, n_runs=1000, seed=5, include_distribution=False)
+
+    assert lean.success is True
+    assert lean.metrics == full.metrics
+    assert lean.distribution.bins == []
+    assert lean.distribution.raw_data == []
+
+
+def test_chunked_severity_aggregation_matches_single_pass(monkeypatch):
+    import crml_engine.simulation.engine as engine_mod
+
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "chunked"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters:
+      lambda: 3.0
+  severity:
+    model: lognormal
+    parameters:
+      median: 1000
+      sigma: 1.0
+"""
+    single = run_monte_carlo(content, n_runs=2000, seed=11)
+    monkeypatch.setattr(engine_mod, "SEVERITY_CHUNK_SIZE", 97)
+    chunked = run_monte_carlo(content, n_runs=2000, seed=11)
+
+    assert chunked.success is True
+    assert chunked.metrics.eal == pytest.approx(single.metrics.eal)
+    assert chunked.distribution.raw_data == pytest.approx(single.distribution.raw_data)
+
+
+def test_run_monte_carlo_float32_severities():
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "float32"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters:
+      lambda: 4.0
+  severity:
+    model: lognormal
+    parameters:
+      median: 25000
+      sigma: 1.2
+"""
+    exact = run_monte_carlo(content, n_runs=2000, seed=9)
+    single = run_monte_carlo(content, n_runs=2000, seed=9, severity_dtype=np.float32)
+
+    assert single.success is True
+    assert single.metrics.eal == pytest.approx(exact.metrics.eal, rel=1e-5)
+    assert single.metrics.var_99 == pytest.approx(exact.metrics.var_99, rel=1e-5)
+
+
+def test_run_monte_carlo_accepts_validated_scenario(valid_crml_content, monkeypatch):
+    from crml_lang.models.scenario_model import CRScenario, load_crml_from_yaml_str
+
+    scenario = load_crml_from_yaml_str(valid_crml_content)
+    expected = run_monte_carlo(valid_crml_content, n_runs=200, seed=7, raw_data_limit=None)
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("validated scenario was re-validated")
+
+    monkeypatch.setattr(CRScenario, "model_validate", _fail)
+    result = run_monte_carlo(scenario, n_runs=200, seed=7, raw_data_limit=None)
+
+    assert result.success is True
+    assert result.distribution.raw_data == expected.distribution.raw_data
+
+
+def test_numba_round_scaled_counts_matches_numpy():
+    pytest.importorskip("numba")
+    from crml_engine.simulation import kernels
+
+    rates = np.array([-1.2, 0.0, 0.1, 0.5 / 3, 0.49, 0.5, 1.5, 2.5, 3.7, 1e6])
+    expected = np.maximum(np.rint(rates * 3), 0).astype(np.int64)
+
+    out = kernels.round_scaled_counts(rates, 3)
+
+    assert out.dtype == np.int64
+    np.testing.assert_array_equal(out, expected)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_numba_sum_severities_matches_chunk_accumulation(dtype):
+    pytest.importorskip("numba")
+    from crml_engine.simulation import kernels
+    from crml_engine.simulation.engine import _accumulate_event_chunk
+
+    counts = np.array([0, 3, 0, 0, 1, 5, 0, 2], dtype=np.int64)
+    severities = np.random.default_rng(3).lognormal(5.0, 1.0, int(counts.sum())).astype(dtype)
+
+    expected = np.zeros(len(counts), dtype=np.float64)
+    _accumulate_event_chunk(
+        expected,
+        counts=counts,
+        run_ends=np.cumsum(counts),
+        chunk_start=0,
+        severities=severities,
+    )
+
+    out = kernels.sum_severities_by_count(counts, severities)
+
+    assert out.dtype == np.float64
+    np.testing.assert_allclose(out, expected, rtol=1e-6)
+    assert np.all(out[counts == 0] == 0.0)
+
+
+def test_chunk_accumulation_sums_float32_in_float64():
+    from crml_engine.simulation.engine import _accumulate_event_chunk
+
+    # 1e8 + 7 * 3 is not representable in float32 (spacing 8 at 1e8).
+    counts = np.array([8, 0], dtype=np.int64)
+    severities = np.array([1e8] + [3.0] * 7, dtype=np.float32)
+
+    losses = np.zeros(len(counts), dtype=np.float64)
+    _accumulate_event_chunk(
+        losses,
+        counts=counts,
+        run_ends=np.cumsum(counts),
+        chunk_start=0,
+        severities=severities,
+    )
+
+    assert losses.dtype == np.float64
+    assert losses.tolist() == [100_000_021.0, 0.0]
+
+
+def test_numba_sum_severities_float32_without_float64_copy():
+    pytest.importorskip("numba")
+    import tracemalloc
+
+    from crml_engine.simulation import kernels
+
+    counts = np.full(4, 250_000, dtype=np.int64)
+    severities = np.full(int(counts.sum()), 3.0, dtype=np.float32)
+    severities[0] = 1e8
+    kernels.sum_severities_by_count(counts, severities)  # compile outside the trace
+
+    tracemalloc.start()
+    try:
+        out = kernels.sum_severities_by_count(counts, severities)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert out.dtype == np.float64
+    assert out[0] == 1e8 + 3.0 * 249_999
+    # A float64 copy of the severities alone would be 8 MB.
+    assert peak < severities.nbytes
+
+
+def test_chunked_severity_resolves_calibration_once(monkeypatch):
+    import crml_engine.simulation.engine as engine_mod
+
+    content = """
+crml_scenario: "1.0"
+meta:
+  name: "chunked-calibration"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters:
+      lambda: 3.0
+  severity:
+    model: lognormal
+    parameters:
+      single_losses: [1000, 2500, 4000, 12000]
+"""
+    single = run_monte_carlo(content, n_runs=2000, seed=11)
+
+    calls = []
+    calibrate = SeverityEngine.calibrate_lognormal_from_single_losses
+
+    def _counting_calibrate(*args, **kwargs):
+        calls.append(args)
+        return calibrate(*args, **kwargs)
+
+    monkeypatch.setattr(SeverityEngine, "calibrate_lognormal_from_single_losses", staticmethod(_counting_calibrate))
+    monkeypatch.setattr(engine_mod, "SEVERITY_CHUNK_SIZE", 97)
+    chunked = run_monte_carlo(content, n_runs=2000, seed=11)
+
+    assert chunked.success is True
+    assert len(calls) == 1
+    assert chunked.distribution.raw_data == pytest.approx(single.distribution.raw_data)
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+# Scenario documents shared by the portfolio tests. Each is written once per
+# session; portfolios reference them by absolute path, so tests must not modify
+# them.
+
+THREAT_SCENARIO_YAML = """
+crml_scenario: "1.0"
+meta:
+  name: "Threat scenario"
+scenario:
+  controls:
+    - "iso27001:2022:A.5.1"
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {lambda: 0.5}
+  severity:
+    model: lognormal
+    parameters: {mu: 10, sigma: 1}
+""".lstrip()
+
+PER_ASSET_SCENARIO_YAML = """
+crml_scenario: "1.0"
+meta:
+  name: "Per-asset scenario"
+scenario:
+  frequency:
+    basis: per_asset_unit_per_year
+    model: poisson
+    parameters: {lambda: 0.5}
+  severity:
+    model: lognormal
+    parameters: {mu: 10, sigma: 1}
+""".lstrip()
+
+BASIC_SCENARIO_YAML = """
+crml_scenario: "1.0"
+meta:
+  name: "Scenario"
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {lambda: 1.0}
+  severity:
+    model: lognormal
+    parameters: {median: 1000, sigma: 1.0}
+""".lstrip()
+
+
+@pytest.fixture(scope="session")
+def _shared_scenario_dir(tmp_path_factory) -> Path:
+    return tmp_path_factory.mktemp("shared_scenarios")
+
+
+def _write_scenario(directory: Path, name: str, text: str) -> Path:
+    path = directory / name
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+@pytest.fixture(scope="session")
+def threat_scenario_path(_shared_scenario_dir) -> Path:
+    """Organization-level scenario referencing control ``iso27001:2022:A.5.1``."""
+    return _write_scenario(_shared_scenario_dir, "threat-scenario.yaml", THREAT_SCENARIO_YAML)
+
+
+@pytest.fixture(scope="session")
+def per_asset_scenario_path(_shared_scenario_dir) -> Path:
+    """Scenario with a ``per_asset_unit_per_year`` frequency basis."""
+    return _write_scenario(_shared_scenario_dir, "per-asset-scenario.yaml", PER_ASSET_SCENARIO_YAML)
+
+
+@pytest.fixture(scope="session")
+def basic_scenario_path(_shared_scenario_dir) -> Path:
+    """Minimal organization-level scenario without controls."""
+    return _write_scenario(_shared_scenario_dir, "scenario.yaml", BASIC_SCENARIO_YAML)
@@ -40,3 +40,20 @@ assessment:
     dumped = doc.dump_to_yaml_str()
     report = validate_assessment(dumped, source_kind="yaml")
     assert report.ok, report.render_text(source_label="roundtrip")
+
+
+def test_cr_control_catalog_from_dict_validates_as_data() -> None:
+    doc = CRControlCatalog.model_validate(
+        {
+            "crml_control_catalog": "1.0",
+            "meta": {"name": "cisv8-catalog"},
+            "catalog": {
+                "framework": "CIS v8",
+                "controls": [{"id": "cisv8:4.2", "title": "Secure configuration"}],
+            },
+        }
+    )
+
+    data = doc.model_dump(by_alias=True, exclude_none=True)
+    report = validate_control_catalog(data, source_kind="data")
+    assert report.ok, report.render_text(source_label="dict")
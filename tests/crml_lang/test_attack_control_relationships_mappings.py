@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from crml_lang import validate_attack_control_relationships
 
 
@@ -42,8 +40,9 @@ relationships:
     assert not report.ok
 
 
-def test_example_attack_control_relationships_validates() -> None:
-    root = Path(__file__).resolve().parents[2]
-    example = root / "examples" / "attack_control_relationships" / "attck-to-cisv8-mappings.yaml"
+def test_example_attack_control_relationships_validates(repo_root, example_gate) -> None:
+    example = repo_root / "examples" / "attack_control_relationships" / "attck-to-cisv8-mappings.yaml"
+    example_gate.skip_if_unchanged(example)
     report = validate_attack_control_relationships(str(example), source_kind="path", strict_model=True)
     assert report.ok, report.render_text(source_label=str(example))
+    example_gate.record_pass(example)
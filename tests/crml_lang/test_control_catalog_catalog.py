@@ -24,54 +24,72 @@ catalog:
 
 
 def test_validate_control_catalog_catalog_rejects_duplicate_ids() -> None:
-    yaml_text = """
-crml_control_catalog: "1.0"
-meta:
-  name: "duplicate-catalog"
-catalog:
-  framework: "CIS v8"
-  controls:
-    - id: "cisv8:4.2"
-    - id: "cisv8:4.2"
-"""
+    data = {
+        "crml_control_catalog": "1.0",
+        "meta": {"name": "duplicate-catalog"},
+        "catalog": {
+            "framework": "CIS v8",
+            "controls": [{"id": "cisv8:4.2"}, {"id": "cisv8:4.2"}],
+        },
+    }
 
-    report = validate_control_catalog(yaml_text, source_kind="yaml")
+    report = validate_control_catalog(data, source_kind="data")
     assert report.ok is False
-    assert any("duplicate" in e.message.lower() for e in report.errors)
+    assert any(e.code == "control_catalog.duplicate_ids" for e in report.errors)
 
 
 def test_validate_control_catalog_allows_defense_in_depth_layers() -> None:
-    yaml_text = """
-crml_control_catalog: "1.0"
-meta:
-  name: "layered-catalog"
-catalog:
-  framework: "Example"
-  controls:
-    - id: "org:backup"
-      defense_in_depth_layers: ["recover"]
-    - id: "org:siem"
-      defense_in_depth_layers:
-        - "detect"
-        - "respond"
-"""
+    data = {
+        "crml_control_catalog": "1.0",
+        "meta": {"name": "layered-catalog"},
+        "catalog": {
+            "framework": "Example",
+            "controls": [
+                {"id": "org:backup", "defense_in_depth_layers": ["recover"]},
+                {"id": "org:siem", "defense_in_depth_layers": ["detect", "respond"]},
+            ],
+        },
+    }
 
-    report = validate_control_catalog(yaml_text, source_kind="yaml")
+    report = validate_control_catalog(data, source_kind="data")
     assert report.ok, report.render_text(source_label="inline")
 
 
 def test_validate_control_catalog_rejects_invalid_defense_in_depth_layers_value() -> None:
+    data = {
+        "crml_control_catalog": "1.0",
+        "meta": {"name": "layered-catalog-invalid"},
+        "catalog": {
+            "framework": "Example",
+            "controls": [{"id": "org:control", "defense_in_depth_layers": ["nonsense"]}],
+        },
+    }
+
+    report = validate_control_catalog(data, source_kind="data")
+    assert report.ok is False
+    assert any("defense" in e.path.lower() or "defense" in e.message.lower() for e in report.errors)
+
+
+def test_control_catalog_load_from_yaml_str_reuses_validated_document(monkeypatch) -> None:
+    from crml_lang import CRControlCatalog
+
     yaml_text = """
 crml_control_catalog: "1.0"
 meta:
-  name: "layered-catalog-invalid"
+  name: "cached-catalog"
 catalog:
-  framework: "Example"
+  framework: "CIS v8"
   controls:
-    - id: "org:control"
-      defense_in_depth_layers: ["nonsense"]
+    - id: "cisv8:4.2"
 """
+    CRControlCatalog.cache_clear()
+    first = CRControlCatalog.load_from_yaml_str(yaml_text)
 
-    report = validate_control_catalog(yaml_text, source_kind="yaml")
-    assert report.ok is False
-    assert any("defense" in e.path.lower() or "defense" in e.message.lower() for e in report.errors)
+    def _fail(*args, **kwargs):
+        raise AssertionError("identical YAML text should not be re-validated")
+
+    monkeypatch.setattr(CRControlCatalog, "model_validate", _fail)
+    second = CRControlCatalog.load_from_yaml_str(yaml_text)
+
+    assert second is not first
+    assert second.model_dump() == first.model_dump()
@@ -53,7 +53,7 @@ relationships:
 
     report = validate_control_relationships(yaml_text, source_kind="yaml")
     assert report.ok is False
-    assert any("duplicate" in e.message.lower() for e in report.errors)
+    assert any(e.code == "control_relationships.duplicate_mappings" for e in report.errors)
 
 
 def test_validate_control_relationships_rejects_self_edges() -> None:
@@ -72,7 +72,7 @@ relationships:
 
     report = validate_control_relationships(yaml_text, source_kind="yaml")
     assert report.ok is False
-    assert any("must not be the same" in e.message.lower() for e in report.errors)
+    assert any(e.code == "control_relationships.self_relationship" for e in report.errors)
 
 
 def test_validate_control_relationships_allows_backstops_relationship_type() -> None:
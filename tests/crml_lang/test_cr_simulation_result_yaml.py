@@ -22,8 +22,8 @@ def _minimal_result_dict() -> dict:
     }
 
 
-def test_cr_simulation_result_yaml_str_round_trip() -> None:
-    env = CRSimulationResult.model_validate(_minimal_result_dict())
+def test_cr_simulation_result_yaml_str_round_trip(validated_model) -> None:
+    env = validated_model(CRSimulationResult, _minimal_result_dict())
 
     yaml_text = env.dump_to_yaml_str(sort_keys=False)
     round_tripped = CRSimulationResult.load_from_yaml_str(yaml_text)
@@ -31,8 +31,8 @@ def test_cr_simulation_result_yaml_str_round_trip() -> None:
     assert round_tripped.model_dump() == env.model_dump()
 
 
-def test_cr_simulation_result_yaml_file_round_trip(tmp_path) -> None:
-    env = CRSimulationResult.model_validate(_minimal_result_dict())
+def test_cr_simulation_result_yaml_file_round_trip(tmp_path, validated_model) -> None:
+    env = validated_model(CRSimulationResult, _minimal_result_dict())
 
     out_path = tmp_path / "result.yaml"
     env.dump_to_yaml(str(out_path), sort_keys=False)
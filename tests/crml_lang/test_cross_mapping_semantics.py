@@ -62,7 +62,7 @@ assessment:
         control_catalogs_source_kind="yaml",
     )
     assert report.ok is False
-    assert any("unknown control id" in e.message.lower() for e in report.errors)
+    assert any(e.code == "assessment.unknown_control_id" for e in report.errors)
 
 
 def test_assessment_rejects_duplicate_ids() -> None:
@@ -81,4 +81,4 @@ assessment:
 
     report = validate_assessment(assessment_yaml, source_kind="yaml")
     assert report.ok is False
-    assert any("duplicate" in e.message.lower() for e in report.errors)
+    assert any(e.code == "assessment.duplicate_ids" for e in report.errors)
@@ -1,36 +1,38 @@
 from __future__ import annotations
 
-from pathlib import Path
-
 from crml_lang import validate
 from crml_lang import validate_document
 from crml_lang.validators import validate_attack_catalog
 from crml_lang.validators import validate_attack_control_relationships
 
 
-def test_example_attack_catalog_validates() -> None:
-    root = Path(__file__).resolve().parents[2]
-    example = root / "examples" / "attack_catalogs" / "attck-catalog.yaml"
+def test_example_attack_catalog_validates(repo_root, example_gate) -> None:
+    example = repo_root / "examples" / "attack_catalogs" / "attck-catalog.yaml"
+    example_gate.skip_if_unchanged(example)
     report = validate_attack_catalog(str(example), source_kind="path", strict_model=True)
     assert report.ok, report.render_text(source_label=str(example))
+    example_gate.record_pass(example)
 
 
-def test_example_attck_tagged_scenario_validates() -> None:
-    root = Path(__file__).resolve().parents[2]
-    example = root / "examples" / "scenarios" / "scenario-attck-metadata.yaml"
+def test_example_attck_tagged_scenario_validates(repo_root, example_gate) -> None:
+    example = repo_root / "examples" / "scenarios" / "scenario-attck-metadata.yaml"
+    example_gate.skip_if_unchanged(example)
     report = validate(str(example), source_kind="path")
     assert report.ok, report.render_text(source_label=str(example))
+    example_gate.record_pass(example)
 
 
-def test_example_attack_control_relationships_validates() -> None:
-    root = Path(__file__).resolve().parents[2]
-    example = root / "examples" / "attack_control_relationships" / "attck-to-cisv8-mappings.yaml"
+def test_example_attack_control_relationships_validates(repo_root, example_gate) -> None:
+    example = repo_root / "examples" / "attack_control_relationships" / "attck-to-cisv8-mappings.yaml"
+    example_gate.skip_if_unchanged(example)
     report = validate_attack_control_relationships(str(example), source_kind="path", strict_model=True)
     assert report.ok, report.render_text(source_label=str(example))
+    example_gate.record_pass(example)
 
 
-def test_example_portfolio_bundle_validates_via_document_dispatch() -> None:
-    root = Path(__file__).resolve().parents[2]
-    example = root / "examples" / "portfolio_bundles" / "portfolio-bundle-documented.yaml"
+def test_example_portfolio_bundle_validates_via_document_dispatch(repo_root, example_gate) -> None:
+    example = repo_root / "examples" / "portfolio_bundles" / "portfolio-bundle-documented.yaml"
+    example_gate.skip_if_unchanged(example)
     report = validate_document(str(example), source_kind="path", strict_model=True)
     assert report.ok, report.render_text(source_label=str(example))
+    example_gate.record_pass(example)
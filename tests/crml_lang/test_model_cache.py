@@ -0,0 +1,50 @@
+from crml_lang._model_cache import ModelSnapshotCache
+
+
+class _Doc(dict):
+    pass
+
+
+class _OtherDoc(dict):
+    pass
+
+
+def test_hits_return_independent_copies() -> None:
+    cache = ModelSnapshotCache(maxsize=4)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return _Doc(items=[1, 2])
+
+    first = cache.get_or_build(_Doc, b"k", build)
+    first["items"].append(3)
+    second = cache.get_or_build(_Doc, b"k", build)
+
+    assert len(builds) == 1
+    assert second == {"items": [1, 2]}
+    assert second is not first
+
+
+def test_evicts_least_recently_used_and_clears_per_class() -> None:
+    cache = ModelSnapshotCache(maxsize=2)
+    builds = []
+
+    def build(cls, tag):
+        def _build():
+            builds.append((cls, tag))
+            return cls(tag=tag)
+
+        return _build
+
+    cache.get_or_build(_Doc, b"a", build(_Doc, "a"))
+    cache.get_or_build(_OtherDoc, b"b", build(_OtherDoc, "b"))
+    cache.get_or_build(_Doc, b"a", build(_Doc, "a"))
+    cache.get_or_build(_Doc, b"c", build(_Doc, "c"))  # evicts _OtherDoc/b
+    cache.get_or_build(_OtherDoc, b"b", build(_OtherDoc, "b"))  # evicts _Doc/a
+    assert builds == [(_Doc, "a"), (_OtherDoc, "b"), (_Doc, "c"), (_OtherDoc, "b")]
+
+    cache.clear_class(_Doc)
+    cache.get_or_build(_OtherDoc, b"b", build(_OtherDoc, "b"))
+    cache.get_or_build(_Doc, b"c", build(_Doc, "c"))
+    assert builds[4:] == [(_Doc, "c")]
@@ -90,6 +90,18 @@ portfolio:
       CRPortfolio.load_from_yaml_str(yaml_decimal_str)
 
 
+@pytest.mark.parametrize("raw, expected", [(3, 3), ("10 000", 10000), ("1_000", 1000), (True, None)])
+def test_cardinality_accepts_integers_and_numberish_strings(raw, expected):
+    from crml_lang.models.portfolio_model import Asset
+
+    data = {"name": "Servers", "cardinality": raw}
+    if expected is None:
+        with pytest.raises(ValidationError):
+            Asset.model_validate(data)
+    else:
+        assert Asset.model_validate(data).cardinality == expected
+
+
 def test_percent_strings_allowed_only_for_probability_like_fields():
     # p should accept percent strings
     yaml_ok = """
@@ -132,3 +144,29 @@ scenario:
 
     with pytest.raises(ValidationError):
       CRScenario.load_from_yaml_str(yaml_bad)
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [("0.5", 0.5), (" 12 ", 12.0), ("1_000", 1000.0), ("1 000", 1000.0), ("2,500.5", 2500.5), ("1e3", 1000.0)],
+)
+def test_parse_floatish_fast_and_separator_paths_agree(raw, expected):
+    from crml_lang.models.numberish import parse_floatish
+
+    assert parse_floatish(raw, allow_percent=False) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("raw, expected", [("10", 10), ("+10", 10), ("10 000", 10000), ("1_000", 1000)])
+def test_parse_intish_fast_and_separator_paths_agree(raw, expected):
+    from crml_lang.models.numberish import parse_intish
+
+    assert parse_intish(raw) == expected
+
+
+@pytest.mark.parametrize("raw, expected", [("50%", 0.5), ("12.5 %", 0.125), ("1 000% ", 10.0)])
+def test_parse_floatish_percent_strings(raw, expected):
+    from crml_lang.models.numberish import parse_floatish
+
+    assert parse_floatish(raw, allow_percent=True) == pytest.approx(expected)
+    with pytest.raises(ValueError, match="percent values are not allowed"):
+        parse_floatish(raw, allow_percent=False)
@@ -89,3 +89,33 @@ portfolio:
       report.bundle.portfolio_bundle.scenarios[0].scenario.meta.name
       == "Threat scenario"
     )
+
+
+def test_bundle_portfolio_reports_first_invalid_scenario(tmp_path, basic_scenario_path) -> None:
+    bad_path = tmp_path / "bad.yaml"
+    bad_path.write_text('crml_scenario: "1.0"\nmeta:\n  name: "Broken"\n', encoding="utf-8")
+
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(
+        f"""
+crml_portfolio: "1.0"
+meta:
+  name: "Org portfolio"
+portfolio:
+  semantics:
+    method: sum
+  scenarios:
+    - id: s1
+      path: {basic_scenario_path}
+    - id: s2
+      path: {bad_path.name}
+    - id: s3
+      path: missing.yaml
+""".lstrip(),
+        encoding="utf-8",
+    )
+
+    report = bundle_portfolio(str(portfolio_path), source_kind="path")
+    assert report.ok is False
+    assert [e.path for e in report.errors] == ["portfolio.scenarios[1].path"]
+    assert report.errors[0].message.startswith("Failed to inline scenario 's2'")
@@ -1,32 +1,12 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from crml_lang import validate_portfolio
 
 
-def test_portfolio_requires_controls_or_assessments_for_scenario_controls(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Threat scenario"
-scenario:
-  controls:
-    - "iso27001:2022:A.5.1"
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 0.5}
-  severity:
-    model: lognormal
-    parameters: {mu: 10, sigma: 1}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
-    portfolio_path = tmp_path / "portfolio.yaml"
-    portfolio_path.write_text(
-        f"""
+# Shared portfolio skeleton; tests only vary the control inventory block.
+_PORTFOLIO_TEMPLATE = """
 crml_portfolio: "1.0"
 meta:
   name: "Org portfolio"
@@ -36,40 +16,37 @@ portfolio:
     constraints:
       require_paths_exist: true
       validate_scenarios: true
-  controls: []
+{inventory}
   scenarios:
     - id: s1
-      path: {scenario_path.name}
-""".lstrip(),
+      path: {scenario_path}
+""".lstrip()
+
+
+def _write_portfolio(tmp_path: Path, scenario_path: Path, *, inventory: str) -> Path:
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(
+        _PORTFOLIO_TEMPLATE.format(inventory=inventory.strip("\n"), scenario_path=scenario_path),
         encoding="utf-8",
     )
+    return portfolio_path
+
+
+def test_portfolio_requires_controls_or_assessments_for_scenario_controls(tmp_path, threat_scenario_path) -> None:
+    portfolio_path = _write_portfolio(
+        tmp_path,
+        threat_scenario_path,
+        inventory="""
+  controls: []
+""",
+    )
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is False
-    assert any("no control inventory is available" in e.message for e in report.errors)
+    assert any(e.code == "portfolio.no_control_inventory" for e in report.errors)
 
 
-def test_portfolio_can_use_assessment_catalog_for_scenario_control_mapping(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Threat scenario"
-scenario:
-  controls:
-    - "iso27001:2022:A.5.1"
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 0.5}
-  severity:
-    model: lognormal
-    parameters: {mu: 10, sigma: 1}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
+def test_portfolio_can_use_assessment_catalog_for_scenario_control_mapping(tmp_path, threat_scenario_path) -> None:
     catalog_path = tmp_path / "catalog.yaml"
     catalog_path.write_text(
         """
@@ -100,74 +77,30 @@ assessment:
         encoding="utf-8",
     )
 
-    portfolio_path = tmp_path / "portfolio.yaml"
-    portfolio_path.write_text(
-        f"""
-crml_portfolio: "1.0"
-meta:
-  name: "Org portfolio"
-portfolio:
-  semantics:
-    method: sum
-    constraints:
-      require_paths_exist: true
-      validate_scenarios: true
+    portfolio_path = _write_portfolio(
+        tmp_path,
+        threat_scenario_path,
+        inventory="""
   control_catalogs:
-    - {catalog_path.name}
+    - catalog.yaml
   assessments:
-    - {assessment_path.name}
-  scenarios:
-    - id: s1
-      path: {scenario_path.name}
-""".lstrip(),
-        encoding="utf-8",
+    - assessment.yaml
+""",
     )
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is True
 
 
-def test_portfolio_controls_can_set_implementation_effectiveness(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Threat scenario"
-scenario:
-  controls:
-    - "iso27001:2022:A.5.1"
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 0.5}
-  severity:
-    model: lognormal
-    parameters: {mu: 10, sigma: 1}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
-    portfolio_path = tmp_path / "portfolio.yaml"
-    portfolio_path.write_text(
-        f"""
-crml_portfolio: "1.0"
-meta:
-  name: "Org portfolio"
-portfolio:
-  semantics:
-    method: sum
-    constraints:
-      require_paths_exist: true
-      validate_scenarios: true
+def test_portfolio_controls_can_set_implementation_effectiveness(tmp_path, threat_scenario_path) -> None:
+    portfolio_path = _write_portfolio(
+        tmp_path,
+        threat_scenario_path,
+        inventory="""
   controls:
     - id: "iso27001:2022:A.5.1"
       implementation_effectiveness: 0.0
-  scenarios:
-    - id: s1
-      path: {scenario_path.name}
-""".lstrip(),
-        encoding="utf-8",
+""",
     )
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
@@ -197,28 +130,39 @@ scenario:
         encoding="utf-8",
     )
 
-    portfolio_path = tmp_path / "portfolio.yaml"
-    portfolio_path.write_text(
-        f"""
-crml_portfolio: "1.0"
-meta:
-  name: "Org portfolio"
-portfolio:
-  semantics:
-    method: sum
-    constraints:
-      require_paths_exist: true
-      validate_scenarios: true
+    portfolio_path = _write_portfolio(
+        tmp_path,
+        scenario_path,
+        inventory="""
   controls:
     - id: "iso27001:2022:A.5.1"
       implementation_effectiveness: 0.0
-      coverage: {{value: 1.0, basis: applications}}
-  scenarios:
-    - id: s1
-      path: {scenario_path.name}
-""".lstrip(),
-        encoding="utf-8",
+      coverage: {value: 1.0, basis: applications}
+""",
     )
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is True
+
+
+def test_cross_document_checks_reuse_validated_scenario(tmp_path, threat_scenario_path, monkeypatch) -> None:
+    from crml_lang import CRScenario
+
+    CRScenario.cache_clear()
+    portfolio_path = _write_portfolio(
+        tmp_path,
+        threat_scenario_path,
+        inventory="""
+  controls:
+    - id: "iso27001:2022:A.5.1"
+      implementation_effectiveness: 0.0
+""",
+    )
+    assert validate_portfolio(str(portfolio_path), source_kind="path").ok is True
+
+    # A second pass over the unchanged scenario file must not re-validate it.
+    def _fail(*args, **kwargs):
+        raise AssertionError("scenario was validated again")
+
+    monkeypatch.setattr(CRScenario, "model_validate", _fail)
+    assert validate_portfolio(str(portfolio_path), source_kind="path").ok is True
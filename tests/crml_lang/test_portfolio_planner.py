@@ -5,92 +5,52 @@ import pytest
 from crml_engine.pipeline import plan_portfolio
 
 
-def test_plan_portfolio_expands_per_asset_cardinality(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Per-asset scenario"
-scenario:
-  frequency:
-    basis: per_asset_unit_per_year
-    model: poisson
-    parameters: {lambda: 0.5}
-  severity:
-    model: lognormal
-    parameters: {mu: 10, sigma: 1}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
-    portfolio_path = tmp_path / "portfolio.yaml"
-    portfolio_path.write_text(
-        f"""
+# Two-asset portfolio used by the cardinality/binding tests.
+_TWO_ASSET_PORTFOLIO_TEMPLATE = """
 crml_portfolio: "1.0"
 meta:
   name: "Org portfolio"
 portfolio:
   assets:
     - name: a1
-      cardinality: 10
+      cardinality: {a1}
     - name: a2
-      cardinality: 5
+      cardinality: {a2}
   semantics:
     method: sum
   scenarios:
     - id: s1
-      path: {scenario_path.name}
-      binding:
-        applies_to_assets: [a1, a2]
-""".lstrip(),
+      path: {scenario_path}
+{binding}""".lstrip()
+
+
+@pytest.mark.parametrize(
+    "bound, expected",
+    [(["a1", "a2"], 15), (["a2"], 5), (["a2", "a1", "a2"], 20)],
+)
+def test_plan_portfolio_expands_per_asset_cardinality(tmp_path, per_asset_scenario_path, bound, expected) -> None:
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(
+        _TWO_ASSET_PORTFOLIO_TEMPLATE.format(
+            a1=10,
+            a2=5,
+            scenario_path=per_asset_scenario_path,
+            binding=f"      binding:\n        applies_to_assets: [{', '.join(bound)}]\n",
+        ),
         encoding="utf-8",
     )
 
     report = plan_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is True
     assert report.plan is not None
-    assert report.plan.scenarios[0].cardinality == 15
-    assert report.plan.scenarios[0].applies_to_assets == ["a1", "a2"]
-
+    assert report.plan.scenarios[0].cardinality == expected
+    assert report.plan.scenarios[0].applies_to_assets == bound
 
-def test_plan_portfolio_defaults_binding_to_all_assets(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Per-asset scenario"
-scenario:
-  frequency:
-    basis: per_asset_unit_per_year
-    model: poisson
-    parameters: {lambda: 0.5}
-  severity:
-    model: lognormal
-    parameters: {mu: 10, sigma: 1}
-""".lstrip(),
-        encoding="utf-8",
-    )
 
+def test_plan_portfolio_defaults_binding_to_all_assets(tmp_path, per_asset_scenario_path) -> None:
     portfolio_path = tmp_path / "portfolio.yaml"
     portfolio_path.write_text(
-        f"""
-crml_portfolio: "1.0"
-meta:
-  name: "Org portfolio"
-portfolio:
-  assets:
-    - name: a1
-      cardinality: 2
-    - name: a2
-      cardinality: 3
-  semantics:
-    method: sum
-  scenarios:
-    - id: s1
-      path: {scenario_path.name}
-""".lstrip(),
+        _TWO_ASSET_PORTFOLIO_TEMPLATE.format(a1=2, a2=3, scenario_path=per_asset_scenario_path, binding=""),
         encoding="utf-8",
     )
 
@@ -176,27 +136,7 @@ portfolio:
     assert ctrl.combined_coverage_value == pytest.approx(1.0)
 
 
-def test_plan_portfolio_errors_when_control_not_in_inventory(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Threat scenario"
-scenario:
-  controls:
-    - "iso27001:2022:A.5.1"
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 0.5}
-  severity:
-    model: lognormal
-    parameters: {mu: 10, sigma: 1}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
+def test_plan_portfolio_errors_when_control_not_in_inventory(tmp_path, threat_scenario_path) -> None:
     portfolio_path = tmp_path / "portfolio.yaml"
     portfolio_path.write_text(
         f"""
@@ -209,14 +149,14 @@ portfolio:
   controls: []
   scenarios:
     - id: s1
-      path: {scenario_path.name}
+      path: {threat_scenario_path}
 """.lstrip(),
         encoding="utf-8",
     )
 
     report = plan_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is False
-    assert any("no inventory/assessment data" in e.message for e in report.errors)
+    assert any(e.code == "plan.control_without_inventory" for e in report.errors)
 
 
 def test_plan_portfolio_resolves_control_copula_to_matrix(tmp_path) -> None:
@@ -295,3 +235,27 @@ portfolio:
     by_id = {c.id: c for c in ctrls}
     assert by_id["cap:edr"].combined_reliability == pytest.approx(0.8)
     assert by_id["cap:mfa"].combined_reliability == pytest.approx(0.9)
+
+
+def test_toeplitz_corr_matches_power_decay() -> None:
+    from crml_engine.pipeline.portfolio_planner import _toeplitz_corr
+
+    corr = _toeplitz_corr(dim=4, rho=0.5)
+    assert corr == [[0.5 ** abs(i - j) for j in range(4)] for i in range(4)]
+    assert _toeplitz_corr(dim=0, rho=0.5) == []
+
+
+@pytest.mark.parametrize(
+    ("matrix", "expected"),
+    [
+        ([[1.0, 0.2], [0.2, 1.0]], None),
+        ([[1.0, 0.2], [0.3, 1.0]], "matrix must be symmetric"),
+        ([[1.0, 2.0], [2.0, 1.0]], "matrix entries must be in [-1, 1]"),
+        ([[0.9, 0.0], [0.0, 1.0]], "matrix diagonal entries must be 1.0"),
+        ([[1.0, None], [None, 1.0]], "matrix[0][1] must be a number"),
+    ],
+)
+def test_validate_corr_matrix_messages(matrix, expected) -> None:
+    from crml_engine.pipeline.portfolio_planner import _validate_corr_matrix
+
+    assert _validate_corr_matrix(matrix, dim=2) == expected
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import pytest
 
 from crml_lang import validate_portfolio
 
@@ -45,28 +46,10 @@ portfolio:
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is False
-    assert any("not relevant" in e.message for e in report.errors)
+    assert any(e.code == "portfolio.scenario_not_relevant" for e in report.errors)
 
 
-def test_validate_portfolio_relevance_control_namespace_must_be_declared(tmp_path) -> None:
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Scenario"
-scenario:
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 1.0}
-  severity:
-    model: lognormal
-    parameters: {median: 1000, sigma: 1.0}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
+def test_validate_portfolio_relevance_control_namespace_must_be_declared(tmp_path, basic_scenario_path) -> None:
     portfolio_path = tmp_path / "portfolio.yaml"
     portfolio_path.write_text(
         f"""
@@ -84,14 +67,14 @@ portfolio:
       validate_relevance: true
   scenarios:
     - id: s1
-      path: {scenario_path.name}
+      path: {basic_scenario_path}
 """.lstrip(),
         encoding="utf-8",
     )
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is False
-    assert any("uses namespace" in e.message for e in report.errors)
+    assert any(e.code == "portfolio.control_namespace_undeclared" for e in report.errors)
 
 
 def test_validate_portfolio_relevance_infers_frameworks_from_control_catalog(tmp_path) -> None:
@@ -151,10 +134,12 @@ portfolio:
 
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is False
-    assert any("regulatory frameworks" in e.message for e in report.errors)
+    assert any(
+        e.code == "portfolio.scenario_not_relevant" and "regulatory frameworks" in e.message for e in report.errors
+    )
 
 
-def test_validate_portfolio_requires_catalog_when_assessments_used(tmp_path) -> None:
+def test_validate_portfolio_requires_catalog_when_assessments_used(tmp_path, basic_scenario_path) -> None:
     assessment_path = tmp_path / "control-assessment.yaml"
     assessment_path.write_text(
         """
@@ -171,24 +156,6 @@ assessment:
         encoding="utf-8",
     )
 
-    scenario_path = tmp_path / "scenario.yaml"
-    scenario_path.write_text(
-        """
-crml_scenario: "1.0"
-meta:
-  name: "Scenario"
-scenario:
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 1.0}
-  severity:
-    model: lognormal
-    parameters: {median: 1000, sigma: 1.0}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
     portfolio_path = tmp_path / "portfolio.yaml"
     portfolio_path.write_text(
         f"""
@@ -202,7 +169,7 @@ portfolio:
     method: sum
   scenarios:
     - id: s1
-      path: {scenario_path.name}
+      path: {basic_scenario_path}
 """.lstrip(),
         encoding="utf-8",
     )
@@ -210,3 +177,18 @@ portfolio:
     report = validate_portfolio(str(portfolio_path), source_kind="path")
     assert report.ok is False
     assert any("control_catalogs" in e.path for e in report.errors)
+
+
+@pytest.mark.parametrize(
+    "cid, expected",
+    [
+        ("iso27001:2022:A.5.1", ("iso27001", "iso27001")),
+        ("CIS v8:1.1", ("CIS v8", "cisv8")),
+        ("no-namespace", ("", "")),
+        (":key", ("", "")),
+    ],
+)
+def test_control_id_namespace(cid, expected) -> None:
+    from crml_lang.validators.portfolio import _control_id_namespace
+
+    assert _control_id_namespace(cid) == expected
@@ -45,7 +45,7 @@ def test_validate_portfolio_weights_must_sum_to_one():
 
     report = validate_portfolio(portfolio_yaml, source_kind="yaml")
     assert report.ok is False
-    assert any("weights must sum to 1.0" in e.message for e in report.errors)
+    assert any(e.code == "portfolio.weights_sum" for e in report.errors)
 
 
 def test_validate_portfolio_missing_weight_is_error_for_mixture():
@@ -65,7 +65,7 @@ def test_validate_portfolio_missing_weight_is_error_for_mixture():
 
     report = validate_portfolio(portfolio_yaml, source_kind="yaml")
     assert report.ok is False
-    assert any("must define 'weight'" in e.message for e in report.errors)
+    assert any(e.code == "portfolio.weight_missing" for e in report.errors)
 
 
 def test_validate_portfolio_relationship_references_must_exist():
@@ -86,30 +86,11 @@ def test_validate_portfolio_relationship_references_must_exist():
 
     report = validate_portfolio(portfolio_yaml, source_kind="yaml")
     assert report.ok is False
-    assert any("Unknown scenario id" in e.message for e in report.errors)
+    assert any(e.code == "portfolio.relationship_unknown_scenario" for e in report.errors)
 
 
-def test_validate_portfolio_warns_binding_for_per_organization_basis(tmp_path):
-    scenario = tmp_path / "phishing.yaml"
-    scenario.write_text(
-        """
-crml_scenario: "1.0"
-meta: {name: "phishing"}
-scenario:
-  frequency:
-    basis: per_organization_per_year
-    model: poisson
-    parameters: {lambda: 0.1}
-  severity:
-    model: lognormal
-    parameters: {median: 1000, currency: USD, sigma: 1.0}
-""".lstrip(),
-        encoding="utf-8",
-    )
-
-    portfolio = tmp_path / "portfolio.yaml"
-    portfolio.write_text(
-        f"""
+def test_validate_portfolio_warns_binding_for_per_organization_basis(basic_scenario_path):
+    portfolio_yaml = f"""
 crml_portfolio: "1.0"
 meta: {{name: "p"}}
 portfolio:
@@ -123,39 +104,18 @@ portfolio:
       validate_scenarios: true
   scenarios:
     - id: phishing
-      path: {scenario.name}
+      path: {basic_scenario_path}
       binding:
         applies_to_assets: [employees]
-""".lstrip(),
-        encoding="utf-8",
-    )
+"""
 
-    report = validate_portfolio(str(portfolio), source_kind="path")
+    report = validate_portfolio(portfolio_yaml, source_kind="yaml")
     assert report.ok is True
-    assert any("per_organization_per_year" in w.message and "does not affect frequency" in w.message for w in report.warnings)
-
+    assert any(w.code == "portfolio.binding_ignored_for_organization_basis" for w in report.warnings)
 
-def test_validate_portfolio_warns_zero_exposure_for_per_asset_basis(tmp_path):
-    scenario = tmp_path / "endpoint-risk.yaml"
-    scenario.write_text(
-        """
-crml_scenario: "1.0"
-meta: {name: "endpoint-risk"}
-scenario:
-  frequency:
-    basis: per_asset_unit_per_year
-    model: poisson
-    parameters: {lambda: 0.01}
-  severity:
-    model: lognormal
-    parameters: {median: 500, currency: USD, sigma: 1.2}
-""".lstrip(),
-        encoding="utf-8",
-    )
 
-    portfolio = tmp_path / "portfolio.yaml"
-    portfolio.write_text(
-        f"""
+def test_validate_portfolio_warns_zero_exposure_for_per_asset_basis(per_asset_scenario_path):
+    portfolio_yaml = f"""
 crml_portfolio: "1.0"
 meta: {{name: "p"}}
 portfolio:
@@ -169,13 +129,65 @@ portfolio:
       validate_scenarios: true
   scenarios:
     - id: endpoint-risk
-      path: {scenario.name}
+      path: {per_asset_scenario_path}
       binding:
         applies_to_assets: []
-""".lstrip(),
+"""
+
+    report = validate_portfolio(portfolio_yaml, source_kind="yaml")
+    assert report.ok is True
+    assert any(w.code == "portfolio.binding_zero_exposure" for w in report.warnings)
+
+
+_MANY_SCENARIO_YAML = """
+crml_scenario: "1.0"
+meta: {{name: "Scenario {i}"}}
+scenario:
+  frequency:
+    basis: per_organization_per_year
+    model: poisson
+    parameters: {{lambda: {rate}}}
+  severity:
+    model: lognormal
+    parameters: {{median: 1000, sigma: 1.0}}
+"""
+
+
+def test_validate_portfolio_cross_checks_many_scenarios(tmp_path):
+    # Invalid scenarios are reported at their own index, in portfolio order.
+    entries = []
+    for i in range(6):
+        rate = "not-a-number" if i in (1, 4) else "0.5"
+        (tmp_path / f"s{i}.yaml").write_text(_MANY_SCENARIO_YAML.format(i=i, rate=rate), encoding="utf-8")
+        entries.append(f"    - id: s{i}\n      path: s{i}.yaml")
+
+    portfolio_path = tmp_path / "portfolio.yaml"
+    portfolio_path.write_text(
+        'crml_portfolio: "1.0"\nmeta: {name: "Many"}\nportfolio:\n  semantics:\n    method: sum\n'
+        "    constraints:\n      validate_scenarios: true\n  scenarios:\n" + "\n".join(entries) + "\n",
         encoding="utf-8",
     )
 
-    report = validate_portfolio(str(portfolio), source_kind="path")
-    assert report.ok is True
-    assert any("per_asset_unit_per_year" in w.message and "E=0" in w.message for w in report.warnings)
+    report = validate_portfolio(str(portfolio_path), source_kind="path")
+    assert report.ok is False
+    assert [e.path for e in report.errors] == [
+        "portfolio -> scenarios -> 1 -> path",
+        "portfolio -> scenarios -> 4 -> path",
+    ]
+
+
+@pytest.mark.parametrize(
+    "weights, expected_codes",
+    [
+        ([0.5, 0.5], []),
+        ([0.7, None], ["portfolio.weight_missing", "portfolio.weights_sum"]),
+        ([None, 1.0], ["portfolio.weight_missing"]),
+        (["heavy", 0.3], []),
+    ],
+)
+def test_weight_semantic_checks_single_pass(weights, expected_codes):
+    from crml_lang.validators.portfolio import _weight_semantic_checks
+
+    scenarios = [{"id": f"s{i}", "path": f"s{i}.yaml", "weight": w} for i, w in enumerate(weights)]
+
+    assert [m.code for m in _weight_semantic_checks("mixture", scenarios)] == expected_codes
@@ -15,4 +15,91 @@ def test_validate_invalid_file(tmp_path):
 def test_validate_missing_file():
     report = validate("non_existent_file.yaml", source_kind="path")
     assert report.ok is False
-    assert any("File not found" in e.message for e in report.errors)
+    assert any(e.code == "io.file_not_found" for e in report.errors)
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ('crml_portfolio: "1.0"\nmeta: {name: p}\n', "portfolio"),
+        ('# comment\ncrml_scenario: "1.0"\n', "scenario"),
+        ('meta:\n  crml_scenario: "1.0"\ncrml_control_catalog: "1.0"\n', "control_catalog"),
+        ('{crml_scenario: "1.0"}\n', None),
+        ('"crml_scenario": "1.0"\n', None),
+    ],
+)
+def test_detect_kind_from_yaml_text(text, expected):
+    from crml_lang.validators.document import _detect_kind_from_yaml_text
+
+    assert _detect_kind_from_yaml_text(text) == expected
+
+
+def test_validate_document_dispatches_files_without_parsing_twice(valid_crml_file, monkeypatch):
+    from crml_lang import validate_document
+    from crml_lang.validators import document
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("dispatcher should not parse the file")
+
+    monkeypatch.setattr(document, "_load_input", _fail)
+    assert validate_document(valid_crml_file, source_kind="path").ok is True
+
+
+def test_schema_validator_is_built_once(valid_crml_file):
+    from crml_lang.validators.common import SCENARIO_SCHEMA_PATH, _schema_validator
+
+    first = _schema_validator(SCENARIO_SCHEMA_PATH)
+    assert validate(valid_crml_file).ok is True
+    assert _schema_validator(SCENARIO_SCHEMA_PATH) is first
+
+
+def test_schema_validator_falls_back_to_jsonschema_when_precheck_rejects():
+    from crml_lang.validators.common import _SchemaValidator
+
+    def _reject(data):
+        raise ValueError("rejected by pre-check")
+
+    validator = _SchemaValidator({"type": "object", "required": ["a"]})
+    validator._fast_check = _reject
+
+    assert [e.message for e in validator.iter_errors({})] == ["'a' is a required property"]
+    assert list(validator.iter_errors({"a": 1})) == []
+
+
+def _example_documents(repo_root):
+    from crml_lang.validators import common
+    from crml_lang.validators.document import _detect_kind
+    from crml_lang.yamlio import load_yaml_mapping_from_path
+
+    schema_paths = {
+        "scenario": common.SCENARIO_SCHEMA_PATH,
+        "portfolio": common.PORTFOLIO_SCHEMA_PATH,
+        "portfolio_bundle": common.PORTFOLIO_BUNDLE_SCHEMA_PATH,
+        "assessment": common.ASSESSMENT_SCHEMA_PATH,
+        "control_catalog": common.CONTROL_CATALOG_SCHEMA_PATH,
+        "attack_catalog": common.ATTACK_CATALOG_SCHEMA_PATH,
+        "control_relationships": common.CONTROL_RELATIONSHIPS_SCHEMA_PATH,
+        "attack_control_relationships": common.ATTACK_CONTROL_RELATIONSHIPS_SCHEMA_PATH,
+    }
+    for path in sorted((repo_root / "examples").rglob("*.yaml")):
+        data = load_yaml_mapping_from_path(str(path))
+        kind = _detect_kind(data)
+        if kind is not None:
+            yield path, schema_paths[kind], data
+
+
+def test_fastjsonschema_precheck_accepts_every_example(repo_root):
+    pytest.importorskip("fastjsonschema")
+    import copy
+
+    from crml_lang.validators.common import _schema_validator
+
+    checked = 0
+    for path, schema_path, data in _example_documents(repo_root):
+        validator = _schema_validator(schema_path)
+        assert validator._fast_check is not None, schema_path
+        original = copy.deepcopy(data)
+        assert validator._fast_accepts(data), path
+        assert data == original, f"pre-check modified {path}"
+        checked += 1
+    assert checked > 0
@@ -1,15 +1,24 @@
+import hashlib
+
 import pytest
 
 
 openpyxl = pytest.importorskip("openpyxl")
 
+# Keep the workbook round trips on one worker under `pytest -n auto --dist=loadgroup`.
+pytestmark = pytest.mark.xdist_group("xlsx")
+
 
 from crml_lang import CRControlCatalog, CRAttackCatalog, CRControlRelationships, CRAttackControlRelationships
 from crml_lang.mapping import export_xlsx, import_xlsx
 
 
-def test_xlsx_roundtrip_control_catalog(tmp_path) -> None:
-    yaml_text = """
+def _canonical_digest(doc) -> bytes:
+    """Digest of the document's JSON dump, serialized by pydantic-core."""
+    return hashlib.blake2b(doc.model_dump_json(exclude_none=True).encode("utf-8"), digest_size=16).digest()
+
+
+_CONTROL_CATALOG_YAML = """
 crml_control_catalog: "1.0"
 meta:
   name: "demo-catalog"
@@ -23,19 +32,7 @@ catalog:
       defense_in_depth_layers: ["prevent"]
 """
 
-    doc = CRControlCatalog.load_from_yaml_str(yaml_text)
-    out_xlsx = tmp_path / "out.xlsx"
-
-    export_xlsx(str(out_xlsx), control_catalogs=[doc])
-    imported = import_xlsx(str(out_xlsx))
-
-    assert len(imported.control_catalogs) == 1
-    round_tripped = imported.control_catalogs[0]
-    assert round_tripped.model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
-
-
-def test_xlsx_roundtrip_attack_catalog(tmp_path) -> None:
-    yaml_text = """
+_ATTACK_CATALOG_YAML = """
 crml_attack_catalog: "1.0"
 meta:
   name: "demo-attacks"
@@ -48,19 +45,7 @@ catalog:
       kill_chain_phases: ["mitre-attack:execution"]
 """
 
-    doc = CRAttackCatalog.load_from_yaml_str(yaml_text)
-    out_xlsx = tmp_path / "out.xlsx"
-
-    export_xlsx(str(out_xlsx), attack_catalogs=[doc])
-    imported = import_xlsx(str(out_xlsx))
-
-    assert len(imported.attack_catalogs) == 1
-    round_tripped = imported.attack_catalogs[0]
-    assert round_tripped.model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
-
-
-def test_xlsx_roundtrip_control_relationships(tmp_path) -> None:
-    yaml_text = """
+_CONTROL_RELATIONSHIPS_YAML = """
 crml_control_relationships: "1.0"
 meta:
   name: "demo-relationships"
@@ -85,19 +70,7 @@ relationships:
               url: "https://example.com"
 """
 
-    doc = CRControlRelationships.load_from_yaml_str(yaml_text)
-    out_xlsx = tmp_path / "out.xlsx"
-
-    export_xlsx(str(out_xlsx), control_relationships=[doc])
-    imported = import_xlsx(str(out_xlsx))
-
-    assert len(imported.control_relationships) == 1
-    round_tripped = imported.control_relationships[0]
-    assert round_tripped.model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
-
-
-def test_xlsx_roundtrip_attack_control_relationships(tmp_path) -> None:
-    yaml_text = """
+_ATTACK_CONTROL_RELATIONSHIPS_YAML = """
 crml_attack_control_relationships: "1.0"
 meta:
   name: "demo-attck-mappings"
@@ -117,15 +90,31 @@ relationships:
               label: "IR playbook"
 """
 
-    doc = CRAttackControlRelationships.load_from_yaml_str(yaml_text)
-    out_xlsx = tmp_path / "out.xlsx"
+_ROUNDTRIP_CASES = [
+    ("control_catalogs", CRControlCatalog, _CONTROL_CATALOG_YAML),
+    ("attack_catalogs", CRAttackCatalog, _ATTACK_CATALOG_YAML),
+    ("control_relationships", CRControlRelationships, _CONTROL_RELATIONSHIPS_YAML),
+    ("attack_control_relationships", CRAttackControlRelationships, _ATTACK_CONTROL_RELATIONSHIPS_YAML),
+]
 
-    export_xlsx(str(out_xlsx), attack_control_relationships=[doc])
-    imported = import_xlsx(str(out_xlsx))
 
-    assert len(imported.attack_control_relationships) == 1
-    round_tripped = imported.attack_control_relationships[0]
-    assert round_tripped.model_dump(exclude_none=True) == doc.model_dump(exclude_none=True)
+@pytest.fixture(scope="module")
+def roundtrip_workbook(tmp_path_factory):
+    """Export one document of every kind into a single workbook and import it back once."""
+    docs = {kind: cls.load_from_yaml_str(yaml_text) for kind, cls, yaml_text in _ROUNDTRIP_CASES}
+    out_xlsx = tmp_path_factory.mktemp("xlsx_roundtrip") / "out.xlsx"
+
+    export_xlsx(str(out_xlsx), **{kind: [doc] for kind, doc in docs.items()})
+    return docs, import_xlsx(str(out_xlsx))
+
+
+@pytest.mark.parametrize("kind", [kind for kind, _, _ in _ROUNDTRIP_CASES])
+def test_xlsx_roundtrip(roundtrip_workbook, kind) -> None:
+    docs, imported = roundtrip_workbook
+
+    round_tripped = getattr(imported, kind)
+    assert len(round_tripped) == 1
+    assert _canonical_digest(round_tripped[0]) == _canonical_digest(docs[kind])
 
 
 def test_xlsx_export_accepts_paths(tmp_path) -> None:
@@ -196,3 +185,113 @@ relationships:
     assert len(imported.attack_catalogs) == 1
     assert len(imported.control_relationships) == 1
     assert len(imported.attack_control_relationships) == 1
+
+
+def test_xlsx_export_applies_sheet_formatting(tmp_path) -> None:
+    yaml_text = """
+crml_control_relationships: "1.0"
+meta:
+  name: "demo-relationships"
+relationships:
+  relationships:
+    - source: "cisv8:4.2"
+      targets:
+        - target: "cap:secure-config"
+          relationship_type: "mitigates"
+          overlap:
+            weight: 0.8
+            dimensions:
+              coverage: 0.9
+"""
+
+    doc = CRControlRelationships.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_relationships=[doc])
+
+    ws = openpyxl.load_workbook(str(out_xlsx))["control_relationships"]
+    header = [c.value for c in ws[1]]
+    weight_col = header.index("overlap_weight") + 1
+    dims_col = header.index("overlap_dimensions_json") + 1
+
+    assert ws.row_dimensions[1].hidden is True
+    assert ws.freeze_panes == "A3"
+    assert ws.auto_filter.ref == "A2:O3"
+    assert ws.cell(row=2, column=1).font.b is True
+    assert ws.cell(row=2, column=weight_col).comment is not None
+    assert ws.cell(row=3, column=weight_col).number_format == "0.00"
+    assert ws.cell(row=3, column=dims_col).alignment.wrap_text is True
+    assert [str(dv.sqref) for dv in ws.data_validations.dataValidation] == ["H3"]
+
+
+def test_xlsx_import_accepts_loaded_workbook(tmp_path) -> None:
+    yaml_text = """
+crml_attack_catalog: "1.0"
+meta:
+  name: "demo-attacks"
+catalog:
+  framework: "MITRE ATT&CK Enterprise"
+  attacks:
+    - id: "attck:T1059.003"
+"""
+
+    doc = CRAttackCatalog.load_from_yaml_str(yaml_text)
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), attack_catalogs=[doc])
+
+    imported = import_xlsx(openpyxl.load_workbook(str(out_xlsx)))
+
+    assert [_canonical_digest(d) for d in imported.attack_catalogs] == [_canonical_digest(doc)]
+    assert imported.control_catalogs == []
+
+
+def test_xlsx_import_keeps_formula_text(tmp_path) -> None:
+    yaml_text = """
+crml_attack_catalog: "1.0"
+meta:
+  name: "demo-attacks"
+catalog:
+  framework: "MITRE ATT&CK Enterprise"
+  attacks:
+    - id: "attck:T1059.003"
+"""
+
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), attack_catalogs=[CRAttackCatalog.load_from_yaml_str(yaml_text)])
+
+    wb = openpyxl.load_workbook(str(out_xlsx))
+    ws = wb["attack_catalogs"]
+    title_col = [c.value for c in ws[1]].index("title") + 1
+    ws.cell(row=3, column=title_col, value='=UPPER("shell")')
+    wb.save(str(out_xlsx))
+
+    from_path = import_xlsx(str(out_xlsx)).attack_catalogs[0]
+    from_workbook = import_xlsx(openpyxl.load_workbook(str(out_xlsx))).attack_catalogs[0]
+
+    assert from_path.catalog.attacks[0].title == '=UPPER("shell")'
+    assert _canonical_digest(from_path) == _canonical_digest(from_workbook)
+
+
+def test_xlsx_reimport_skips_validation_of_unchanged_documents(roundtrip_workbook, tmp_path, monkeypatch) -> None:
+    docs, _ = roundtrip_workbook
+    out_xlsx = tmp_path / "out.xlsx"
+    export_xlsx(str(out_xlsx), control_catalogs=[docs["control_catalogs"]])
+    first = import_xlsx(str(out_xlsx)).control_catalogs[0]
+
+    def _fail(*args, **kwargs):
+        raise AssertionError("unchanged document validated again")
+
+    monkeypatch.setattr(CRControlCatalog, "model_validate", _fail)
+    second = import_xlsx(str(out_xlsx)).control_catalogs[0]
+
+    assert second is not first
+    assert _canonical_digest(second) == _canonical_digest(first)
+
+
+def test_xlsx_row_view_reads_missing_and_short_columns_as_none() -> None:
+    from crml_lang.mapping.xlsx import _RowView
+
+    view = _RowView(["doc_name", "source_id", "target_id"])
+
+    assert view.bind(("doc", "s", "t")).get("target_id") == "t"
+    assert view.bind(("doc",)).get("target_id") is None
+    assert view.get("unknown") is None
@@ -1,8 +1,12 @@
-from crml_lang import CRScenario
+import io
 
+import pytest
 
-def test_dump_to_yaml_str_preserves_alias_lambda(valid_crml_content):
-    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+from crml_lang import CRControlCatalog, CRScenario
+
+
+def test_dump_to_yaml_str_preserves_alias_lambda(valid_crml_scenario):
+    scenario = valid_crml_scenario
     yaml_text = scenario.dump_to_yaml_str(sort_keys=False)
 
     # FrequencyParameters uses `lambda_` internally but must serialize as `lambda`
@@ -10,8 +14,8 @@ def test_dump_to_yaml_str_preserves_alias_lambda(valid_crml_content):
     assert "lambda_:" not in yaml_text
 
 
-def test_dump_to_yaml_file_round_trip(tmp_path, valid_crml_content):
-    scenario = CRScenario.load_from_yaml_str(valid_crml_content)
+def test_dump_to_yaml_file_round_trip(tmp_path, valid_crml_scenario):
+    scenario = valid_crml_scenario
 
     out_path = tmp_path / "out.yaml"
     scenario.dump_to_yaml(str(out_path), sort_keys=False)
@@ -19,3 +23,103 @@ def test_dump_to_yaml_file_round_trip(tmp_path, valid_crml_content):
     round_tripped = CRScenario.load_from_yaml(str(out_path))
     assert round_tripped.crml_scenario == scenario.crml_scenario
     assert round_tripped.meta.name == scenario.meta.name
+
+
+def test_dump_to_yaml_stream_round_trip(valid_crml_scenario):
+    scenario = valid_crml_scenario
+
+    class _ChunkedOnly(io.StringIO):
+        def read(self, size=-1):
+            assert size is not None and size >= 0, "stream read in full"
+            return super().read(size)
+
+    buf = _ChunkedOnly()
+    scenario.dump_to_yaml_stream(buf, sort_keys=False)
+    buf.seek(0)
+
+    round_tripped = CRScenario.load_from_yaml_stream(buf)
+    assert round_tripped.crml_scenario == scenario.crml_scenario
+    assert round_tripped.meta.name == scenario.meta.name
+
+
+def test_stream_round_trip_for_other_documents():
+    catalog = CRControlCatalog.load_from_yaml_str(
+        """
+crml_control_catalog: "1.0"
+meta:
+  name: "demo-catalog"
+catalog:
+  framework: "CIS v8"
+  controls:
+    - id: "cisv8:4.2"
+      title: "Secure configuration"
+"""
+    )
+
+    buf = io.StringIO()
+    catalog.dump_to_yaml_stream(buf)
+    buf.seek(0)
+
+    assert CRControlCatalog.load_from_yaml_stream(buf) == catalog
+
+
+def test_yaml_backends_produce_identical_round_trips(monkeypatch, valid_crml_scenario):
+    yaml = pytest.importorskip("yaml")
+    if not yaml.__with_libyaml__:
+        pytest.skip("PyYAML built without libyaml")
+
+    from crml_lang import yamlio
+
+    scenario = valid_crml_scenario
+
+    monkeypatch.setenv(yamlio.YAML_BACKEND_ENV, "python")
+    py_text = scenario.dump_to_yaml_str()
+    monkeypatch.setenv(yamlio.YAML_BACKEND_ENV, "libyaml")
+    c_text = scenario.dump_to_yaml_str()
+
+    assert c_text == py_text
+    py_data = yaml.load(py_text, Loader=yaml.SafeLoader)
+    c_data = yaml.load(c_text, Loader=yaml.CSafeLoader)
+    assert c_data == py_data
+    assert c_data == scenario.model_dump(by_alias=True, exclude_none=True)
+
+
+def test_dump_uses_libyaml_emitter_by_default(monkeypatch, valid_crml_scenario):
+    yaml = pytest.importorskip("yaml")
+    if not yaml.__with_libyaml__:
+        pytest.skip("PyYAML built without libyaml")
+
+    from crml_lang import yamlio
+
+    monkeypatch.delenv(yamlio.YAML_BACKEND_ENV, raising=False)
+    seen = []
+    real_dump = yaml.dump
+
+    def _recording_dump(*args, **kwargs):
+        seen.append(kwargs.get("Dumper"))
+        return real_dump(*args, **kwargs)
+
+    monkeypatch.setattr(yaml, "dump", _recording_dump)
+    valid_crml_scenario.dump_to_yaml_str()
+
+    assert seen == [yaml.CSafeDumper]
+
+
+def test_missing_libyaml_falls_back_to_python_loader_with_one_warning(monkeypatch, caplog):
+    import types
+
+    import yaml
+
+    from crml_lang import yamlio
+
+    no_libyaml = types.SimpleNamespace(
+        __with_libyaml__=False, SafeLoader=yaml.SafeLoader, SafeDumper=yaml.SafeDumper
+    )
+    monkeypatch.delenv(yamlio.YAML_BACKEND_ENV, raising=False)
+    monkeypatch.setattr(yamlio, "_libyaml_missing_logged", False)
+
+    with caplog.at_level("WARNING", logger=yamlio.__name__):
+        assert yamlio._safe_loader(no_libyaml) is yaml.SafeLoader
+        assert yamlio._safe_dumper(no_libyaml) is yaml.SafeDumper
+
+    assert len([r for r in caplog.records if "without libyaml" in r.getMessage()]) == 1
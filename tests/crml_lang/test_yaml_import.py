@@ -21,8 +21,121 @@ def test_load_from_yaml_str(valid_crml_content: str) -> None:
 def test_module_level_helpers_match_methods(valid_crml_file: str, valid_crml_content: str) -> None:
     m1 = load_from_yaml(valid_crml_file)
     m2 = CRScenario.load_from_yaml(valid_crml_file)
-    assert m1.model_dump() == m2.model_dump()
+    assert m1.model_dump_json() == m2.model_dump_json()
 
     s1 = load_from_yaml_str(valid_crml_content)
     s2 = CRScenario.load_from_yaml_str(valid_crml_content)
+    assert s1.model_dump_json() == s2.model_dump_json()
+
+
+def test_load_from_yaml_str_reuses_validated_document(valid_crml_content: str) -> None:
+    CRScenario.cache_clear()
+
+    s1 = CRScenario.load_from_yaml_str(valid_crml_content)
+    s2 = CRScenario.load_from_yaml_str(valid_crml_content)
+
+    assert s1 is not s2
     assert s1.model_dump() == s2.model_dump()
+
+    # Hits are independent copies: mutating one load does not leak into the next.
+    s2.meta.name = "mutated"
+    assert CRScenario.load_from_yaml_str(valid_crml_content).meta.name == "test-model"
+
+
+def test_load_yaml_mapping_from_path_parses_open_stream(monkeypatch, valid_crml_file: str) -> None:
+    from crml_lang import yamlio
+
+    seen = []
+    original = yamlio._safe_load
+
+    def _spy(source):
+        seen.append(source)
+        return original(source)
+
+    monkeypatch.delenv(yamlio.YAML_JSON_CACHE_ENV, raising=False)
+    monkeypatch.setattr(yamlio, "_safe_load", _spy)
+
+    data = yamlio.load_yaml_mapping_from_path(valid_crml_file)
+
+    assert data["meta"]["name"] == "test-model"
+    assert len(seen) == 1 and hasattr(seen[0], "read")
+
+
+def test_yaml_json_cache_reuses_parse_of_identical_file(tmp_path, monkeypatch, valid_crml_file: str) -> None:
+    from crml_lang import yamlio
+
+    cache_dir = tmp_path / "json-cache"
+    cache_dir.mkdir()
+    monkeypatch.setenv(yamlio.YAML_JSON_CACHE_ENV, str(cache_dir))
+
+    first = yamlio.load_yaml_mapping_from_path(valid_crml_file)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def _fail(text):
+        raise AssertionError("YAML parsed again")
+
+    monkeypatch.setattr(yamlio, "_safe_load", _fail)
+    assert yamlio.load_yaml_mapping_from_path(valid_crml_file) == first
+
+
+def test_file_loader_uses_yaml_json_cache(tmp_path, monkeypatch, valid_crml_file: str) -> None:
+    from crml_lang import yamlio
+
+    cache_dir = tmp_path / "json-cache"
+    cache_dir.mkdir()
+    monkeypatch.setenv(yamlio.YAML_JSON_CACHE_ENV, str(cache_dir))
+
+    CRScenario.cache_clear()
+    first = CRScenario.load_from_yaml(valid_crml_file)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def _fail(text):
+        raise AssertionError("YAML parsed again")
+
+    monkeypatch.setattr(yamlio, "_safe_load", _fail)
+    CRScenario.cache_clear()
+    assert CRScenario.load_from_yaml(valid_crml_file).model_dump() == first.model_dump()
+
+
+def test_file_loader_shares_parse_across_identical_files(tmp_path, monkeypatch, valid_crml_content: str) -> None:
+    from crml_lang import yamlio
+
+    first_path = tmp_path / "a.yaml"
+    second_path = tmp_path / "b.yaml"
+    first_path.write_text(valid_crml_content, encoding="utf-8")
+    second_path.write_text(valid_crml_content, encoding="utf-8")
+
+    CRScenario.cache_clear()
+    first = CRScenario.load_from_yaml(str(first_path))
+
+    def _fail(text):
+        raise AssertionError("YAML parsed again")
+
+    monkeypatch.setattr(yamlio, "_safe_load", _fail)
+    assert CRScenario.load_from_yaml(str(second_path)).model_dump() == first.model_dump()
+
+
+def test_yaml_json_cache_skips_documents_json_cannot_represent(tmp_path, monkeypatch) -> None:
+    from crml_lang import yamlio
+
+    cache_dir = tmp_path / "json-cache"
+    cache_dir.mkdir()
+    monkeypatch.setenv(yamlio.YAML_JSON_CACHE_ENV, str(cache_dir))
+
+    doc = tmp_path / "doc.yaml"
+    doc.write_text("assessed_at: 2025-12-17T10:15:30Z\n1: one\n", encoding="utf-8")
+
+    data = yamlio.load_yaml_mapping_from_path(str(doc))
+    assert 1 in data
+    assert list(cache_dir.glob("*.json")) == []
+
+
+def test_enum_like_fields_share_one_string_object(valid_crml_content: str) -> None:
+    s1 = CRScenario.model_validate(load_from_yaml_str(valid_crml_content).model_dump())
+    s2 = CRScenario.model_validate(
+        load_from_yaml_str(valid_crml_content.replace("test-model", "other-model")).model_dump()
+    )
+
+    assert s1.scenario.frequency.basis is s2.scenario.frequency.basis
+    assert s1.scenario.frequency.model is s2.scenario.frequency.model
+    assert s1.scenario.severity.model is s2.scenario.severity.model
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import importlib
-import inspect
+from collections import deque
+from functools import lru_cache
 
 from pydantic import BaseModel
 
@@ -23,30 +24,52 @@ _MODULES_TO_CHECK = [
 ]
 
 
-def _iter_pydantic_models(module) -> list[type[BaseModel]]:
-    models: list[type[BaseModel]] = []
-    for obj in vars(module).values():
-        if not inspect.isclass(obj):
-            continue
-        if obj is BaseModel:
-            continue
-        if not issubclass(obj, BaseModel):
-            continue
-        if getattr(obj, "__module__", None) != module.__name__:
+@lru_cache(maxsize=None)
+def _models_by_module() -> dict[str, list[type[BaseModel]]]:
+    """Group every BaseModel subclass of the checked modules by defining module.
+
+    Walks pydantic's subclass tree once instead of scanning each module's
+    namespace.
+    """
+    for module_name in _MODULES_TO_CHECK:
+        importlib.import_module(module_name)
+
+    wanted = set(_MODULES_TO_CHECK)
+    by_module: dict[str, list[type[BaseModel]]] = {name: [] for name in _MODULES_TO_CHECK}
+    seen: set[type] = set()
+    queue = deque(BaseModel.__subclasses__())
+    while queue:
+        cls = queue.popleft()
+        if cls in seen:
             continue
-        models.append(obj)
-    return models
+        seen.add(cls)
+        queue.extend(cls.__subclasses__())
+        if cls.__module__ in wanted:
+            by_module[cls.__module__].append(cls)
+    return by_module
 
 
 def test_all_pydantic_fields_have_descriptions() -> None:
     missing: list[str] = []
 
-    for module_name in _MODULES_TO_CHECK:
-        module = importlib.import_module(module_name)
-        for model_cls in _iter_pydantic_models(module):
+    for module_name, models in _models_by_module().items():
+        for model_cls in models:
             for field_name, field_info in model_cls.model_fields.items():
                 desc = field_info.description
                 if desc is None or not str(desc).strip():
                     missing.append(f"{module_name}.{model_cls.__name__}.{field_name}")
 
     assert not missing, "Missing Pydantic field descriptions:\n" + "\n".join(missing)
+
+
+def test_all_pydantic_models_are_built_at_import() -> None:
+    # A model left incomplete (e.g. unresolved forward refs) rebuilds its core
+    # schema lazily on first use; keep every model compiled at import time.
+    incomplete: list[str] = []
+
+    for module_name, models in _models_by_module().items():
+        for model_cls in models:
+            if not getattr(model_cls, "__pydantic_complete__", True):
+                incomplete.append(f"{module_name}.{model_cls.__name__}")
+
+    assert not incomplete, "Pydantic models not built at import:\n" + "\n".join(incomplete)